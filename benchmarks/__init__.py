@@ -0,0 +1 @@
+"""Micro-benchmarks (not collected by pytest)."""
@@ -0,0 +1,59 @@
+"""Micro-benchmark: full-soup JSON-LD extraction vs the fast path.
+
+Usage:
+    uv run python -m benchmarks.bench_content_extraction [--repeat N]
+
+Runs over the saved CNN fixture pages in ``tests/fixtures/cnn``.
+"""
+import argparse
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from core.domain.repositories.cnn_scraping_repository import parse_article_content
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "cnn"
+
+
+def full_soup_extraction(html: str) -> str | None:
+    """Caminho anterior: monta a árvore completa para achar o JSON-LD."""
+    soup = BeautifulSoup(html, "html.parser")
+    for script in soup.find_all("script", type="application/ld+json"):
+        if script.string is None:
+            continue
+        data = json.loads(script.string)
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if isinstance(item, dict) and "articleBody" in item:
+                return str(item["articleBody"])
+    return None
+
+
+def _time_per_call(func: Callable[[str], object], html: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'fixture':<28}{'full soup':>14}{'fast path':>14}{'speedup':>10}")
+    for path in sorted(FIXTURES.glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        baseline = _time_per_call(full_soup_extraction, html, args.repeat)
+        fast = _time_per_call(parse_article_content, html, args.repeat)
+        print(
+            f"{path.name:<28}{baseline * 1000:>11.2f} ms{fast * 1000:>11.2f} ms"
+            f"{baseline / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,22 @@
 """CLI application using Typer."""
 
-import json
+import logging
 import os
+from datetime import UTC, datetime
 
 import typer
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.table import Table
 
+from core.application.services.metrics import REGISTRY
+from core.application.services.minhash import MinHasher
+from core.application.use_cases.deduplicate_articles_usecase import (
+    DeduplicateArticlesUseCase,
+)
+from core.application.use_cases.export_training_data_usecase import (
+    ExportTrainingDataUseCase,
+)
 from core.application.use_cases.extract_news_content_usecase import (
     ExtractNewsContentUseCase,
 )
@@ -18,17 +27,262 @@ from core.application.use_cases.prepare_training_data_usecase import (
     PrepareTrainingDataUseCase,
 )
 from core.application.use_cases.scrape_news_links_usecase import ScrapeNewsLinksUseCase
+from core.application.use_cases.search_articles_usecase import SearchArticlesUseCase
+from core.application.use_cases.streaming_pipeline_usecase import (
+    StreamingPipelineUseCase,
+)
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+)
+from core.domain.repositories.abstracts.abstract_batch_ai_repository import (
+    AbstractBatchAIRepository,
+)
+from core.domain.repositories.abstracts.abstract_embedding_encoder import (
+    AbstractEmbeddingEncoder,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractScrapingRepository,
+)
+from core.domain.repositories.abstracts.abstract_search_index import (
+    AbstractSearchIndex,
+)
+from core.domain.repositories.abstracts.abstract_training_data_writer import (
+    AbstractTrainingDataWriter,
+)
 from core.domain.repositories.cnn_scraping_repository import CNNScrapingRepository
 from core.domain.repositories.json_news_repository import JSONNewsRepository
 from core.domain.repositories.open_ai_repository import OpenAIRepository
+from core.infrastructure.ai.byte_tokenizer import ByteTokenizer
+from core.infrastructure.ai.hashing_encoder import HashingEncoder
+from core.infrastructure.ai.openai_embedding_encoder import OpenAIEmbeddingEncoder
+from core.infrastructure.ai.rate_limiter import RateLimiter
+from core.infrastructure.cache.summary_cache import SummaryCache
+from core.infrastructure.http.response_cache import HTTPResponseCache
+from core.infrastructure.repositories.cached_ai_repository import CachedAIRepository
+from core.infrastructure.repositories.indexing_news_repository import (
+    IndexingNewsRepository,
+)
+from core.infrastructure.repositories.json_training_data_writer import (
+    JSONTrainingDataWriter,
+)
+from core.infrastructure.repositories.local_batch_repository import (
+    LocalBatchRepository,
+)
+from core.infrastructure.repositories.openai_batch_repository import (
+    OpenAIBatchRepository,
+)
+from core.infrastructure.repositories.packed_sequence_training_data_writer import (
+    PackedSequenceTrainingDataWriter,
+)
+from core.infrastructure.repositories.sharded_jsonl_training_data_writer import (
+    ShardedJSONLTrainingDataWriter,
+)
+from core.infrastructure.repositories.sitemap_discovery_repository import (
+    SitemapDiscoveryRepository,
+)
+from core.infrastructure.repositories.sqlite_bm25_index import SQLiteBM25Index
+from core.infrastructure.repositories.sqlite_minhash_index import SQLiteMinHashIndex
+from core.infrastructure.repositories.sqlite_news_repository import (
+    SQLiteNewsRepository,
+)
 
 app = typer.Typer()
 console = Console()
 
 
+@app.callback()
+def main(
+    verbose: bool = typer.Option(False, help="Mostra também eventos INFO"),
+) -> None:
+    """Pipeline de coleta, resumo e exportação de notícias."""
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING, format="%(message)s"
+    )
+
+
+def _news_repository(output_dir: str, storage: str) -> AbstractNewsRepository:
+    if storage == "sqlite":
+        return SQLiteNewsRepository(os.path.join(output_dir, "articles.db"))
+    return JSONNewsRepository(os.path.join(output_dir, "articles.json"))
+
+
+def _print_metrics_report() -> None:
+    """Mostra as métricas coletadas durante a execução."""
+    summaries = REGISTRY.summaries()
+    if not summaries:
+        return
+    table = Table(title="Métricas da execução")
+    for column in ("Métrica", "Rótulos", "Total", "Qtd.", "p50", "p95", "Máx."):
+        table.add_column(column)
+    for row in summaries:
+        if row.kind == "histogram":
+            values = [
+                f"{row.value:.2f}s",
+                str(row.count),
+                f"{row.p50:.3f}s",
+                f"{row.p95:.3f}s",
+                f"{row.max:.3f}s",
+            ]
+        else:
+            values = [f"{row.value:,.0f}", "", "", "", ""]
+        table.add_row(row.name, row.label_text, *values)
+    console.print(table)
+
+
+def _incremental_output_dir(output_dir: str) -> str:
+    """Diretório próprio de uma execução incremental, nomeado pelo horário (UTC).
+
+    Cada execução incremental exporta só as URLs novas; gravar nos caminhos
+    fixos substituiria o dataset anterior pelos exemplos de um único dia.
+    """
+    run_id = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
+    return os.path.join(output_dir, "incremental", run_id)
+
+
+def _training_data_writer(
+    output_dir: str,
+    output_format: str,
+    shard_size: int,
+    compression: str,
+    validation_ratio: float,
+    seq_len: int,
+) -> tuple[AbstractTrainingDataWriter, str]:
+    """Cria o writer de saída e retorna também o caminho exibido ao usuário."""
+    if output_format == "parquet":
+        # pyarrow é opcional: só é importado quando o formato é pedido
+        from core.infrastructure.repositories.parquet_training_data_writer import (
+            ParquetTrainingDataWriter,
+        )
+
+        output_file = os.path.join(output_dir, "training_data.parquet")
+        return ParquetTrainingDataWriter(output_file), output_file
+    if output_format == "packed":
+        packed_dir = os.path.join(output_dir, "training_data_packed")
+        return (
+            PackedSequenceTrainingDataWriter(packed_dir, ByteTokenizer(), seq_len),
+            packed_dir,
+        )
+    if output_format == "jsonl":
+        shards_dir = os.path.join(output_dir, "training_data")
+        writer = ShardedJSONLTrainingDataWriter(
+            shards_dir,
+            shard_size=shard_size,
+            compression=compression,
+            validation_ratio=validation_ratio,
+        )
+        return writer, shards_dir
+    output_file = os.path.join(output_dir, "training_data.json")
+    return JSONTrainingDataWriter(output_file), output_file
+
+
 @app.command()
 def run_pipeline(
     output_dir: str = typer.Option("./data", help="Diretório de saída"),
+    storage: str = typer.Option(
+        "json", help="Armazenamento dos artigos: 'json' ou 'sqlite'"
+    ),
+    sections: list[str] = typer.Option(
+        ["world"], "--section", help="Seção da CNN a coletar (pode repetir)"
+    ),
+    discovery: str = typer.Option(
+        "html", help="Descoberta de links: 'html' (seções) ou 'sitemap' (XML/RSS)"
+    ),
+    feeds: list[str] = typer.Option(
+        ["https://edition.cnn.com/sitemap/news.xml"],
+        "--feed",
+        help="Sitemap ou feed RSS usado com --discovery sitemap (pode repetir)",
+    ),
+    days_ago: int = typer.Option(1, help="Último dia coletado, em dias atrás"),
+    days: int = typer.Option(1, help="Quantidade de dias coletados (backfill)"),
+    workers: int = typer.Option(16, help="Downloads simultâneos na extração"),
+    max_per_host: int = typer.Option(8, help="Conexões simultâneas por host"),
+    politeness_delay: float = typer.Option(
+        0.0, help="Intervalo mínimo (s) entre requisições ao mesmo host"
+    ),
+    http_cache: bool = typer.Option(
+        True, "--http-cache/--no-http-cache", help="Cache de páginas em disco"
+    ),
+    offline: bool = typer.Option(
+        False, "--offline", help="Usa apenas páginas já presentes no cache HTTP"
+    ),
+    parse_workers: int = typer.Option(
+        0, help="Processos para o parsing do HTML (0 = um por núcleo, 1 = sem pool)"
+    ),
+    ai_concurrency: int = typer.Option(4, help="Chamadas simultâneas à OpenAI"),
+    requests_per_minute: int = typer.Option(
+        500, help="Limite de requisições por minuto da OpenAI"
+    ),
+    tokens_per_minute: int = typer.Option(
+        200_000, help="Limite de tokens por minuto da OpenAI"
+    ),
+    input_token_budget: int = typer.Option(
+        3000, help="Máximo de tokens de conteúdo por requisição (0 desativa)"
+    ),
+    long_articles: str = typer.Option(
+        "map-reduce",
+        help="Artigos acima do orçamento: 'map-reduce' ou 'truncate'",
+    ),
+    max_chunks: int = typer.Option(
+        4, help="Resumos parciais combinados por redução no map-reduce"
+    ),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reutiliza resumos já gerados"
+    ),
+    pack_token_budget: int = typer.Option(
+        0,
+        help="Agrupa artigos curtos por requisição até N tokens (0 desativa; "
+        "executa os estágios em sequência)",
+    ),
+    streaming: bool = typer.Option(
+        True,
+        "--streaming/--staged",
+        help="Encadeia os estágios com filas em vez de executá-los em sequência",
+    ),
+    queue_size: int = typer.Option(32, help="Tamanho das filas entre estágios"),
+    dedupe: bool = typer.Option(
+        True, "--dedupe/--no-dedupe", help="Descarta quase-duplicatas antes do resumo"
+    ),
+    dedupe_threshold: float = typer.Option(
+        0.8, help="Similaridade (Jaccard estimada) a partir da qual é duplicata"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Reaproveita extrações e resumos já salvos"
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Processa apenas URLs ainda não exportadas e grava a saída em "
+        "incremental/<horário da execução>",
+    ),
+    output_format: str = typer.Option(
+        "json",
+        help="Formato da saída: 'json', 'jsonl', 'parquet' ou 'packed' (tokenizado)",
+    ),
+    shard_size: int = typer.Option(100_000, help="Exemplos por shard JSONL"),
+    compression: str = typer.Option(
+        "none", help="Compressão dos shards: 'none', 'gzip' ou 'zstd'"
+    ),
+    validation_ratio: float = typer.Option(
+        0.05, help="Fração dos exemplos no split de validação (JSONL)"
+    ),
+    seq_len: int = typer.Option(
+        2048, help="Tokens por sequência empacotada (formato packed)"
+    ),
+    batch: bool = typer.Option(
+        False, "--batch", help="Gera os resumos em lote (offline)"
+    ),
+    batch_backend: str = typer.Option(
+        "openai", help="Backend do modo lote: 'openai' ou 'local'"
+    ),
+    metrics_file: str = typer.Option(
+        "", help="Grava as métricas no formato de texto do Prometheus"
+    ),
+    search_index: bool = typer.Option(
+        False, "--search-index", help="Indexa os artigos salvos para busca (BM25)"
+    ),
 ):
     """Executa o pipeline completo de preparação de dados."""
 
@@ -45,43 +299,346 @@ def run_pipeline(
         raise typer.Exit(1)
 
     # Configuração dos repositórios
-    scraping_repo = CNNScrapingRepository()
-    ai_repo = OpenAIRepository(openai_api_key)
-    news_repo = JSONNewsRepository(os.path.join(output_dir, "articles.json"))
+    response_cache = None
+    if http_cache or offline:
+        response_cache = HTTPResponseCache(
+            os.path.join(output_dir, "http_cache"), offline=offline
+        )
+    scraping_repo = CNNScrapingRepository(
+        max_per_host=max_per_host,
+        politeness_delay=politeness_delay,
+        pool_size=workers,
+        response_cache=response_cache,
+    )
+    openai_repo = OpenAIRepository(
+        openai_api_key,
+        rate_limiter=RateLimiter(requests_per_minute, tokens_per_minute),
+    )
+    ai_repo: AbstractAIRepository = openai_repo
+    summary_cache = None
+    if use_cache:
+        summary_cache = SummaryCache(os.path.join(output_dir, "summary_cache.db"))
+        ai_repo = CachedAIRepository(ai_repo, summary_cache)
+    batch_dir = os.path.join(output_dir, "batches")
+    batch_repo: AbstractBatchAIRepository
+    if batch_backend == "local":
+        batch_repo = LocalBatchRepository(ai_repo, batch_dir)
+    else:
+        batch_repo = OpenAIBatchRepository(openai_api_key, openai_repo, batch_dir)
+    news_repo = _news_repository(output_dir, storage)
+    if search_index:
+        news_repo = IndexingNewsRepository(
+            news_repo, SQLiteBM25Index(os.path.join(output_dir, "search_index.db"))
+        )
 
     # Casos de uso
-    scrape_links_uc = ScrapeNewsLinksUseCase(scraping_repo)
-    extract_content_uc = ExtractNewsContentUseCase(scraping_repo, news_repo)
-    generate_summaries_uc = GenerateSummariesUseCase(ai_repo, news_repo)
-    prepare_data_uc = PrepareTrainingDataUseCase()
+    links_repo: AbstractScrapingRepository = scraping_repo
+    if discovery == "sitemap":
+        links_repo = SitemapDiscoveryRepository(scraping_repo)
+    scrape_links_uc = ScrapeNewsLinksUseCase(links_repo)
+    extract_content_uc = ExtractNewsContentUseCase(
+        scraping_repo, news_repo, parse_workers=parse_workers or os.cpu_count() or 1
+    )
+    generate_summaries_uc = GenerateSummariesUseCase(
+        ai_repo,
+        news_repo,
+        batch_repo,
+        input_token_budget=input_token_budget or None,
+        map_reduce=long_articles == "map-reduce",
+        max_chunks=max_chunks,
+    )
+    prepare_data_uc = PrepareTrainingDataUseCase(news_repo)
+    deduplicate_uc = None
+    if dedupe:
+        hasher = MinHasher(num_perm=128)
+        minhash_index = SQLiteMinHashIndex(
+            os.path.join(output_dir, "minhash_index.db"),
+            num_perm=hasher.num_perm,
+            bands=DeduplicateArticlesUseCase.bands_for(
+                dedupe_threshold, hasher.num_perm
+            ),
+        )
+        deduplicate_uc = DeduplicateArticlesUseCase(
+            minhash_index, hasher, threshold=dedupe_threshold
+        )
 
     # Execução do pipeline
-    typer.echo("🔗 Coletando links...")
-    links = scrape_links_uc.execute("https://edition.cnn.com/world")
-    typer.echo(f"Encontrados {len(links)} links")
+    section_urls = [
+        section if section.startswith("http") else f"https://edition.cnn.com/{section}"
+        for section in sections
+    ]
+    if discovery == "sitemap":
+        section_urls = feeds
+    writer, output_path = _training_data_writer(
+        _incremental_output_dir(output_dir) if incremental else output_dir,
+        output_format,
+        shard_size,
+        compression,
+        validation_ratio,
+        seq_len,
+    )
+    # Lote e empacotamento resumem vários artigos juntos: só no fluxo em estágios
+    if streaming and (batch or pack_token_budget):
+        typer.echo("ℹ️  --batch/--pack-token-budget executam os estágios em sequência")
+        streaming = False
+    with writer:
+        if streaming:
+            typer.echo("🚰 Executando pipeline em streaming...")
+            pipeline_uc = StreamingPipelineUseCase(
+                scrape_links_uc,
+                extract_content_uc,
+                generate_summaries_uc,
+                prepare_data_uc,
+                queue_size=queue_size,
+                extract_workers=workers,
+                summarize_workers=ai_concurrency,
+                deduplicate_uc=deduplicate_uc,
+            )
+            result = pipeline_uc.execute(
+                section_urls,
+                writer,
+                days_ago=days_ago,
+                days=days,
+                resume=resume,
+                incremental=incremental,
+            )
+            typer.echo(
+                f"Encontrados {result.links} links, extraídos {result.extracted} "
+                f"artigos ({result.duplicates} duplicatas), "
+                f"gerados {result.summarized} resumos"
+            )
+            examples_count = result.examples
+            exported_ids = result.exported_ids
+        else:
+            typer.echo("🔗 Coletando links...")
+            start_date, end_date = scrape_links_uc.date_range(days_ago, days)
+            links = scrape_links_uc.execute_frontier(
+                section_urls, start_date, end_date
+            )
+            typer.echo(f"Encontrados {len(links)} links")
+            if incremental:
+                links = extract_content_uc.pending_urls(links)
+                typer.echo(f"{len(links)} links ainda não exportados")
 
-    typer.echo("📰 Extraindo conteúdo...")
-    articles = extract_content_uc.execute(links)
-    typer.echo(f"Extraídos {len(articles)} artigos")
+            typer.echo("📰 Extraindo conteúdo...")
+            articles = extract_content_uc.execute(
+                links, max_workers=workers, resume=resume
+            )
+            typer.echo(f"Extraídos {len(articles)} artigos")
+            if deduplicate_uc is not None:
+                unique_articles = deduplicate_uc.execute(articles)
+                typer.echo(
+                    f"{len(articles) - len(unique_articles)} quase-duplicatas "
+                    "descartadas"
+                )
+                articles = unique_articles
 
-    typer.echo("🤖 Gerando resumos...")
-    articles_with_summaries = generate_summaries_uc.execute(articles)
-    typer.echo(f"Gerados {len(articles_with_summaries)} resumos")
+            typer.echo("🤖 Gerando resumos...")
+            if batch:
+                articles_with_summaries = generate_summaries_uc.execute_batch(articles)
+            else:
+                articles_with_summaries = generate_summaries_uc.execute(
+                    articles,
+                    max_concurrency=ai_concurrency,
+                    pack_token_budget=pack_token_budget or None,
+                )
+            typer.echo(f"Gerados {len(articles_with_summaries)} resumos")
 
-    typer.echo("📚 Preparando dados de treinamento...")
-    training_examples = prepare_data_uc.execute(articles_with_summaries)
+            typer.echo("📚 Preparando dados de treinamento...")
+            exported_ids = []
+            for article in articles_with_summaries:
+                example = prepare_data_uc.prepare_one(article)
+                if example is not None:
+                    writer.write(example)
+                    exported_ids.append(article.id)
+            examples_count = len(exported_ids)
 
-    # Salvar dados finais
-    output_file = os.path.join(output_dir, "training_data.json")
-    training_data = [{"input": example.input_text} for example in training_examples]
+    extract_content_uc.close()
+
+    # Só marca como exportado depois que o arquivo de saída foi publicado
+    prepare_data_uc.mark_exported(exported_ids)
+
+    if summary_cache is not None:
+        stats = summary_cache.stats
+        typer.echo(
+            f"Cache de resumos: {stats.hits} acertos "
+            f"({stats.memory_hits} memória, {stats.disk_hits} disco), "
+            f"{stats.misses} falhas, taxa {stats.hit_rate:.0%}"
+        )
+        summary_cache.close()
+
+    _print_metrics_report()
+    if metrics_file:
+        with open(metrics_file, "w", encoding="utf-8") as f:
+            f.write(REGISTRY.render_prometheus())
+
+    typer.echo(
+        f"✅ Pipeline concluído! {examples_count} exemplos salvos em {output_path}"
+    )
+
+
+@app.command()
+def export_training_data(
+    output_dir: str = typer.Option("./data", help="Diretório de saída"),
+    storage: str = typer.Option(
+        "json", help="Armazenamento dos artigos: 'json' ou 'sqlite'"
+    ),
+    output_format: str = typer.Option(
+        "jsonl",
+        help="Formato da saída: 'json', 'jsonl', 'parquet' ou 'packed' (tokenizado)",
+    ),
+    shard_size: int = typer.Option(100_000, help="Exemplos por shard JSONL"),
+    compression: str = typer.Option(
+        "none", help="Compressão dos shards: 'none', 'gzip' ou 'zstd'"
+    ),
+    validation_ratio: float = typer.Option(
+        0.05, help="Fração dos exemplos no split de validação (JSONL)"
+    ),
+    seq_len: int = typer.Option(
+        2048, help="Tokens por sequência empacotada (formato packed)"
+    ),
+):
+    """Exporta os artigos já resumidos como dados de treinamento."""
+    news_repo = _news_repository(output_dir, storage)
+    export_uc = ExportTrainingDataUseCase(news_repo, PrepareTrainingDataUseCase())
+    writer, output_path = _training_data_writer(
+        output_dir,
+        output_format,
+        shard_size,
+        compression,
+        validation_ratio,
+        seq_len,
+    )
+    with writer:
+        examples_count = export_uc.execute(writer)
+    typer.echo(f"✅ {examples_count} exemplos exportados para {output_path}")
 
-    os.makedirs(output_dir, exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(training_data, f, indent=4, ensure_ascii=False)
 
+@app.command()
+def snapshot_articles(
+    output_dir: str = typer.Option("./data", help="Diretório de saída"),
+    storage: str = typer.Option(
+        "json", help="Armazenamento dos artigos: 'json' ou 'sqlite'"
+    ),
+    row_group_size: int = typer.Option(10_000, help="Artigos por row group"),
+):
+    """Gera um snapshot Parquet dos artigos para leitura analítica."""
+    from core.infrastructure.repositories.parquet_news_repository import (
+        ParquetNewsRepository,
+    )
+
+    news_repo = _news_repository(output_dir, storage)
+    snapshot_file = os.path.join(output_dir, "articles.parquet")
+    snapshot_repo = ParquetNewsRepository(snapshot_file, row_group_size)
+    count = snapshot_repo.write_snapshot(news_repo.iter_all())
+    typer.echo(f"✅ {count} artigos gravados em {snapshot_file}")
+
+
+@app.command()
+def index_articles(
+    output_dir: str = typer.Option("./data", help="Diretório de saída"),
+    storage: str = typer.Option(
+        "json", help="Armazenamento dos artigos: 'json' ou 'sqlite'"
+    ),
+    batch_size: int = typer.Option(1000, help="Artigos por segmento do índice"),
+    optimize: bool = typer.Option(
+        False, "--optimize", help="Funde todos os segmentos ao final"
+    ),
+):
+    """Indexa para busca os artigos salvos que ainda não estão no índice."""
+    index = SQLiteBM25Index(os.path.join(output_dir, "search_index.db"))
+    search_uc = SearchArticlesUseCase(index, _news_repository(output_dir, storage))
+    indexed = search_uc.reindex(batch_size)
+    if optimize:
+        index.optimize()
     typer.echo(
-        f"✅ Pipeline concluído! {len(training_examples)} exemplos salvos em {output_file}"
+        f"✅ {indexed} artigos indexados ({index.document_count} no índice, "
+        f"{index.segment_count} segmentos)"
     )
+    index.close()
+
+
+def _embedding_encoder(name: str) -> AbstractEmbeddingEncoder:
+    """Codificador de embeddings: 'openai' (API) ou 'hashing' (local)."""
+    if name == "hashing":
+        return HashingEncoder()
+    load_dotenv()
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        typer.echo("❌ OPENAI_API_KEY não encontrada no arquivo .env.")
+        raise typer.Exit(1)
+    return OpenAIEmbeddingEncoder(openai_api_key)
+
+
+@app.command()
+def index_embeddings(
+    output_dir: str = typer.Option("./data", help="Diretório de saída"),
+    storage: str = typer.Option(
+        "json", help="Armazenamento dos artigos: 'json' ou 'sqlite'"
+    ),
+    encoder: str = typer.Option(
+        "openai", help="Codificador: 'openai' (API) ou 'hashing' (local)"
+    ),
+    batch_size: int = typer.Option(1000, help="Artigos lidos por vez"),
+    ivf_lists: int = typer.Option(
+        0, help="Treina um IVF com N centróides ao final (0 mantém o atual)"
+    ),
+):
+    """Gera embeddings só dos artigos novos ou alterados (busca semântica)."""
+    # numpy é opcional: só é importado quando a busca semântica é usada
+    from core.infrastructure.repositories.memmap_vector_index import (
+        MemmapVectorIndex,
+    )
+
+    index = MemmapVectorIndex(
+        os.path.join(output_dir, "embeddings"), _embedding_encoder(encoder)
+    )
+    search_uc = SearchArticlesUseCase(index, _news_repository(output_dir, storage))
+    indexed = search_uc.reindex(batch_size)
+    if ivf_lists:
+        index.train_ivf(ivf_lists)
+    typer.echo(
+        f"✅ {indexed} artigos codificados ({index.document_count} no índice)"
+    )
+    index.close()
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(..., help="Termos da busca"),
+    output_dir: str = typer.Option("./data", help="Diretório de saída"),
+    storage: str = typer.Option(
+        "json", help="Armazenamento dos artigos: 'json' ou 'sqlite'"
+    ),
+    k: int = typer.Option(10, help="Quantidade de resultados"),
+    semantic: bool = typer.Option(
+        False, "--semantic", help="Busca por embeddings em vez de BM25"
+    ),
+    encoder: str = typer.Option(
+        "openai", help="Codificador da busca semântica: 'openai' ou 'hashing'"
+    ),
+):
+    """Busca artigos no índice local (BM25 ou embeddings)."""
+    index: AbstractSearchIndex
+    if semantic:
+        from core.infrastructure.repositories.memmap_vector_index import (
+            MemmapVectorIndex,
+        )
+
+        index = MemmapVectorIndex(
+            os.path.join(output_dir, "embeddings"), _embedding_encoder(encoder)
+        )
+    else:
+        index = SQLiteBM25Index(os.path.join(output_dir, "search_index.db"))
+    search_uc = SearchArticlesUseCase(index, _news_repository(output_dir, storage))
+    table = Table(title=f"Resultados para “{query}”")
+    for column in ("Pontuação", "Título", "URL"):
+        table.add_column(column)
+    for result in search_uc.execute(query, k):
+        table.add_row(
+            f"{result.score:.2f}", result.article.title or "", result.article.url
+        )
+    console.print(table)
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""Application services - pure helper functions used by the use cases."""
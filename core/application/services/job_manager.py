@@ -0,0 +1,170 @@
+"""Background job registry with a bounded worker pool, progress and cancellation."""
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+
+class JobStatus(StrEnum):
+    """Situação de um job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class Job:
+    """Um job submetido: parâmetros, situação e progresso por estágio.
+
+    ``version`` aumenta a cada mudança, o que permite a quem acompanha o job
+    (por exemplo, um stream de eventos) saber se há algo novo sem comparar o
+    estado inteiro.
+    """
+
+    id: str
+    params: dict[str, Any]
+    status: JobStatus = JobStatus.QUEUED
+    progress: dict[str, int] = field(default_factory=dict)
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    version: int = 0
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Cópia serializável do estado atual."""
+        return {
+            "id": self.id,
+            "params": dict(self.params),
+            "status": self.status.value,
+            "progress": dict(self.progress),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "version": self.version,
+        }
+
+
+# Executa o job e retorna o resultado; o segundo argumento reporta progresso
+JobRunner = Callable[[Job, Callable[[str, int], None]], dict[str, Any]]
+
+
+class JobManager:
+    """Executa jobs em um pool limitado de threads e guarda seu estado.
+
+    No máximo ``max_workers`` jobs rodam ao mesmo tempo; os demais esperam na
+    fila do pool. O cancelamento de um job na fila o descarta; o de um job em
+    execução sinaliza ``Job.cancel_event``, que o ``runner`` deve observar.
+    Apenas os ``max_finished`` jobs concluídos mais recentes são mantidos.
+    """
+
+    def __init__(
+        self, runner: JobRunner, max_workers: int = 2, max_finished: int = 100
+    ):
+        self._runner = runner
+        self._max_finished = max_finished
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="job"
+        )
+        self._lock = threading.Lock()
+        self._jobs: dict[str, Job] = {}
+        self._futures: dict[str, Future[None]] = {}
+
+    def shutdown(self) -> None:
+        """Cancela todos os jobs e espera os que estão em execução."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            self.cancel(job.id)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _update(self, job: Job, **changes: Any) -> None:
+        with self._lock:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.version += 1
+
+    def _prune(self) -> None:
+        finished = [job for job in self._jobs.values() if job.status.finished]
+        finished.sort(key=lambda job: job.finished_at or 0.0)
+        for job in finished[: max(0, len(finished) - self._max_finished)]:
+            del self._jobs[job.id]
+            self._futures.pop(job.id, None)
+
+    def submit(self, params: dict[str, Any]) -> Job:
+        """Registra o job e o coloca na fila do pool."""
+        job = Job(id=uuid.uuid4().hex, params=params)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+            self._futures[job.id] = self._executor.submit(self._run, job)
+        return job
+
+    def _run(self, job: Job) -> None:
+        if job.cancel_event.is_set():
+            # Cancelado depois de sair da fila, mas antes de começar
+            self._update(job, status=JobStatus.CANCELLED, finished_at=time.time())
+            return
+        self._update(job, status=JobStatus.RUNNING, started_at=time.time())
+
+        def report(stage: str, value: int) -> None:
+            with self._lock:
+                job.progress[stage] = value
+                job.version += 1
+
+        try:
+            result = self._runner(job, report)
+        except Exception as exc:
+            self._update(
+                job,
+                status=JobStatus.FAILED,
+                error=f"{type(exc).__name__}: {exc}",
+                finished_at=time.time(),
+            )
+            return
+        status = (
+            JobStatus.CANCELLED if job.cancel_event.is_set() else JobStatus.SUCCEEDED
+        )
+        self._update(job, status=status, result=result, finished_at=time.time())
+
+    def snapshot(self, job_id: str) -> dict[str, Any] | None:
+        """Estado atual do job, copiado de forma consistente."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.snapshot() if job is not None else None
+
+    def list_jobs(self) -> list[dict[str, Any]]:
+        """Estado de todos os jobs registrados, do mais recente ao mais antigo."""
+        with self._lock:
+            jobs = sorted(
+                self._jobs.values(), key=lambda job: job.created_at, reverse=True
+            )
+            return [job.snapshot() for job in jobs]
+
+    def cancel(self, job_id: str) -> bool:
+        """Pede o cancelamento; retorna ``False`` se o job não existe ou acabou."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status.finished:
+                return False
+            job.cancel_event.set()
+            future = self._futures.get(job_id)
+            queued = future is not None and future.cancel()
+        if queued:
+            self._update(job, status=JobStatus.CANCELLED, finished_at=time.time())
+        return True
@@ -0,0 +1,225 @@
+"""Thread-safe counters, gauges and histograms with Prometheus text export."""
+import bisect
+import math
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# Limites (em segundos) dos buckets de latência: de 5 ms a 1 min
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+# Catálogo das métricas emitidas pelo pipeline, usado no ``# HELP``
+HELP = {
+    "scrape_fetch_seconds": "Duração de cada download de página",
+    "scrape_fetched_bytes_total": "Bytes de HTML baixados",
+    "scrape_parse_seconds": "Duração do parsing do HTML de um artigo",
+    "ai_request_seconds": "Duração de cada chamada à API de IA",
+    "ai_tokens_total": "Tokens consumidos pela API de IA",
+    "ai_retries_total": "Chamadas à API de IA repetidas após erro transitório",
+    "repository_write_seconds": "Duração de cada gravação no repositório",
+    "pipeline_stage_seconds": "Duração de cada estágio, por artigo",
+    "pipeline_errors_total": "Falhas por estágio e classe de erro",
+    "pipeline_queue_depth": "Itens na fila antes do estágio",
+    "pipeline_queue_depth_max": "Maior ocupação observada da fila",
+    "search_query_seconds": "Duração de cada consulta ao índice de busca",
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _key(labels: dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    pairs = [*labels, extra] if extra is not None else list(labels)
+    if not pairs:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Limite superior do bucket que contém o quantil ``q``."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip((*self.buckets, self.max), self.counts, strict=True):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+@dataclass(frozen=True)
+class MetricSummary:
+    """Uma série resumida para o relatório de fim de execução."""
+
+    name: str
+    labels: Labels
+    kind: str  # "counter", "gauge" ou "histogram"
+    value: float  # total do contador/gauge; soma das observações do histograma
+    count: int = 0
+    p50: float = 0.0
+    p95: float = 0.0
+    max: float = 0.0
+
+    @property
+    def label_text(self) -> str:
+        """Rótulos no formato ``nome=valor``, separados por vírgula."""
+        return ",".join(f"{name}={value}" for name, value in self.labels)
+
+
+class MetricsRegistry:
+    """Registro de métricas do processo, seguro para várias threads.
+
+    Cada série é identificada pelo nome e pelos rótulos passados como
+    argumentos nomeados. ``render_prometheus`` gera o formato de texto do
+    Prometheus e ``summaries`` alimenta o relatório da CLI.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._gauges: dict[str, dict[Labels, float]] = {}
+        self._histograms: dict[str, dict[Labels, _Histogram]] = {}
+
+    def reset(self) -> None:
+        """Descarta todas as séries."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Soma ``value`` ao contador."""
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            key = _key(labels)
+            series[key] = series.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Define o valor atual do gauge."""
+        with self._lock:
+            self._gauges.setdefault(name, {})[_key(labels)] = value
+
+    def max_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Atualiza o gauge apenas se ``value`` for maior que o atual."""
+        with self._lock:
+            series = self._gauges.setdefault(name, {})
+            key = _key(labels)
+            series[key] = max(series.get(key, value), value)
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Registra uma observação no histograma."""
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            key = _key(labels)
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(DEFAULT_BUCKETS)
+            histogram.observe(value)
+
+    @contextmanager
+    def time(self, name: str, **labels: str) -> Iterator[None]:
+        """Mede a duração do bloco no histograma, mesmo se ele falhar."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def value(self, name: str, **labels: str) -> float:
+        """Valor atual de um contador ou gauge (0 se não existir)."""
+        key = _key(labels)
+        with self._lock:
+            if name in self._gauges:
+                return self._gauges[name].get(key, 0.0)
+            return self._counters.get(name, {}).get(key, 0.0)
+
+    def summaries(self) -> list[MetricSummary]:
+        """Todas as séries, ordenadas por nome e rótulos."""
+        rows: list[MetricSummary] = []
+        with self._lock:
+            for kind, family in (("counter", self._counters), ("gauge", self._gauges)):
+                for name, series in family.items():
+                    rows.extend(
+                        MetricSummary(name, labels, kind, value)
+                        for labels, value in series.items()
+                    )
+            for name, histograms in self._histograms.items():
+                rows.extend(
+                    MetricSummary(
+                        name,
+                        labels,
+                        "histogram",
+                        histogram.sum,
+                        histogram.count,
+                        histogram.quantile(0.5),
+                        histogram.quantile(0.95),
+                        histogram.max,
+                    )
+                    for labels, histogram in histograms.items()
+                )
+        return sorted(rows, key=lambda row: (row.name, row.labels))
+
+    def render_prometheus(self) -> str:
+        """Exporta as séries no formato de texto do Prometheus (0.0.4)."""
+        lines: list[str] = []
+
+        def header(name: str, kind: str) -> None:
+            if name in HELP:
+                lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            for kind, family in (("counter", self._counters), ("gauge", self._gauges)):
+                for name in sorted(family):
+                    header(name, kind)
+                    for labels, value in sorted(family[name].items()):
+                        lines.append(
+                            f"{name}{_format_labels(labels)} {_format_value(value)}"
+                        )
+            for name in sorted(self._histograms):
+                header(name, "histogram")
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    bounds = (*histogram.buckets, math.inf)
+                    for bound, count in zip(bounds, histogram.counts, strict=True):
+                        cumulative += count
+                        le = _format_labels(labels, ("le", _format_value(bound)))
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    suffix = _format_labels(labels)
+                    lines.append(f"{name}_sum{suffix} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{suffix} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+# Registro padrão do processo, compartilhado pela CLI e pela API HTTP
+REGISTRY = MetricsRegistry()
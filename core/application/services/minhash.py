@@ -0,0 +1,92 @@
+"""MinHash signatures and LSH banding for near-duplicate detection."""
+import hashlib
+import random
+import re
+
+# Primo de Mersenne 2^61 - 1: as permutações são (a * x + b) mod _PRIME
+_PRIME = (1 << 61) - 1
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = 5) -> set[int]:
+    """Hashes de 32 bits dos n-gramas de palavras (normalizados) do texto."""
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [
+            " ".join(words[index : index + size])
+            for index in range(len(words) - size + 1)
+        ]
+    return {
+        int.from_bytes(
+            hashlib.blake2b(gram.encode("utf-8"), digest_size=4).digest(), "big"
+        )
+        for gram in grams
+    }
+
+
+class MinHasher:
+    """Gera assinaturas MinHash com ``num_perm`` permutações determinísticas.
+
+    A semente fixa garante que assinaturas de execuções diferentes sejam
+    comparáveis, o que permite persistir o índice entre dias.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._permutations = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, hashes: set[int]) -> list[int]:
+        """Assinatura MinHash de um conjunto de shingles."""
+        if not hashes:
+            return [_PRIME] * self.num_perm
+        values = list(hashes)
+        return [
+            min([(a * x + b) % _PRIME for x in values]) for a, b in self._permutations
+        ]
+
+
+def similarity(left: list[int], right: list[int]) -> float:
+    """Estimativa da similaridade de Jaccard entre duas assinaturas."""
+    equal = sum(1 for a, b in zip(left, right, strict=True) if a == b)
+    return equal / len(left)
+
+
+def optimal_bands(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Escolhe ``(bandas, linhas)`` com a curva S logo abaixo do limiar.
+
+    Pares com similaridade ``s`` viram candidatos com probabilidade
+    ``1 - (1 - s**r)**b``; o ponto de inflexão fica em ``(1/b)**(1/r)``.
+    Escolher a inflexão abaixo do limiar troca alguns candidatos a mais
+    (descartados na comparação completa) por menos falsos negativos.
+    """
+    options = [
+        (bands, num_perm // bands)
+        for bands in range(1, num_perm + 1)
+        if num_perm % bands == 0
+    ]
+
+    def inflection(option: tuple[int, int]) -> float:
+        return float((1 / option[0]) ** (1 / option[1]))
+
+    below = [option for option in options if inflection(option) <= threshold]
+    if not below:
+        return options[-1]
+    return max(below, key=inflection)
+
+
+def band_keys(signature: list[int], bands: int) -> list[int]:
+    """Chave (int64 com sinal) de cada banda da assinatura, para o índice LSH."""
+    rows = len(signature) // bands
+    keys = []
+    for band in range(bands):
+        chunk = signature[band * rows : (band + 1) * rows]
+        payload = b"".join(value.to_bytes(8, "big") for value in chunk)
+        digest = hashlib.blake2b(payload, digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
@@ -0,0 +1,22 @@
+"""Tokenization shared by the search index and its queries."""
+import re
+
+_WORD = re.compile(r"[^\W_]+")
+
+# Palavras muito frequentes no inglês das notícias, que não ajudam na busca
+STOPWORDS = frozenset(
+    """
+    a an and are as at be been but by for from had has have he her his i in
+    is it its of on or said she that the their they this to was were which
+    will with would you we our not who after also more about than into over
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Termos do texto: palavras em minúsculas, sem stopwords nem letras soltas."""
+    return [
+        term
+        for term in _WORD.findall(text.casefold())
+        if len(term) > 1 and term not in STOPWORDS
+    ]
@@ -0,0 +1,15 @@
+"""Use case for creating items."""
+from core.domain.entities.item import Item
+from core.domain.repositories.item_repo import AbstractItemRepository
+
+
+class CreateItemUseCase:
+    """Create a new item and persist it through the repository."""
+
+    def __init__(self, repository: AbstractItemRepository):
+        self._repository = repository
+
+    def execute(self, name: str, description: str | None = None) -> Item:
+        """Create an item with a generated ID and save it."""
+        item = Item.create(name=name, description=description)
+        return self._repository.save(item)
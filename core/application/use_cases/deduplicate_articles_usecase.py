@@ -0,0 +1,58 @@
+import logging
+
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.application.services.minhash import MinHasher, optimal_bands, shingles
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.repositories.abstracts.abstract_near_duplicate_index import (
+    AbstractNearDuplicateIndex,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DeduplicateArticlesUseCase:
+    """Caso de uso para descartar quase-duplicatas antes da sumarização."""
+
+    def __init__(
+        self,
+        index: AbstractNearDuplicateIndex,
+        hasher: MinHasher,
+        threshold: float = 0.8,
+        shingle_size: int = 5,
+        metrics: MetricsRegistry | None = None,
+    ):
+        self._index = index
+        self._hasher = hasher
+        self._threshold = threshold
+        self._shingle_size = shingle_size
+        self._metrics = metrics if metrics is not None else REGISTRY
+
+    @staticmethod
+    def bands_for(threshold: float, num_perm: int) -> int:
+        """Número de bandas LSH adequado ao limiar de similaridade."""
+        bands, _ = optimal_bands(threshold, num_perm)
+        return bands
+
+    def duplicate_of(self, article: NewsArticle) -> str | None:
+        """ID do artigo já visto do qual este é quase-duplicata, se houver.
+
+        Artigos sem conteúdo extraído não são indexados nem descartados.
+        Quase-duplicatas são contadas em ``near_duplicates_total``.
+        """
+        if not article.has_content or not article.reached(ArticleStage.EXTRACTED):
+            return None
+        content = article.content or ""
+        signature = self._hasher.signature(shingles(content, self._shingle_size))
+        duplicate = self._index.find_or_add(article.id, signature, self._threshold)
+        if duplicate is not None:
+            self._metrics.inc("near_duplicates_total")
+            logger.info("Quase-duplicata ignorada: %s (~%s)", article.url, duplicate)
+        return duplicate
+
+    def execute(self, articles: list[NewsArticle]) -> list[NewsArticle]:
+        """Retorna apenas os artigos que não são quase-duplicatas, na ordem."""
+        unique = []
+        for article in articles:
+            if self.duplicate_of(article) is None:
+                unique.append(article)
+        return unique
@@ -0,0 +1,53 @@
+from collections.abc import Iterator
+
+from core.application.use_cases.prepare_training_data_usecase import (
+    PrepareTrainingDataUseCase,
+)
+from core.domain.entities.training_example import TrainingExample
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+    ArticleQuery,
+)
+from core.domain.repositories.abstracts.abstract_training_data_writer import (
+    AbstractTrainingDataWriter,
+)
+
+
+class ExportTrainingDataUseCase:
+    """Caso de uso para exportar os artigos salvos como dados de treinamento."""
+
+    def __init__(
+        self,
+        news_repo: AbstractNewsRepository,
+        prepare_data_uc: PrepareTrainingDataUseCase,
+    ):
+        self._news_repo = news_repo
+        self._prepare_data_uc = prepare_data_uc
+
+    def iter_examples(
+        self, query: ArticleQuery | None = None
+    ) -> Iterator[tuple[str, TrainingExample]]:
+        """Gera ``(id do artigo, exemplo)`` em ordem de ID, um artigo por vez.
+
+        Artigos sem exemplo válido são pulados, então ``query.limit`` limita
+        os artigos lidos, não os exemplos gerados.
+        """
+        for article in self._news_repo.iter_articles(query):
+            example = self._prepare_data_uc.prepare_one(article)
+            if example is not None:
+                yield article.id, example
+
+    def execute(self, writer: AbstractTrainingDataWriter) -> int:
+        """Grava em ``writer`` um exemplo por artigo válido do repositório.
+
+        Os artigos são percorridos um a um com ``iter_all``, sem montar a
+        lista de exemplos em memória. Retorna o número de exemplos gravados;
+        o ``writer`` não é fechado aqui.
+        """
+        count = 0
+        for article in self._news_repo.iter_all():
+            example = self._prepare_data_uc.prepare_one(article)
+            if example is not None:
+                writer.write(example)
+                count += 1
+        return count
@@ -1,32 +1,190 @@
-import uuid
+import logging
+import multiprocessing
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-from core.domain.entities.news_article import NewsArticle
-from core.domain.repositories.abstracts.abstract_new_repository import AbstractNewsRepository
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
 from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractPageFetchingRepository,
     AbstractScrapingRepository,
+    ContentUnavailableError,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ExtractNewsContentUseCase:
-    """Caso de uso para extrair conteúdo das notícias."""
+    """Caso de uso para extrair conteúdo das notícias.
+
+    Com ``parse_workers > 1`` e um ``AbstractPageFetchingRepository``, o
+    download continua nas threads de I/O, mas o parsing do HTML (limitado
+    pelo GIL) vai para um pool de processos; cada thread espera o resultado
+    da sua página, então a ordem de entrada é preservada como antes.
+    Chame ``close`` ao final para encerrar o pool. Páginas que não puderam
+    ser baixadas são contadas em ``pipeline_errors_total`` e, se o artigo
+    ainda não existe, salvas sem conteúdo, como apenas coletadas. Um artigo
+    já salvo nunca regride: o conteúdo baixado é atualizado, mas resumo e
+    estágio são mantidos, e uma falha de download não o sobrescreve.
+    """
 
     def __init__(
         self,
         scraping_repo: AbstractScrapingRepository,
         news_repo: AbstractNewsRepository,
+        parse_workers: int = 0,
+        metrics: MetricsRegistry | None = None,
     ):
         self._scraping_repo = scraping_repo
         self._news_repo = news_repo
+        self._parse_workers = parse_workers
+        self._fetcher = (
+            scraping_repo
+            if parse_workers > 1
+            and isinstance(scraping_repo, AbstractPageFetchingRepository)
+            else None
+        )
+        self._parser = self._fetcher.page_parser() if self._fetcher else None
+        self._parse_pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._metrics = metrics if metrics is not None else REGISTRY
+
+    def close(self) -> None:
+        """Encerra o pool de processos de parsing, se tiver sido criado."""
+        with self._pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True, cancel_futures=True)
+                self._parse_pool = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._parse_pool is None:
+                # "spawn": os processos são criados a partir das threads de
+                # download, e fork com threads ativas pode travar o filho
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=self._parse_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._parse_pool
+
+    def _fetch_and_parse(self, url: str) -> str:
+        fetcher, parser = self._fetcher, self._parser
+        if fetcher is None or parser is None:
+            return self._scraping_repo.extract_content(url)
+        raw = fetcher.fetch_page(url)
+        # Os bytes brutos vão direto para o processo, que também os decodifica
+        with self._metrics.time("scrape_parse_seconds", mode="process"):
+            return self._pool().submit(parser, raw).result()
+
+    def _extract(self, url: str) -> NewsArticle:
+        article_id = NewsArticle.id_for_url(url)
+        try:
+            content = self._fetch_and_parse(url)
+        except ContentUnavailableError as e:
+            cause = e.__cause__ or e
+            self._metrics.inc(
+                "pipeline_errors_total", stage="extract", error=type(cause).__name__
+            )
+            logger.warning("Erro de rede ao acessar %s: %s", url, e)
+            # Falhas de rede ficam como "scraped" para serem refeitas no --resume
+            return NewsArticle(id=article_id, url=url, stage=ArticleStage.SCRAPED)
+        return NewsArticle(
+            id=article_id, url=url, content=content, stage=ArticleStage.EXTRACTED
+        )
+
+    def _save(self, article: NewsArticle) -> NewsArticle:
+        """Combina a extração com o registro salvo e retorna o resultado."""
+        stored = self._news_repo.find_by_id(article.id)
+        if stored is not None:
+            if not article.has_content:
+                # Falha de download: o registro existente continua valendo
+                return stored
+            if stored.reached(article.stage) and stored.content == article.content:
+                return stored
+            article = NewsArticle(
+                id=stored.id,
+                url=stored.url,
+                title=stored.title,
+                content=article.content,
+                summary=stored.summary,
+                published_date=stored.published_date,
+                source=stored.source,
+                stage=stored.stage if stored.reached(article.stage) else article.stage,
+            )
+        self._news_repo.save(article)
+        return article
+
+    def _stored(self, url: str) -> NewsArticle | None:
+        """Artigo já extraído em uma execução anterior, se houver."""
+        article = self._news_repo.find_by_id(NewsArticle.id_for_url(url))
+        if article is not None and article.reached(ArticleStage.EXTRACTED):
+            return article
+        return None
+
+    def pending_urls(self, urls: list[str]) -> list[str]:
+        """Filtra as URLs cujo artigo ainda não foi exportado (modo incremental)."""
+        pending = []
+        for url in dict.fromkeys(urls):
+            article = self._news_repo.find_by_id(NewsArticle.id_for_url(url))
+            if article is None or not article.reached(ArticleStage.EXPORTED):
+                pending.append(url)
+        return pending
+
+    def extract_one(self, url: str, resume: bool = False) -> NewsArticle:
+        """Extrai e salva o conteúdo de uma única URL.
+
+        Com ``resume``, um artigo já extraído é reaproveitado sem novo download.
+        """
+        if resume:
+            stored = self._stored(url)
+            if stored is not None:
+                return stored
+        return self._save(self._extract(url))
+
+    def execute(
+        self, urls: list[str], max_workers: int = 1, resume: bool = False
+    ) -> list[NewsArticle]:
+        """Extrai conteúdo de uma lista de URLs, na ordem de entrada."""
+        if max_workers <= 1:
+            articles = []
+            for url in urls:
+                articles.append(self.extract_one(url, resume))
+            return articles
 
-    def execute(self, urls: list[str]) -> list[NewsArticle]:
-        """Extrai conteúdo de uma lista de URLs."""
-        articles = []
+        ordered: list[NewsArticle | None] = [None] * len(urls)
+        for index, article in self.execute_as_completed(urls, max_workers, resume):
+            ordered[index] = article
+        return [article for article in ordered if article is not None]
 
-        for url in urls:
-            content = self._scraping_repo.extract_content(url)
-            article = NewsArticle(id=str(uuid.uuid4()), url=url, content=content)
-            articles.append(article)
-            self._news_repo.save(article)
+    def execute_as_completed(
+        self, urls: list[str], max_workers: int = 8, resume: bool = False
+    ) -> Iterator[tuple[int, NewsArticle]]:
+        """Extrai as URLs em paralelo e gera ``(índice, artigo)`` conforme concluem.
 
-        return articles
+        O índice é a posição da URL em ``urls``, o que permite reconstruir a
+        ordem de entrada. Os artigos são salvos na thread que consome o
+        gerador, à medida que ficam prontos. Com ``resume``, artigos já
+        extraídos são gerados primeiro, sem novo download.
+        """
+        pending: list[tuple[int, str]] = []
+        for index, url in enumerate(urls):
+            stored = self._stored(url) if resume else None
+            if stored is not None:
+                yield index, stored
+            else:
+                pending.append((index, url))
 
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(self._extract, url): index for index, url in pending
+            }
+            for future in as_completed(futures):
+                yield futures[future], self._save(future.result())
+        finally:
+            # Se o consumidor parar antes do fim, não inicia as URLs pendentes
+            executor.shutdown(wait=True, cancel_futures=True)
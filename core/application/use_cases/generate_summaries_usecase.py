@@ -1,39 +1,292 @@
-from core.domain.entities.news_article import NewsArticle
-from core.domain.repositories.abstracts.abstract_ai_repository import AbstractAIRepository
-from core.domain.repositories.abstracts.abstract_new_repository import AbstractNewsRepository
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.application.services.token_estimator import (
+    chunk_sentences,
+    estimate_tokens,
+    truncate_to_budget,
+)
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+    SummaryGenerationError,
+    SummaryUnavailableError,
+)
+from core.domain.repositories.abstracts.abstract_batch_ai_repository import (
+    AbstractBatchAIRepository,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class GenerateSummariesUseCase:
-    """Caso de uso para gerar resumos das notícias."""
+    """Caso de uso para gerar resumos das notícias.
+
+    Com ``input_token_budget``, nenhuma requisição recebe mais que esse total
+    estimado de tokens de conteúdo: artigos maiores são truncados em fronteira
+    de frase ou, com ``map_reduce``, divididos em blocos resumidos em paralelo.
+    Os resumos parciais são combinados de ``max_chunks`` em ``max_chunks``, em
+    quantos níveis forem necessários, até restar um resumo final; nenhum
+    trecho do artigo é descartado.
+    """
 
     def __init__(
-        self, ai_repo: AbstractAIRepository, news_repo: AbstractNewsRepository
+        self,
+        ai_repo: AbstractAIRepository,
+        news_repo: AbstractNewsRepository,
+        batch_repo: AbstractBatchAIRepository | None = None,
+        save_batch_size: int = 500,
+        input_token_budget: int | None = None,
+        map_reduce: bool = False,
+        max_chunks: int = 4,
+        chunk_concurrency: int = 4,
+        min_input_tokens: int = 32,
+        metrics: MetricsRegistry | None = None,
     ):
         self._ai_repo = ai_repo
         self._news_repo = news_repo
+        self._batch_repo = batch_repo
+        self._save_batch_size = save_batch_size
+        self._input_token_budget = input_token_budget
+        self._map_reduce = map_reduce
+        self._max_chunks = max_chunks
+        self._chunk_concurrency = chunk_concurrency
+        self._min_input_tokens = min_input_tokens
+        self._metrics = metrics if metrics is not None else REGISTRY
 
-    def execute(self, articles: list[NewsArticle]) -> list[NewsArticle]:
-        """Gera resumos para uma lista de artigos."""
-        updated_articles = []
+    def _is_eligible(self, article: NewsArticle) -> bool:
+        return (
+            article.has_content
+            and estimate_tokens(article.content or "") >= self._min_input_tokens
+        )
 
-        for article in articles:
-            if not article.content or len(article.content) < 150:
-                continue
+    def _fit_to_budget(self, content: str) -> str:
+        """Trunca o conteúdo em fronteira de frase para caber no orçamento."""
+        if self._input_token_budget is None:
+            return content
+        return truncate_to_budget(content, self._input_token_budget)
+
+    def _summarize_content(self, content: str) -> str:
+        """Resume um conteúdo respeitando o orçamento de tokens de entrada."""
+        budget = self._input_token_budget
+        if budget is None or estimate_tokens(content) <= budget:
+            return self._ai_repo.generate_summary(content)
+        if not self._map_reduce:
+            return self._ai_repo.generate_summary(self._fit_to_budget(content))
+
+        # Map: resume todos os blocos; reduce: combina os parciais em grupos
+        # de até max_chunks, nível a nível, até sobrar um grupo
+        fan_in = max(2, self._max_chunks)
+        workers = max(1, self._chunk_concurrency)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            partials = list(
+                executor.map(
+                    self._ai_repo.generate_summary, chunk_sentences(content, budget)
+                )
+            )
+            while len(partials) > fan_in:
+                groups = [
+                    partials[start : start + fan_in]
+                    for start in range(0, len(partials), fan_in)
+                ]
+                partials = list(executor.map(self._reduce, groups))
+        return self._reduce(partials)
+
+    def _reduce(self, partials: list[str]) -> str:
+        """Resume a combinação de resumos parciais."""
+        combined = "\n\n".join(partials)
+        fitted = self._fit_to_budget(combined)
+        if fitted != combined:
+            # Os parciais de um grupo não couberam juntos no orçamento
+            self._metrics.inc("summaries_truncated_total", stage="reduce")
+        return self._ai_repo.generate_summary(fitted)
+
+    @staticmethod
+    def _is_done(article: NewsArticle) -> bool:
+        # Artigos resumidos em execuções anteriores não voltam para a API
+        return article.reached(ArticleStage.SUMMARIZED)
+
+    def _summarize(self, article: NewsArticle) -> NewsArticle | None:
+        """Gera o resumo de um artigo; ``None`` se não for possível agora.
 
-            summary = self._ai_repo.generate_summary(article.content)
-
-            # Criar novo artigo com resumo (imutabilidade)
-            updated_article = NewsArticle(
-                id=article.id,
-                url=article.url,
-                title=article.title,
-                content=article.content,
-                summary=summary,
-                published_date=article.published_date,
-                source=article.source,
+        Falhas são contadas em ``pipeline_errors_total`` e o artigo continua
+        sem resumo, para ser refeito na próxima execução.
+        """
+        try:
+            summary = self._summarize_content(article.content or "")
+        except (SummaryUnavailableError, SummaryGenerationError) as exc:
+            self._metrics.inc(
+                "pipeline_errors_total", stage="summarize", error=type(exc).__name__
             )
+            logger.warning("Resumo adiado para %s: %s", article.url, exc)
+            return None
+        return article.with_summary(summary)
 
-            updated_articles.append(updated_article)
+    def summarize_one(self, article: NewsArticle) -> NewsArticle | None:
+        """Resume e salva um único artigo; ``None`` se não for elegível ou adiado.
+
+        Um artigo que já tem resumo é devolvido sem nova chamada à API.
+        """
+        if self._is_done(article):
+            return article
+        if not self._is_eligible(article):
+            return None
+        updated_article = self._summarize(article)
+        if updated_article is not None:
             self._news_repo.save(updated_article)
+        return updated_article
+
+    def _summarize_group(self, group: list[NewsArticle]) -> list[NewsArticle]:
+        """Resume um grupo de artigos em uma única requisição."""
+        if len(group) == 1:
+            updated_article = self._summarize(group[0])
+            return [updated_article] if updated_article is not None else []
+
+        summaries = self._ai_repo.generate_summaries(
+            {
+                article.id: self._fit_to_budget(article.content or "")
+                for article in group
+            }
+        )
+        return [
+            article.with_summary(summaries[article.id])
+            for article in group
+            if article.id in summaries
+        ]
+
+    def _pack(
+        self, articles: list[NewsArticle], token_budget: int, max_pack_size: int
+    ) -> list[list[NewsArticle]]:
+        """Agrupa artigos consecutivos sem ultrapassar o orçamento de tokens."""
+        groups: list[list[NewsArticle]] = []
+        current: list[NewsArticle] = []
+        current_tokens = 0
+        for article in articles:
+            tokens = estimate_tokens(article.content or "")
+            if self._input_token_budget is not None:
+                tokens = min(tokens, self._input_token_budget)
+            if current and (
+                current_tokens + tokens > token_budget or len(current) >= max_pack_size
+            ):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(article)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    def execute(
+        self,
+        articles: list[NewsArticle],
+        max_concurrency: int = 1,
+        pack_token_budget: int | None = None,
+        max_pack_size: int = 8,
+    ) -> list[NewsArticle]:
+        """Gera resumos para uma lista de artigos, na ordem de entrada.
+
+        Com ``max_concurrency > 1`` as chamadas à API são feitas em paralelo;
+        o controle de taxa fica a cargo do repositório de IA. Com
+        ``pack_token_budget``, artigos curtos são agrupados em uma mesma
+        requisição até esse total estimado de tokens de entrada. Artigos cujo
+        resumo foi adiado por limite de taxa não são salvos nem retornados;
+        artigos já resumidos são retornados sem nova chamada à API.
+        """
+        done = {article.id for article in articles if self._is_done(article)}
+        eligible = [
+            article
+            for article in articles
+            if article.id not in done and self._is_eligible(article)
+        ]
+        if pack_token_budget:
+            groups = self._pack(eligible, pack_token_budget, max_pack_size)
+        else:
+            groups = [[article] for article in eligible]
+
+        if max_concurrency <= 1:
+            summarized: dict[str, NewsArticle] = {}
+            for group in groups:
+                for updated_article in self._summarize_group(group):
+                    summarized[updated_article.id] = updated_article
+                    self._news_repo.save(updated_article)
+            return self._in_input_order(articles, done, summarized)
+
+        ordered: list[list[NewsArticle]] = [[] for _ in groups]
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                executor.submit(self._summarize_group, group): index
+                for index, group in enumerate(groups)
+            }
+            for future in as_completed(futures):
+                updated_group = future.result()
+                ordered[futures[future]] = updated_group
+                for updated_article in updated_group:
+                    self._news_repo.save(updated_article)
+
+        return self._in_input_order(
+            articles,
+            done,
+            {article.id: article for group in ordered for article in group},
+        )
+
+    @staticmethod
+    def _in_input_order(
+        articles: list[NewsArticle],
+        done: set[str],
+        summarized: dict[str, NewsArticle],
+    ) -> list[NewsArticle]:
+        """Junta os artigos já resumidos e os novos resumos na ordem de entrada."""
+        return [
+            article if article.id in done else summarized[article.id]
+            for article in articles
+            if article.id in done or article.id in summarized
+        ]
+
+    def execute_batch(self, articles: list[NewsArticle]) -> list[NewsArticle]:
+        """Gera resumos pelo repositório de lote, na ordem de entrada.
+
+        Todas as requisições pendentes são enviadas em um único lote; os
+        resultados são associados aos artigos pelo ``custom_id`` (o ID do
+        artigo) e salvos em blocos de ``save_batch_size`` conforme chegam.
+        Artigos acima do orçamento de tokens são truncados (sem map-reduce).
+        """
+        if self._batch_repo is None:
+            raise ValueError("Nenhum repositório de lote configurado")
+
+        done = {article.id for article in articles if self._is_done(article)}
+        eligible = {
+            article.id: article
+            for article in articles
+            if article.id not in done and self._is_eligible(article)
+        }
+        if not eligible:
+            return self._in_input_order(articles, done, {})
+
+        batch_id = self._batch_repo.submit_batch(
+            {
+                article_id: self._fit_to_budget(article.content or "")
+                for article_id, article in eligible.items()
+            }
+        )
+        self._batch_repo.wait_for_batch(batch_id)
+
+        summarized: dict[str, NewsArticle] = {}
+        pending: list[NewsArticle] = []
+        for custom_id, summary in self._batch_repo.iter_results(batch_id):
+            article = eligible.get(custom_id)
+            if article is None:
+                continue
+            updated_article = article.with_summary(summary)
+            summarized[custom_id] = updated_article
+            pending.append(updated_article)
+            if len(pending) >= self._save_batch_size:
+                self._news_repo.save_batch(pending)
+                pending = []
+        if pending:
+            self._news_repo.save_batch(pending)
 
-        return updated_articles
+        return self._in_input_order(articles, done, summarized)
@@ -1,36 +1,68 @@
 
-from core.domain.entities.news_article import NewsArticle
+from core.domain.entities.news_article import ArticleStage, NewsArticle
 from core.domain.entities.training_example import TrainingExample
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
 
 
 class PrepareTrainingDataUseCase:
     """Caso de uso para preparar dados de treinamento."""
 
-    def execute(self, articles: list[NewsArticle]) -> list[TrainingExample]:
-        """Converte artigos em exemplos de treinamento."""
-        training_examples = []
+    def __init__(
+        self,
+        news_repo: AbstractNewsRepository | None = None,
+        save_batch_size: int = 500,
+    ):
+        self._news_repo = news_repo
+        self._save_batch_size = save_batch_size
 
+    def prepare_one(self, article: NewsArticle) -> TrainingExample | None:
+        """Converte um artigo em exemplo de treinamento, se for válido.
+
+        Verifica se o conteúdo e o resumo não estão nulos e se o resumo não
+        contém as palavras 'erro' ou 'insuficiente'.
         """
-        Para cada artigo, verifica se o conteúdo e o resumo não estão nulos e se o resumo não contém as palavras 'erro' ou 'insuficiente'.
-        Apenas artigos válidos são convertidos em exemplos de treinamento.
+        if not article.has_content or not article.summary:
+            return None
+
+        if (
+            "erro" in article.summary.lower()
+            or "insuficiente" in article.summary.lower()
+        ):
+            return None
+
+        try:
+            return TrainingExample.from_news_article(article)
+        except ValueError:
+            return None
+
+    def execute(self, articles: list[NewsArticle]) -> list[TrainingExample]:
+        """Converte artigos em exemplos de treinamento.
 
         Returns:
             list[TrainingExample]: Lista de exemplos de treinamento gerados a partir dos artigos válidos.
         """
+        training_examples = []
         for article in articles:
-            if not article.content or not article.summary:
-                continue
-
-            if (
-                "erro" in article.summary.lower()
-                or "insuficiente" in article.summary.lower()
-            ):
-                continue
-
-            try:
-                example = TrainingExample.from_news_article(article)
+            example = self.prepare_one(article)
+            if example is not None:
                 training_examples.append(example)
-            except ValueError:
-                continue
 
         return training_examples
+
+    def mark_exported(self, article_ids: list[str]) -> None:
+        """Marca os artigos como exportados depois que a saída foi publicada."""
+        if self._news_repo is None:
+            return
+        pending: list[NewsArticle] = []
+        for article_id in article_ids:
+            article = self._news_repo.find_by_id(article_id)
+            if article is None or article.reached(ArticleStage.EXPORTED):
+                continue
+            pending.append(article.with_stage(ArticleStage.EXPORTED))
+            if len(pending) >= self._save_batch_size:
+                self._news_repo.save_batch(pending)
+                pending = []
+        if pending:
+            self._news_repo.save_batch(pending)
@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 
 from core.domain.repositories.abstracts.abstract_scraping_repository import (
     AbstractScrapingRepository,
@@ -11,6 +12,39 @@ class ScrapeNewsLinksUseCase:
     def __init__(self, scraping_repo: AbstractScrapingRepository):
         self._scraping_repo = scraping_repo
 
+    @staticmethod
+    def date_range(days_ago: int = 1, days: int = 1) -> tuple[date, date]:
+        """Intervalo de ``days`` dias terminando ``days_ago`` dias atrás."""
+        end_date = (datetime.now() - timedelta(days=days_ago)).date()
+        return end_date - timedelta(days=days - 1), end_date
+
     def execute(self, base_url: str, days_ago: int = 1) -> list[str]:
+        """Coleta os links de uma página publicados ``days_ago`` dias atrás."""
         target_date = datetime.now() - timedelta(days=days_ago)
         return self._scraping_repo.scrape_news_links(base_url, target_date)
+
+    def execute_frontier(
+        self,
+        section_urls: list[str],
+        start_date: date,
+        end_date: date,
+        max_workers: int = 8,
+    ) -> list[str]:
+        """Coleta links de várias seções em paralelo, de um intervalo de datas.
+
+        Cada página de seção é baixada uma única vez para todo o intervalo;
+        os links das seções são unidos sem repetição, em ordem.
+        """
+        sections = list(dict.fromkeys(section_urls))
+        if not sections:
+            return []
+        workers = max(1, min(max_workers, len(sections)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda section_url: self._scraping_repo.scrape_news_links_in_range(
+                    section_url, start_date, end_date
+                ),
+                sections,
+            )
+            frontier = {link for links in results for link in links}
+        return sorted(frontier)
@@ -0,0 +1,50 @@
+import itertools
+from dataclasses import dataclass
+
+from core.domain.entities.news_article import NewsArticle
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from core.domain.repositories.abstracts.abstract_search_index import (
+    AbstractSearchIndex,
+)
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """Um artigo encontrado na busca e sua pontuação."""
+
+    article: NewsArticle
+    score: float
+
+
+class SearchArticlesUseCase:
+    """Caso de uso para buscar artigos no índice textual local."""
+
+    def __init__(self, index: AbstractSearchIndex, news_repo: AbstractNewsRepository):
+        self._index = index
+        self._news_repo = news_repo
+
+    def execute(self, query: str, k: int = 10) -> list[SearchResult]:
+        """Os ``k`` artigos mais relevantes, carregados do repositório.
+
+        Artigos indexados que não existem mais no repositório são omitidos.
+        """
+        results: list[SearchResult] = []
+        for hit in self._index.search(query, k):
+            article = self._news_repo.find_by_id(hit.article_id)
+            if article is not None:
+                results.append(SearchResult(article, hit.score))
+        return results
+
+    def reindex(self, batch_size: int = 1000) -> int:
+        """Indexa todo o repositório em lotes; retorna os artigos (re)indexados.
+
+        Artigos já indexados com o mesmo texto são ignorados pelo índice, então
+        a operação pode ser repetida para completar um índice existente.
+        """
+        indexed = 0
+        articles = self._news_repo.iter_all()
+        while batch := list(itertools.islice(articles, batch_size)):
+            indexed += self._index.add_batch(batch)
+        return indexed
@@ -0,0 +1,258 @@
+import queue
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.application.use_cases.deduplicate_articles_usecase import (
+    DeduplicateArticlesUseCase,
+)
+from core.application.use_cases.extract_news_content_usecase import (
+    ExtractNewsContentUseCase,
+)
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.application.use_cases.prepare_training_data_usecase import (
+    PrepareTrainingDataUseCase,
+)
+from core.application.use_cases.scrape_news_links_usecase import ScrapeNewsLinksUseCase
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.repositories.abstracts.abstract_training_data_writer import (
+    AbstractTrainingDataWriter,
+)
+
+# Marca o fim do fluxo em uma fila
+_DONE = object()
+
+
+@dataclass
+class PipelineResult:
+    """Contagem de itens que passaram por cada estágio."""
+
+    links: int = 0
+    extracted: int = 0
+    duplicates: int = 0
+    summarized: int = 0
+    examples: int = 0
+    exported_ids: list[str] = field(default_factory=list)
+    cancelled: bool = False
+
+
+class StreamingPipelineUseCase:
+    """Executa scrape → extract → dedupe → summarize → prepare → write em streaming.
+
+    Cada estágio roda em suas próprias threads, ligadas por filas limitadas:
+    a sumarização começa assim que o primeiro artigo é extraído, e quando um
+    estágio fica para trás as filas cheias bloqueiam os anteriores. A memória
+    fica limitada por ``queue_size`` itens por fila, não pelo tamanho do
+    corpus.
+
+    A duração de cada estágio por artigo vai para ``pipeline_stage_seconds``
+    e a ocupação das filas para ``pipeline_queue_depth``: uma fila que vive
+    cheia indica que o estágio seguinte é o gargalo.
+    """
+
+    def __init__(
+        self,
+        scrape_links_uc: ScrapeNewsLinksUseCase,
+        extract_content_uc: ExtractNewsContentUseCase,
+        generate_summaries_uc: GenerateSummariesUseCase,
+        prepare_data_uc: PrepareTrainingDataUseCase,
+        queue_size: int = 32,
+        extract_workers: int = 8,
+        summarize_workers: int = 4,
+        deduplicate_uc: DeduplicateArticlesUseCase | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
+        self._scrape_links_uc = scrape_links_uc
+        self._extract_content_uc = extract_content_uc
+        self._generate_summaries_uc = generate_summaries_uc
+        self._prepare_data_uc = prepare_data_uc
+        self._queue_size = queue_size
+        self._extract_workers = extract_workers
+        self._summarize_workers = summarize_workers
+        self._deduplicate_uc = deduplicate_uc
+        self._metrics = metrics if metrics is not None else REGISTRY
+
+    def execute(
+        self,
+        section_urls: list[str],
+        writer: AbstractTrainingDataWriter,
+        days_ago: int = 1,
+        days: int = 1,
+        resume: bool = False,
+        incremental: bool = False,
+        until: ArticleStage = ArticleStage.EXPORTED,
+        cancel: threading.Event | None = None,
+        on_progress: Callable[[str, int], None] | None = None,
+    ) -> PipelineResult:
+        """Executa o pipeline e grava os exemplos em ``writer``.
+
+        Os links são coletados das seções em ``section_urls`` para os ``days``
+        dias que terminam ``days_ago`` dias atrás.
+
+        Com ``resume``, artigos já extraídos ou resumidos em execuções
+        anteriores não são baixados nem resumidos de novo. Com
+        ``incremental``, URLs cujos artigos já foram exportados são ignoradas.
+        ``until`` é o último estágio executado: com ``EXTRACTED``, por exemplo,
+        os artigos são baixados e salvos, mas não resumidos nem exportados.
+
+        ``on_progress`` recebe o nome do contador de ``PipelineResult`` e o
+        novo valor a cada atualização. Quando ``cancel`` é sinalizado, os
+        estágios param de consumir novos itens, os que já estão em andamento
+        terminam e o resultado parcial volta com ``cancelled=True``.
+
+        O ``writer`` não é fechado aqui; os IDs exportados ficam em
+        ``PipelineResult.exported_ids`` para serem marcados depois que a saída
+        for publicada. Se algum estágio falhar, os demais são interrompidos e
+        a exceção é relançada.
+        """
+        result = PipelineResult()
+        metrics = self._metrics
+        stop = threading.Event()
+        errors: list[BaseException] = []
+        counter_lock = threading.Lock()
+        urls: queue.Queue[Any] = queue.Queue(self._queue_size)
+        extracted: queue.Queue[Any] = queue.Queue(self._queue_size)
+        summarized: queue.Queue[Any] = queue.Queue(self._queue_size)
+        queue_names = {
+            id(urls): "urls",
+            id(extracted): "extracted",
+            id(summarized): "summarized",
+        }
+
+        def record_depth(target: queue.Queue[Any]) -> None:
+            name = queue_names[id(target)]
+            depth = target.qsize()
+            metrics.set_gauge("pipeline_queue_depth", depth, queue=name)
+            metrics.max_gauge("pipeline_queue_depth_max", depth, queue=name)
+
+        def stopped() -> bool:
+            return stop.is_set() or (cancel is not None and cancel.is_set())
+
+        def put(target: queue.Queue[Any], item: object) -> None:
+            # Espera com timeout para não travar se um estágio posterior falhar
+            while not stopped():
+                try:
+                    target.put(item, timeout=0.1)
+                    record_depth(target)
+                    return
+                except queue.Full:
+                    continue
+
+        def count(field: str, increment: int = 1) -> None:
+            with counter_lock:
+                value = getattr(result, field) + increment
+                setattr(result, field, value)
+            if on_progress is not None:
+                on_progress(field, value)
+
+        def guarded(target: Callable[[], None]) -> Callable[[], None]:
+            def run() -> None:
+                try:
+                    target()
+                except BaseException as exc:
+                    errors.append(exc)
+                    stop.set()
+
+            return run
+
+        def produce() -> None:
+            start_date, end_date = self._scrape_links_uc.date_range(days_ago, days)
+            links = self._scrape_links_uc.execute_frontier(
+                section_urls, start_date, end_date
+            )
+            count("links", len(links))
+            if until == ArticleStage.SCRAPED:
+                return
+            if incremental:
+                links = self._extract_content_uc.pending_urls(links)
+            for url in links:
+                put(urls, url)
+
+        def consume(
+            source: queue.Queue[Any],
+            handle: Callable[[Any], Iterable[Any]],
+            target: queue.Queue[Any] | None,
+        ) -> None:
+            while not stopped():
+                try:
+                    item = source.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                record_depth(source)
+                if item is _DONE:
+                    return
+                for output in handle(item):
+                    if target is not None:
+                        put(target, output)
+
+        def extract(url: str) -> Iterable[NewsArticle]:
+            with metrics.time("pipeline_stage_seconds", stage="extract"):
+                article = self._extract_content_uc.extract_one(url, resume)
+            count("extracted")
+            if self._deduplicate_uc is not None:
+                with metrics.time("pipeline_stage_seconds", stage="dedupe"):
+                    duplicate_of = self._deduplicate_uc.duplicate_of(article)
+                if duplicate_of is not None:
+                    count("duplicates")
+                    return []
+            return [article] if until.rank > ArticleStage.EXTRACTED.rank else []
+
+        def summarize(article: NewsArticle) -> Iterable[NewsArticle]:
+            with metrics.time("pipeline_stage_seconds", stage="summarize"):
+                updated_article = self._generate_summaries_uc.summarize_one(article)
+            if updated_article is None:
+                return []
+            count("summarized")
+            return [updated_article] if until == ArticleStage.EXPORTED else []
+
+        def write(article: NewsArticle) -> Iterable[None]:
+            with metrics.time("pipeline_stage_seconds", stage="write"):
+                example = self._prepare_data_uc.prepare_one(article)
+                if example is not None:
+                    writer.write(example)
+            if example is not None:
+                count("examples")
+                result.exported_ids.append(article.id)
+            return []
+
+        def start(target: Callable[[], None], workers: int) -> list[threading.Thread]:
+            threads = [
+                threading.Thread(target=guarded(target), daemon=True)
+                for _ in range(workers)
+            ]
+            for thread in threads:
+                thread.start()
+            return threads
+
+        producer = start(produce, 1)
+        extractors = start(
+            lambda: consume(urls, extract, extracted), self._extract_workers
+        )
+        summarizers = start(
+            lambda: consume(extracted, summarize, summarized), self._summarize_workers
+        )
+        writers = start(lambda: consume(summarized, write, None), 1)
+
+        # Encerra cada estágio na ordem: quando todos os workers de um estágio
+        # terminam, um sentinela por worker é enviado ao estágio seguinte.
+        stages = [
+            (producer, urls, self._extract_workers),
+            (extractors, extracted, self._summarize_workers),
+            (summarizers, summarized, 1),
+            (writers, None, 0),
+        ]
+        for threads, downstream, downstream_workers in stages:
+            for thread in threads:
+                thread.join()
+            if downstream is not None:
+                for _ in range(downstream_workers):
+                    put(downstream, _DONE)
+
+        if errors:
+            raise errors[0]
+        result.cancelled = cancel is not None and cancel.is_set()
+        return result
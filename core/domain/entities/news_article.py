@@ -1,21 +1,186 @@
-from dataclasses import dataclass
+import sys
+import uuid
+from collections.abc import Callable
+from dataclasses import FrozenInstanceError
 from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+
+class ArticleStage(StrEnum):
+    """Estágio do pipeline já concluído para um artigo, em ordem."""
+
+    SCRAPED = "scraped"
+    EXTRACTED = "extracted"
+    SUMMARIZED = "summarized"
+    EXPORTED = "exported"
+
+    @property
+    def rank(self) -> int:
+        return list(ArticleStage).index(self)
+
+    @classmethod
+    def infer(cls, content: str | None, summary: str | None) -> "ArticleStage":
+        """Deduz o estágio de registros gravados antes de existir o campo."""
+        if summary:
+            return cls.SUMMARIZED
+        if content:
+            return cls.EXTRACTED
+        return cls.SCRAPED
+
+
+class LazyContent:
+    """Referência ao conteúdo de um artigo guardado em um repositório.
+
+    O texto é lido com ``loader(article_id)`` a cada acesso e não fica
+    retido, então listas grandes de artigos não carregam os corpos. Só deve
+    ser criada para artigos com conteúdo não vazio.
+    """
+
+    __slots__ = ("_loader", "_article_id")
+
+    def __init__(self, loader: Callable[[str], str | None], article_id: str):
+        self._loader = loader
+        self._article_id = article_id
+
+    def load(self) -> str | None:
+        """Lê o conteúdo atual no repositório."""
+        return self._loader(self._article_id)
+
+    def __repr__(self) -> str:
+        return f"LazyContent({self._article_id!r})"
+
+
+_FIELDS = (
+    "id",
+    "url",
+    "title",
+    "content",
+    "summary",
+    "published_date",
+    "source",
+    "stage",
+)
 
 
-@dataclass(frozen=True)
 class NewsArticle:
-    """Entidade de domínio representando um artigo de notícia."""
+    """Entidade de domínio representando um artigo de notícia.
+
+    Imutável e com ``__slots__``: cada instância ocupa só os seus campos, e
+    ``source`` é internado para que milhares de artigos compartilhem a mesma
+    string. ``content`` pode ser uma ``LazyContent``, lida do repositório
+    apenas quando acessada; ``with_summary`` e ``with_stage`` repassam a
+    referência sem carregar o texto.
+    """
+
+    __slots__ = (
+        "id",
+        "url",
+        "title",
+        "_content",
+        "summary",
+        "published_date",
+        "source",
+        "stage",
+    )
 
     id: str
     url: str
-    title: str | None = None
-    content: str | None = None
-    summary: str | None = None
-    published_date: datetime | None = None
-    source: str = "CNN"
-
-    def __post_init__(self):
-        if not self.url:
+    title: str | None
+    _content: "str | LazyContent | None"
+    summary: str | None
+    published_date: datetime | None
+    source: str
+    stage: ArticleStage
+
+    def __init__(
+        self,
+        id: str,
+        url: str,
+        title: str | None = None,
+        content: "str | LazyContent | None" = None,
+        summary: str | None = None,
+        published_date: datetime | None = None,
+        source: str = "CNN",
+        stage: ArticleStage = ArticleStage.SCRAPED,
+    ) -> None:
+        if not url:
             raise ValueError("URL é obrigatória")
-        if not self.id:
+        if not id:
             raise ValueError("ID é obrigatório")
+        init = object.__setattr__
+        init(self, "id", id)
+        init(self, "url", url)
+        init(self, "title", title)
+        init(self, "_content", content)
+        init(self, "summary", summary)
+        init(self, "published_date", published_date)
+        init(self, "source", sys.intern(source))
+        init(self, "stage", stage)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    @property
+    def content(self) -> str | None:
+        """Texto do artigo, lido do repositório se for uma ``LazyContent``."""
+        content = self._content
+        if isinstance(content, LazyContent):
+            return content.load()
+        return content
+
+    @property
+    def has_content(self) -> bool:
+        """Indica se há conteúdo, sem carregá-lo."""
+        return bool(self._content)
+
+    def _values(self) -> tuple[object, ...]:
+        return tuple(getattr(self, name) for name in _FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, NewsArticle)
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((self.id, self.url, self.stage))
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name if name != 'content' else '_content')!r}"
+            for name in _FIELDS
+        )
+        return f"NewsArticle({values})"
+
+    def __reduce__(self) -> tuple[type["NewsArticle"], tuple[object, ...]]:
+        # O conteúdo é resolvido: a referência ao repositório não é serializável
+        return (self.__class__, self._values())
+
+    @staticmethod
+    def id_for_url(url: str) -> str:
+        """ID determinístico de um artigo: a mesma URL gera sempre o mesmo ID."""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, url.strip().split("#", 1)[0]))
+
+    def reached(self, stage: ArticleStage) -> bool:
+        """Indica se o artigo já concluiu ``stage``."""
+        return self.stage.rank >= stage.rank
+
+    def _copy(self, **changes: Any) -> "NewsArticle":
+        values = {
+            name: getattr(self, name if name != "content" else "_content")
+            for name in _FIELDS
+        }
+        values.update(changes)
+        return NewsArticle(**values)
+
+    def with_stage(self, stage: ArticleStage) -> "NewsArticle":
+        """Cópia do artigo no estágio ``stage``."""
+        return self._copy(stage=stage)
+
+    def with_summary(self, summary: str) -> "NewsArticle":
+        """Cópia resumida do artigo, compartilhando o conteúdo sem lê-lo."""
+        return self._copy(summary=summary, stage=ArticleStage.SUMMARIZED)
@@ -2,6 +2,13 @@ from dataclasses import dataclass
 
 from core.domain.entities.news_article import NewsArticle
 
+# Marcadores que delimitam a notícia e o resumo no texto de treinamento
+NEWS_START = "[|News|]"
+NEWS_END = "[|eNews|]"
+SUMMARY_START = "[|summary|]"
+SUMMARY_END = "[|esummary|]"
+MARKERS = (NEWS_START, NEWS_END, SUMMARY_START, SUMMARY_END)
+
 
 @dataclass(frozen=True)
 class TrainingExample:
@@ -12,12 +19,14 @@ class TrainingExample:
     @classmethod
     def from_news_article(cls, article: "NewsArticle") -> "TrainingExample":
         """Cria um exemplo de treinamento a partir de um artigo."""
-        if not article.content or not article.summary:
+        # Lido uma vez: o conteúdo pode vir do repositório sob demanda
+        content = article.content
+        if not content or not article.summary:
             raise ValueError("Artigo deve ter conteúdo e resumo")
 
         formatted_text = (
             f"SUMMARIZE THIS NEWS.\n"
-            f"[|News|] {article.content}[|eNews|]\n\n"
-            f"[|summary|]{article.summary}[|esummary|]"
+            f"{NEWS_START} {content}{NEWS_END}\n\n"
+            f"{SUMMARY_START}{article.summary}{SUMMARY_END}"
         )
         return cls(input_text=formatted_text)
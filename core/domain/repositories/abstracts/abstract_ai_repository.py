@@ -1,4 +1,32 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+class SummaryUnavailableError(Exception):
+    """O resumo não pôde ser gerado agora (ex.: limite de taxa esgotado).
+
+    O artigo deve ser mantido sem resumo para ser processado em outra execução.
+    """
+
+
+class SummaryGenerationError(Exception):
+    """A API respondeu, mas não produziu um resumo utilizável.
+
+    Cobre respostas vazias ou fora do formato e erros não transitórios da
+    API. Assim como em ``SummaryUnavailableError``, o artigo fica sem resumo.
+    """
+
+
+@dataclass(frozen=True)
+class PackedSummaries:
+    """Resumos de um lote, separados pelo prompt que os gerou.
+
+    ``packed`` veio da requisição agrupada (``packed_generation_params``);
+    ``individual``, de chamadas por artigo (``generation_params``).
+    """
+
+    packed: dict[str, str]
+    individual: dict[str, str]
 
 
 class AbstractAIRepository(ABC):
@@ -8,3 +36,43 @@ class AbstractAIRepository(ABC):
     def generate_summary(self, content: str) -> str:
         """Gera resumo para um conteúdo."""
         pass
+
+    def generation_params(self) -> dict[str, object]:
+        """Parâmetros que determinam o resumo gerado (modelo, prompt, etc.).
+
+        Usados para compor chaves de cache; implementações que não os expõem
+        retornam um dicionário vazio.
+        """
+        return {}
+
+    def packed_generation_params(self) -> dict[str, object]:
+        """Parâmetros dos resumos gerados por ``generate_summaries``.
+
+        Adaptadores que agrupam artigos com outro prompt devem incluí-lo
+        aqui, para que esses resumos não se misturem aos individuais no
+        cache. A implementação padrão resume um a um, com os mesmos
+        parâmetros de ``generation_params``.
+        """
+        return self.generation_params()
+
+    def generate_summaries(self, contents: dict[str, str]) -> dict[str, str]:
+        """Gera resumos para vários conteúdos, indexados pela mesma chave.
+
+        Chaves ausentes no resultado tiveram o resumo adiado ou falharam.
+        """
+        result = self.generate_packed_summaries(contents)
+        return {**result.packed, **result.individual}
+
+    def generate_packed_summaries(self, contents: dict[str, str]) -> PackedSummaries:
+        """Como ``generate_summaries``, informando o prompt de cada resumo.
+
+        A implementação padrão faz uma chamada por conteúdo; adaptadores podem
+        agrupá-los em uma única requisição.
+        """
+        summaries = {}
+        for key, content in contents.items():
+            try:
+                summaries[key] = self.generate_summary(content)
+            except (SummaryUnavailableError, SummaryGenerationError):
+                continue
+        return PackedSummaries(packed={}, individual=summaries)
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+
+class AbstractBatchAIRepository(ABC):
+    """Repositório abstrato para geração de resumos em lote (offline)."""
+
+    @abstractmethod
+    def submit_batch(self, contents: dict[str, str]) -> str:
+        """Envia um lote ``custom_id -> conteúdo`` e retorna o ID do lote."""
+        pass
+
+    @abstractmethod
+    def wait_for_batch(self, batch_id: str) -> None:
+        """Aguarda a conclusão do lote.
+
+        Levanta ``SummaryUnavailableError`` se o lote falhar, expirar ou for
+        cancelado.
+        """
+        pass
+
+    @abstractmethod
+    def iter_results(self, batch_id: str) -> Iterator[tuple[str, str]]:
+        """Gera ``(custom_id, resumo)`` para cada requisição bem-sucedida."""
+        pass
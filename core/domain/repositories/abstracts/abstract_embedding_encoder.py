@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+
+
+class EmbeddingUnavailableError(Exception):
+    """Os vetores não puderam ser gerados (por exemplo, falha na API)."""
+
+
+class AbstractEmbeddingEncoder(ABC):
+    """Codifica textos em vetores densos de dimensão fixa."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Identifica o modelo e seus parâmetros.
+
+        Vetores de codificadores com nomes diferentes não são comparáveis, e o
+        nome é gravado junto do índice para evitar misturá-los.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Quantidade de componentes de cada vetor."""
+        pass
+
+    @abstractmethod
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        """Um vetor por texto, na mesma ordem, em uma ou poucas chamadas."""
+        pass
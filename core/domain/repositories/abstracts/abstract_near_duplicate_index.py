@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractNearDuplicateIndex(ABC):
+    """Índice persistente de assinaturas MinHash para detectar quase-duplicatas."""
+
+    @abstractmethod
+    def find_or_add(
+        self, article_id: str, signature: list[int], threshold: float
+    ) -> str | None:
+        """Retorna o ID de um artigo já indexado com similaridade >= ``threshold``.
+
+        Se não houver nenhum, indexa o artigo e retorna ``None``. A operação é
+        atômica, para que dois artigos iguais processados em paralelo não
+        passem ambos como únicos. Um artigo já indexado com o mesmo ID nunca é
+        duplicata de si mesmo.
+        """
+        pass
@@ -1,7 +1,104 @@
+import itertools
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from typing import Any
 
 from core.domain.entities.news_article import NewsArticle
 
+# Campos que podem ser pedidos em uma projeção
+ARTICLE_FIELDS = (
+    "id",
+    "url",
+    "title",
+    "content",
+    "summary",
+    "published_date",
+    "source",
+    "stage",
+)
+
+
+def naive_utc(value: datetime) -> datetime:
+    """Data em UTC sem fuso; datas sem fuso já são consideradas UTC.
+
+    É a forma usada para comparar e gravar datas de publicação, para que
+    filtros com fuso (``...Z``) funcionem sobre datas salvas sem ele.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class ArticleQuery:
+    """Filtros e posição de uma leitura em ordem de ID (paginação por chave).
+
+    ``after_id`` é exclusivo: a leitura continua a partir do primeiro ID maior
+    que ele. ``published_to`` também é exclusivo. As datas são normalizadas
+    com ``naive_utc``.
+    """
+
+    source: str | None = None
+    published_from: datetime | None = None
+    published_to: datetime | None = None
+    after_id: str | None = None
+    limit: int | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("published_from", "published_to"):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, naive_utc(value))
+
+    def matches(self, article: NewsArticle) -> bool:
+        """Indica se o artigo atende aos filtros (o limite não é considerado)."""
+        if self.after_id is not None and article.id <= self.after_id:
+            return False
+        if self.source is not None and article.source != self.source:
+            return False
+        if self.published_from is not None or self.published_to is not None:
+            if article.published_date is None:
+                return False
+            published = naive_utc(article.published_date)
+            if self.published_from is not None and published < self.published_from:
+                return False
+            if self.published_to is not None and published >= self.published_to:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class ArticlePage:
+    """Uma página de registros projetados e o ID a partir do qual continuar."""
+
+    records: list[dict[str, Any]]
+    next_after_id: str | None
+
+
+def check_fields(fields: Sequence[str] | None) -> tuple[str, ...]:
+    """Valida a projeção; ``None`` significa todos os campos."""
+    if fields is None:
+        return ARTICLE_FIELDS
+    unknown = [name for name in fields if name not in ARTICLE_FIELDS]
+    if unknown:
+        raise ValueError(f"Campos desconhecidos: {', '.join(unknown)}")
+    return tuple(dict.fromkeys(fields))
+
+
+def project(article: NewsArticle, fields: Sequence[str]) -> dict[str, Any]:
+    """Registro com os campos pedidos, em tipos serializáveis em JSON."""
+    record: dict[str, Any] = {}
+    for name in fields:
+        value = getattr(article, name)
+        if name == "published_date" and value is not None:
+            value = value.isoformat()
+        elif name == "stage":
+            value = value.value
+        record[name] = value
+    return record
+
 
 class AbstractNewsRepository(ABC):
     """Repositório abstrato para artigos de notícia."""
@@ -21,6 +118,60 @@ class AbstractNewsRepository(ABC):
         """Retorna todos os artigos."""
         pass
 
+    def iter_all(self) -> Iterator[NewsArticle]:
+        """Percorre todos os artigos; implementações podem evitar a lista."""
+        yield from self.find_all()
+
+    def iter_articles(self, query: ArticleQuery | None = None) -> Iterator[NewsArticle]:
+        """Percorre, em ordem de ID, os artigos que atendem à consulta.
+
+        A implementação padrão ordena ``iter_all`` em memória; adaptadores
+        devem sobrescrevê-la com uma leitura ordenada e preguiçosa.
+        """
+        query = query or ArticleQuery()
+        articles = (
+            article
+            for article in sorted(self.iter_all(), key=lambda article: article.id)
+            if query.matches(article)
+        )
+        yield from itertools.islice(articles, query.limit)
+
+    def iter_projected(
+        self, query: ArticleQuery | None = None, fields: Sequence[str] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Como ``iter_articles``, mas gera apenas os campos pedidos.
+
+        Adaptadores podem sobrescrevê-la para não ler as colunas omitidas
+        (por exemplo, ``content``).
+        """
+        selected = check_fields(fields)
+        for article in self.iter_articles(query):
+            yield project(article, selected)
+
+    def find_page(
+        self,
+        query: ArticleQuery | None = None,
+        limit: int = 100,
+        fields: Sequence[str] | None = None,
+    ) -> ArticlePage:
+        """Uma página de até ``limit`` registros a partir de ``query.after_id``.
+
+        ``next_after_id`` é ``None`` na última página; caso contrário, deve
+        ser passado como ``after_id`` da consulta seguinte.
+        """
+        if limit < 1:
+            raise ValueError("limit deve ser positivo")
+        selected = check_fields(fields)
+        with_id = selected if "id" in selected else ("id", *selected)
+        query = replace(query or ArticleQuery(), limit=limit + 1)
+        records = list(self.iter_projected(query, with_id))
+        next_after_id = records[limit - 1]["id"] if len(records) > limit else None
+        records = records[:limit]
+        if "id" not in selected:
+            for record in records:
+                del record["id"]
+        return ArticlePage(records, next_after_id)
+
     @abstractmethod
     def save_batch(self, articles: list[NewsArticle]) -> None:
         """Salva múltiplos artigos."""
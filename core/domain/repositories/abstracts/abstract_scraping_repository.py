@@ -1,5 +1,13 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta
+
+
+class ContentUnavailableError(Exception):
+    """A página do artigo não pôde ser baixada (ex.: falha de rede).
+
+    O artigo deve ser mantido como apenas coletado para ser refeito depois.
+    """
 
 
 class AbstractScrapingRepository(ABC):
@@ -10,7 +18,52 @@ class AbstractScrapingRepository(ABC):
         """Extrai links de notícias de uma data específica."""
         pass
 
+    def scrape_news_links_in_range(
+        self, base_url: str, start_date: date, end_date: date
+    ) -> list[str]:
+        """Extrai links de notícias publicadas entre duas datas (inclusive).
+
+        A implementação padrão consulta a página uma vez por dia; adaptadores
+        podem sobrescrevê-la para filtrar o intervalo em uma única requisição.
+        """
+        links: set[str] = set()
+        day = start_date
+        while day <= end_date:
+            links.update(
+                self.scrape_news_links(base_url, datetime.combine(day, time()))
+            )
+            day += timedelta(days=1)
+        return sorted(links)
+
     @abstractmethod
     def extract_content(self, url: str) -> str:
-        """Extrai conteúdo de um artigo específico."""
+        """Extrai conteúdo de um artigo específico.
+
+        Levanta ``ContentUnavailableError`` se a página não puder ser baixada.
+        """
+        pass
+
+
+class AbstractPageFetchingRepository(AbstractScrapingRepository):
+    """Scraping que separa o download da página do parsing do conteúdo.
+
+    Adaptadores com esta interface permitem que o parsing rode em outro
+    processo; os demais são usados apenas por ``extract_content``.
+    """
+
+    @abstractmethod
+    def fetch_page(self, url: str) -> bytes:
+        """Baixa o documento bruto de ``url``, sem interpretá-lo (etapa de I/O).
+
+        Falhas de rede levantam ``ContentUnavailableError``.
+        """
+        pass
+
+    @abstractmethod
+    def page_parser(self) -> Callable[[bytes], str]:
+        """Função que extrai o conteúdo do HTML baixado por ``fetch_page``.
+
+        Precisa ser uma função de módulo (serializável com ``pickle``) para
+        poder rodar em outro processo.
+        """
         pass
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from core.domain.entities.news_article import NewsArticle
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """Um artigo encontrado e sua pontuação de relevância."""
+
+    article_id: str
+    score: float
+
+
+class AbstractSearchIndex(ABC):
+    """Índice de busca textual sobre os artigos."""
+
+    @abstractmethod
+    def add_batch(self, articles: list[NewsArticle]) -> int:
+        """Indexa os artigos, substituindo versões anteriores do mesmo ID.
+
+        Retorna quantos artigos foram (re)indexados; artigos cujo texto não
+        mudou desde a última indexação são ignorados.
+        """
+        pass
+
+    @abstractmethod
+    def search(self, query: str, k: int = 10) -> list[SearchHit]:
+        """Os ``k`` artigos mais relevantes para a consulta, do melhor ao pior."""
+        pass
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractTokenizer(ABC):
+    """Tokenizador local usado para pré-tokenizar os dados de treinamento.
+
+    Os marcadores de ``training_example.MARKERS`` devem ser tokens únicos,
+    para que os limites entre notícia e resumo sejam localizáveis nos IDs.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Identificador gravado nos metadados da exportação."""
+        pass
+
+    @property
+    @abstractmethod
+    def vocab_size(self) -> int:
+        """Quantidade de IDs possíveis, incluindo os tokens especiais."""
+        pass
+
+    @property
+    @abstractmethod
+    def special_tokens(self) -> dict[str, int]:
+        """IDs dos marcadores e dos tokens ``<pad>`` e ``<eos>``."""
+        pass
+
+    @abstractmethod
+    def encode(self, text: str) -> list[int]:
+        """Converte texto em IDs de tokens."""
+        pass
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+from core.domain.entities.training_example import TrainingExample
+
+
+class AbstractTrainingDataWriter(ABC):
+    """Destino abstrato para exemplos de treinamento gravados em streaming."""
+
+    @abstractmethod
+    def write(self, example: TrainingExample) -> None:
+        """Grava um exemplo."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finaliza a gravação; os dados só são garantidos após o close."""
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Descarta a gravação sem publicar; a saída anterior fica intacta."""
+        pass
+
+    def __enter__(self) -> "AbstractTrainingDataWriter":
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        # Uma exceção no bloco não pode substituir a última saída válida
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
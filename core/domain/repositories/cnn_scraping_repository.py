@@ -1,108 +1,209 @@
+import html as html_lib
 import json
-from datetime import datetime
+import re
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
 from typing import List
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
+from core.application.services.metrics import REGISTRY, MetricsRegistry
 from core.domain.repositories.abstracts.abstract_scraping_repository import (
-    AbstractScrapingRepository,
+    AbstractPageFetchingRepository,
+    ContentUnavailableError,
 )
+from core.infrastructure.http.host_throttle import HostThrottle
+from core.infrastructure.http.response_cache import CachedResponse, HTTPResponseCache
 
+# Links de artigos datados: /AAAA/MM/DD/..., relativos ou absolutos na CNN
+_DATED_LINK = re.compile(
+    r"href\s*=\s*[\"'](?:https?://(?:edition|www)\.cnn\.com)?"
+    r"(/(\d{4})/(\d{1,2})/(\d{1,2})(?:/[^\"'#?]*)?)[\"'#?]"
+)
+
+# Blocos <script type="application/ld+json">; o conteúdo de <script> é texto
+# bruto em HTML, então não há entidades a decodificar.
+_JSON_LD_SCRIPT = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>"
+    r"(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
 
-class CNNScrapingRepository(AbstractScrapingRepository):
-    """Implementação concreta para scraping da CNN."""
 
-    def __init__(self):
+def _json_ld_article_body(html: str) -> str | None:
+    """Caminho rápido: busca ``articleBody`` nos blocos JSON-LD sem montar a DOM."""
+    for match in _JSON_LD_SCRIPT.finditer(html):
+        try:
+            data = json.loads(match.group(1))
+        except (json.JSONDecodeError, TypeError):
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if isinstance(item, dict) and "articleBody" in item:
+                return str(item["articleBody"])
+    return None
+
+
+def _html_article_body(html: str) -> str | None:
+    """Fallback: monta a árvore completa e junta os parágrafos do artigo."""
+    soup = BeautifulSoup(html, "html.parser")
+    main_container = soup.find("div", class_="article__content-container")
+    if not main_container:
+        main_container = soup.find("div", class_="article__content")
+    if main_container:
+        paragraphs = main_container.find_all(
+            "div", {"data-component-name": "paragraph"}
+        )
+        if not paragraphs:
+            paragraphs = main_container.find_all("p", class_="paragraph")
+
+        if paragraphs:
+            return " ".join(p.get_text(strip=True) for p in paragraphs)
+    return None
+
+
+def parse_article_content(html: str) -> str:
+    """Extrai o texto de um artigo da CNN a partir do HTML da página."""
+    # Método preferencial: JSON-LD
+    content = _json_ld_article_body(html)
+    if content is None:
+        content = _html_article_body(html)
+    return content if content is not None else "Conteúdo não encontrado"
+
+
+def parse_article_bytes(raw: bytes) -> str:
+    """Extrai o texto de um artigo a partir do HTML bruto (as páginas são UTF-8).
+
+    Recebe ``bytes`` para que a decodificação também aconteça no processo de
+    parsing, e não na thread que fez o download.
+    """
+    return parse_article_content(raw.decode("utf-8", errors="replace"))
+
+
+class CNNScrapingRepository(AbstractPageFetchingRepository):
+    """Implementação concreta para scraping da CNN.
+
+    Todas as requisições compartilham uma ``requests.Session`` com pool de
+    conexões keep-alive, e o ``HostThrottle`` limita a concorrência e o
+    intervalo entre requisições por host. A instância pode ser usada por
+    várias threads ao mesmo tempo.
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = 8,
+        politeness_delay: float = 0.0,
+        pool_size: int = 32,
+        response_cache: HTTPResponseCache | None = None,
+        metrics: MetricsRegistry | None = None,
+    ):
         self._headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._throttle = HostThrottle(max_per_host, politeness_delay)
+        self._response_cache = response_cache
+        self._metrics = metrics if metrics is not None else REGISTRY
+
+    def _get(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> requests.Response:
+        """Executa um GET pelo pool de conexões respeitando o limite por host."""
+        with self._throttle.acquire(url):
+            with self._metrics.time("scrape_fetch_seconds"):
+                response = self._session.get(url, headers=headers, timeout=10)
+        self._metrics.inc("scrape_fetched_bytes_total", len(response.content))
+        return response
+
+    def _fetch_response(self, url: str) -> requests.Response | CachedResponse:
+        """Baixa ``url``, usando o cache de respostas se houver."""
+        cache = self._response_cache
+        if cache is None:
+            response = self._get(url)
+            response.raise_for_status()
+            return response
+
+        cached = cache.get(url)
+        if cached is not None and (cache.offline or cache.is_fresh(cached)):
+            return cached
+        if cache.offline:
+            raise requests.exceptions.ConnectionError(
+                f"Modo offline: {url} não está em cache"
+            )
+
+        headers = cache.conditional_headers(cached) if cached is not None else None
+        response = self._get(url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            cache.touch(cached)
+            return cached
+        response.raise_for_status()
+        return cache.put(url, response)
+
+    def _fetch(self, url: str) -> str:
+        """Baixa o HTML de ``url`` já decodificado."""
+        return self._fetch_response(url).text
+
+    def fetch_page(self, url: str) -> bytes:
+        """Baixa o HTML bruto do artigo, sem decodificar nem interpretar."""
+        try:
+            page = self._fetch_response(url)
+        except requests.exceptions.RequestException as e:
+            raise ContentUnavailableError(f"{url}: {e}") from e
+        return page.body if isinstance(page, CachedResponse) else page.content
+
+    def page_parser(self) -> Callable[[bytes], str]:
+        """Parser do HTML da CNN, executável em outro processo."""
+        return parse_article_bytes
 
     def scrape_news_links(self, base_url: str, target_date: datetime) -> List[str]:
         """Implementa scraping de links da CNN."""
+        day = target_date.date()
+        return self.scrape_news_links_in_range(base_url, day, day)
+
+    def scrape_news_links_in_range(
+        self, base_url: str, start_date: date, end_date: date
+    ) -> list[str]:
+        """Links da página publicados entre ``start_date`` e ``end_date``.
+
+        Uma única expressão pré-compilada percorre o HTML bruto e extrai os
+        links datados; a data é comparada com um conjunto de dias do
+        intervalo, sem montar a árvore do BeautifulSoup.
+        """
         try:
-            response = requests.get(base_url, headers=self._headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            valid_links = []
-
-            for a_tag in soup.find_all("a", href=True):
-                href = str(a_tag["href"])
-
-                # Filtro de vídeo
-                if "/video/" in href:
-                    continue
-
-                # Verificação de data na URL
-                path_parts = href.strip("/").split("/")
-                if (
-                    len(path_parts) >= 3
-                    and path_parts[0].isdigit()
-                    and len(path_parts[0]) == 4
-                ):
-                    try:
-                        url_year = int(path_parts[0])
-                        url_month = int(path_parts[1])
-                        url_day = int(path_parts[2])
-
-                        if (
-                            url_year == target_date.year
-                            and url_month == target_date.month
-                            and url_day == target_date.day
-                        ):
-                            full_link = f"https://edition.cnn.com{href}"
-                            valid_links.append(full_link)
-                    except (ValueError, IndexError):
-                        continue
-
-            return sorted(set(valid_links))
-
+            html = self._fetch(base_url)
         except requests.exceptions.RequestException as e:
             print(f"Error scraping news links from {base_url}: {e}")
             return []
 
+        target_days = {
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        }
+        valid_links = set()
+        for match in _DATED_LINK.finditer(html):
+            path, year, month, day = match.groups()
+            # Filtro de vídeo
+            if "/video/" in path:
+                continue
+            try:
+                url_date = date(int(year), int(month), int(day))
+            except ValueError:
+                continue
+            if url_date in target_days:
+                valid_links.add(f"https://edition.cnn.com{html_lib.unescape(path)}")
+        return sorted(valid_links)
+
     def extract_content(self, url: str) -> str:
         """Implementa extração de conteúdo da CNN."""
         try:
-            response = requests.get(url, headers=self._headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Método preferencial: JSON-LD
-            json_ld_scripts = soup.find_all("script", type="application/ld+json")
-            for script in json_ld_scripts:
-                try:
-                    if script.string is None:
-                        continue
-                    data = json.loads(script.string)
-                    if isinstance(data, list):
-                        for item in data:
-                            if isinstance(item, dict) and "articleBody" in item:
-                                return item["articleBody"]
-                    elif isinstance(data, dict) and "articleBody" in data:
-                        return data["articleBody"]
-                except (json.JSONDecodeError, TypeError):
-                    continue
-
-            # Fallback: HTML scraping
-            main_container = soup.find("div", class_="article__content-container")
-            if not main_container:
-                main_container = soup.find("div", class_="article__content")
-            if main_container:
-                paragraphs = main_container.find_all(
-                    "div", {"data-component-name": "paragraph"}
-                )
-                if not paragraphs:
-                    paragraphs = main_container.find_all("p", class_="paragraph")
-
-                if paragraphs:
-                    content = " ".join(p.get_text(strip=True) for p in paragraphs)
-                    return content
-
-            return "Conteúdo não encontrado"
+            html = self._fetch(url)
         except requests.exceptions.RequestException as e:
-            # Log the exception details for debugging
-            print(f"Erro de rede ao acessar {url}: {e}")
-            return f"Erro de rede: {e}"
-            return "Erro de rede"
+            raise ContentUnavailableError(f"{url}: {e}") from e
+        with self._metrics.time("scrape_parse_seconds", mode="inline"):
+            return parse_article_content(html)
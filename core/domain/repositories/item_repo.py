@@ -0,0 +1,29 @@
+"""Abstract repository for Item entities."""
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from core.domain.entities.item import Item
+
+
+class AbstractItemRepository(ABC):
+    """Abstract repository defining the persistence port for items."""
+
+    @abstractmethod
+    def save(self, item: Item) -> Item:
+        """Persist an item and return it."""
+        pass
+
+    @abstractmethod
+    def find_by_id(self, item_id: UUID) -> Item | None:
+        """Find an item by its ID."""
+        pass
+
+    @abstractmethod
+    def find_all(self) -> list[Item]:
+        """Retrieve all items."""
+        pass
+
+    @abstractmethod
+    def delete(self, item_id: UUID) -> bool:
+        """Delete an item by its ID; return whether it existed."""
+        pass
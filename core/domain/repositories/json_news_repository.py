@@ -1,36 +1,184 @@
 import json
 import os
-from typing import List, Optional
+import re
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any, BinaryIO
 
-from core.domain.entities.news_article import NewsArticle
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.domain.entities.news_article import ArticleStage, LazyContent, NewsArticle
 from core.domain.repositories.abstracts.abstract_new_repository import (
     AbstractNewsRepository,
+    ArticleQuery,
 )
 
+# Posição de um registro no log: (número do segmento, offset, tamanho em bytes)
+_Location = tuple[int, int, int]
+
 
 class JSONNewsRepository(AbstractNewsRepository):
-    """Implementação usando arquivo JSON."""
+    """Implementação log-structured usando segmentos JSONL append-only.
+
+    Cada gravação acrescenta uma linha JSON ao segmento ativo e o índice em
+    memória guarda apenas a posição do registro mais recente de cada artigo.
+    Um arquivo ``articles.json`` no formato antigo (objeto JSON) é migrado
+    para o primeiro segmento na primeira abertura.
+    """
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        compaction_ratio: float = 0.5,
+        min_compaction_bytes: int = 1024 * 1024,
+        metrics: MetricsRegistry | None = None,
+    ):
         self._file_path = file_path
-        self._articles = self._load_articles()
+        self._directory = os.path.dirname(file_path) or "."
+        self._prefix = os.path.splitext(os.path.basename(file_path))[0]
+        self._segment_pattern = re.compile(
+            rf"^{re.escape(self._prefix)}\.(\d{{6}})\.jsonl$"
+        )
+        self._max_segment_bytes = max_segment_bytes
+        self._compaction_ratio = compaction_ratio
+        self._min_compaction_bytes = min_compaction_bytes
+        self._lock = threading.RLock()
+        self._index: dict[str, _Location] = {}
+        self._segment_sizes: dict[int, int] = {}
+        self._dead_bytes = 0
+        self._active_segment = 1
+        self._metrics = metrics if metrics is not None else REGISTRY
+        # Um único método ligado compartilhado por todas as LazyContent
+        self._content_loader = self._load_content
+        self._load_articles()
 
-    def _load_articles(self) -> dict:
-        """Carrega artigos do arquivo JSON."""
-        if os.path.exists(self._file_path):
-            with open(self._file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+    # ------------------------------------------------------------------ #
+    # Segmentos
+    # ------------------------------------------------------------------ #
 
-    def _save_articles(self) -> None:
-        """Salva artigos no arquivo JSON."""
-        os.makedirs(os.path.dirname(self._file_path), exist_ok=True)
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            json.dump(self._articles, f, indent=4, ensure_ascii=False)
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self._directory, f"{self._prefix}.{segment:06d}.jsonl")
 
-    def save(self, article: NewsArticle) -> None:
-        """Salva um artigo."""
-        self._articles[article.id] = {
+    def _list_segments(self) -> list[int]:
+        if not os.path.isdir(self._directory):
+            return []
+        segments = []
+        for name in os.listdir(self._directory):
+            match = self._segment_pattern.match(name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    def _load_articles(self) -> None:
+        """Reconstrói o índice em memória a partir dos segmentos em disco."""
+        segments = self._list_segments()
+        if not segments and os.path.exists(self._file_path):
+            self._migrate_legacy_file()
+            segments = self._list_segments()
+
+        for position, segment in enumerate(segments):
+            is_last = position == len(segments) - 1
+            self._replay_segment(segment, truncate_tail=is_last)
+
+        if segments:
+            self._active_segment = segments[-1]
+
+    def _replay_segment(self, segment: int, truncate_tail: bool) -> None:
+        """Lê um segmento e atualiza o índice, descartando uma cauda corrompida.
+
+        Uma escrita interrompida por crash só pode deixar lixo no fim do
+        último segmento; nesse caso o arquivo é truncado no último registro
+        válido. Linhas inválidas em segmentos antigos são apenas ignoradas.
+        """
+        path = self._segment_path(segment)
+        valid_end = 0
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                length = len(line)
+                record = self._decode_line(line)
+                if record is None:
+                    if truncate_tail:
+                        break
+                    offset += length
+                    continue
+                self._index_record(record["id"], (segment, offset, length))
+                offset += length
+                valid_end = offset
+
+        size = os.path.getsize(path)
+        if truncate_tail and valid_end < size:
+            with open(path, "r+b") as f:
+                f.truncate(valid_end)
+                f.flush()
+                os.fsync(f.fileno())
+            size = valid_end
+        self._segment_sizes[segment] = size
+
+    @staticmethod
+    def _decode_line(line: bytes) -> dict[str, Any] | None:
+        if not line.endswith(b"\n"):
+            return None
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(record, dict) or not record.get("id"):
+            return None
+        return record
+
+    def _index_record(self, article_id: str, location: _Location) -> None:
+        previous = self._index.get(article_id)
+        if previous is not None:
+            self._dead_bytes += previous[2]
+        self._index[article_id] = location
+
+    def _migrate_legacy_file(self) -> None:
+        """Converte o ``articles.json`` antigo para o primeiro segmento."""
+        with open(self._file_path, encoding="utf-8") as f:
+            try:
+                legacy = json.load(f)
+            except json.JSONDecodeError:
+                return
+        if not isinstance(legacy, dict) or not legacy:
+            return
+        payload = b"".join(self._encode_record(data) for data in legacy.values())
+        self._write_segment_atomically(1, payload)
+
+    def _write_segment_atomically(self, segment: int, payload: bytes) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+        f = self._open_temporary_segment(segment)
+        f.write(payload)
+        self._publish_segment(segment, f)
+        self._fsync_directory()
+
+    def _open_temporary_segment(self, segment: int) -> BinaryIO:
+        return open(f"{self._segment_path(segment)}.tmp", "wb")
+
+    def _publish_segment(self, segment: int, f: BinaryIO) -> None:
+        """Grava em disco o arquivo temporário e o publica com ``os.replace``."""
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(f.name, self._segment_path(segment))
+
+    def _fsync_directory(self) -> None:
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self._directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    # ------------------------------------------------------------------ #
+    # Serialização
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _to_record(article: NewsArticle) -> dict[str, Any]:
+        return {
             "id": article.id,
             "url": article.url,
             "title": article.title,
@@ -40,40 +188,243 @@ class JSONNewsRepository(AbstractNewsRepository):
             if article.published_date
             else None,
             "source": article.source,
+            "stage": article.stage.value,
         }
-        self._save_articles()
 
-    def find_by_id(self, article_id: str) -> NewsArticle | None:
-        """Busca artigo por ID."""
-        data = self._articles.get(article_id)
-        if not data:
-            return None
+    @staticmethod
+    def _encode_record(record: dict[str, Any]) -> bytes:
+        return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
 
+    @staticmethod
+    def _to_article(data: dict[str, Any]) -> NewsArticle:
+        published_date = data.get("published_date")
+        stage = data.get("stage")
         return NewsArticle(
             id=data["id"],
             url=data["url"],
             title=data.get("title"),
             content=data.get("content"),
             summary=data.get("summary"),
+            published_date=datetime.fromisoformat(published_date)
+            if published_date
+            else None,
             source=data.get("source", "CNN"),
+            stage=ArticleStage(stage)
+            if stage
+            else ArticleStage.infer(data.get("content"), data.get("summary")),
         )
 
+    def _read_raw(self, location: _Location) -> bytes:
+        segment, offset, length = location
+        with open(self._segment_path(segment), "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def _read_record(self, location: _Location) -> dict[str, Any]:
+        record: dict[str, Any] = json.loads(self._read_raw(location))
+        return record
+
+    def _iter_raw_records(self) -> Iterator[tuple[str, bytes]]:
+        """Percorre os registros vivos em ordem de disco, um arquivo por vez.
+
+        As posições são copiadas sob o lock e o lock só é retomado para ler
+        cada registro, nunca durante o ``yield``. Um registro regravado ou
+        movido por uma compactação desde a cópia é lido na posição atual.
+        """
+        with self._lock:
+            ordered = sorted(self._index.items(), key=lambda item: item[1])
+        current_segment = None
+        f: BinaryIO | None = None
+        try:
+            for article_id, location in ordered:
+                with self._lock:
+                    current = self._index.get(article_id)
+                    if current is None:
+                        continue
+                    if current != location:
+                        raw = self._read_raw(current)
+                    else:
+                        segment, offset, length = location
+                        if f is None or segment != current_segment:
+                            if f is not None:
+                                f.close()
+                            f = open(self._segment_path(segment), "rb")
+                            current_segment = segment
+                        f.seek(offset)
+                        raw = f.read(length)
+                yield article_id, raw
+        finally:
+            if f is not None:
+                f.close()
+
+    # ------------------------------------------------------------------ #
+    # Escrita
+    # ------------------------------------------------------------------ #
+
+    def _append(self, articles: list[NewsArticle]) -> None:
+        """Acrescenta os artigos ao log com um único fsync."""
+        if not articles:
+            return
+        os.makedirs(self._directory, exist_ok=True)
+        with self._lock:
+            if self._segment_sizes.get(self._active_segment, 0) >= (
+                self._max_segment_bytes
+            ):
+                self._active_segment += 1
+
+            path = self._segment_path(self._active_segment)
+            offset = self._segment_sizes.get(self._active_segment, 0)
+            locations: list[tuple[str, _Location]] = []
+            chunks = []
+            for article in articles:
+                line = self._encode_record(self._to_record(article))
+                chunks.append(line)
+                locations.append(
+                    (article.id, (self._active_segment, offset, len(line)))
+                )
+                offset += len(line)
+
+            with open(path, "ab") as f:
+                f.write(b"".join(chunks))
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._segment_sizes[self._active_segment] = offset
+            for article_id, location in locations:
+                self._index_record(article_id, location)
+
+            if self._should_compact():
+                self.compact()
+
+    def _should_compact(self) -> bool:
+        total = sum(self._segment_sizes.values())
+        return (
+            self._dead_bytes >= self._min_compaction_bytes
+            and self._dead_bytes >= total * self._compaction_ratio
+        )
+
+    def compact(self) -> None:
+        """Reescreve apenas os registros vivos em segmentos novos.
+
+        Os registros são copiados um a um, sem montar o acervo em memória, e
+        um segmento novo começa sempre que o próximo registro ultrapassaria
+        ``max_segment_bytes``. Os segmentos novos recebem números maiores que
+        todos os existentes e são publicados com ``os.replace``; só depois os
+        antigos são removidos. Se o processo cair no meio, o replay em ordem
+        produz o mesmo estado, pois os novos só contêm cópias dos vivos.
+        """
+        with self._lock:
+            old_segments = sorted(self._segment_sizes)
+            if not old_segments:
+                return
+            segment = old_segments[-1] + 1
+            new_index: dict[str, _Location] = {}
+            new_sizes = {segment: 0}
+
+            f = self._open_temporary_segment(segment)
+            try:
+                for article_id, line in self._iter_raw_records():
+                    size = new_sizes[segment]
+                    if size and size + len(line) > self._max_segment_bytes:
+                        self._publish_segment(segment, f)
+                        segment += 1
+                        new_sizes[segment] = size = 0
+                        f = self._open_temporary_segment(segment)
+                    f.write(line)
+                    new_index[article_id] = (segment, size, len(line))
+                    new_sizes[segment] = size + len(line)
+                self._publish_segment(segment, f)
+            except BaseException:
+                # Segmentos já publicados teriam números maiores que o ativo e
+                # sobreporiam, no replay, as gravações feitas depois da falha
+                f.close()
+                for number in new_sizes:
+                    for path in (
+                        self._segment_path(number),
+                        f"{self._segment_path(number)}.tmp",
+                    ):
+                        if os.path.exists(path):
+                            os.remove(path)
+                raise
+            self._fsync_directory()
+
+            for old in old_segments:
+                os.remove(self._segment_path(old))
+            self._fsync_directory()
+
+            self._index = new_index
+            self._segment_sizes = new_sizes
+            self._active_segment = segment
+            self._dead_bytes = 0
+
+    def save(self, article: NewsArticle) -> None:
+        """Salva um artigo."""
+        self.save_batch([article])
+
+    def save_batch(self, articles: list[NewsArticle]) -> None:
+        """Salva múltiplos artigos com um único fsync."""
+        with self._metrics.time("repository_write_seconds", repository="json"):
+            self._append(list(articles))
+
+    # ------------------------------------------------------------------ #
+    # Leitura
+    # ------------------------------------------------------------------ #
+
+    def find_by_id(self, article_id: str) -> NewsArticle | None:
+        """Busca artigo por ID."""
+        with self._lock:
+            location = self._index.get(article_id)
+            if location is None:
+                return None
+            return self._to_article(self._read_record(location))
+
+    def iter_all(self) -> Iterator[NewsArticle]:
+        """Percorre os artigos em ordem de disco, um registro por vez.
+
+        O lock não fica retido entre um artigo e outro: um consumidor lento
+        não bloqueia gravações nem compactações.
+        """
+        for _, raw in self._iter_raw_records():
+            yield self._to_article(json.loads(raw))
+
+    def iter_articles(self, query: ArticleQuery | None = None) -> Iterator[NewsArticle]:
+        """Percorre os artigos em ordem de ID a partir do índice em memória.
+
+        Só a lista de IDs é ordenada; cada registro é lido do disco quando
+        chega a sua vez, sem reter o lock entre um artigo e outro.
+        """
+        query = query or ArticleQuery()
+        with self._lock:
+            ids = sorted(
+                article_id
+                for article_id in self._index
+                if query.after_id is None or article_id > query.after_id
+            )
+        remaining = query.limit
+        for article_id in ids:
+            if remaining is not None and remaining <= 0:
+                return
+            article = self.find_by_id(article_id)
+            if article is not None and query.matches(article):
+                if remaining is not None:
+                    remaining -= 1
+                yield article
+
+    def _load_content(self, article_id: str) -> str | None:
+        article = self.find_by_id(article_id)
+        return article.content if article is not None else None
+
     def find_all(self) -> list[NewsArticle]:
-        """Retorna todos os artigos."""
+        """Retorna todos os artigos, lendo cada segmento sequencialmente.
+
+        O conteúdo é descartado depois da leitura: cada artigo guarda uma
+        ``LazyContent`` que relê o seu registro quando ``content`` é acessado.
+        """
         articles = []
-        for data in self._articles.values():
-            article = NewsArticle(
-                id=data["id"],
-                url=data["url"],
-                title=data.get("title"),
-                content=data.get("content"),
-                summary=data.get("summary"),
-                source=data.get("source", "CNN"),
-            )
-            articles.append(article)
+        with self._lock:
+            for article_id, raw in self._iter_raw_records():
+                record = json.loads(raw)
+                if record.get("content"):
+                    record["content"] = LazyContent(self._content_loader, article_id)
+                articles.append(self._to_article(record))
         return articles
-
-    def save_batch(self, articles: list[NewsArticle]) -> None:
-        """Salva múltiplos artigos."""
-        for article in articles:
-            self.save(article)
@@ -1,56 +1,279 @@
 import json
+import random
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+from typing import Any
 
 import openai
 from openai import OpenAI
 
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.application.services.token_estimator import estimate_tokens
 from core.domain.repositories.abstracts.abstract_ai_repository import (
     AbstractAIRepository,
+    PackedSummaries,
+    SummaryGenerationError,
+    SummaryUnavailableError,
+)
+from core.infrastructure.ai.rate_limiter import RateLimiter
+
+SYSTEM_PROMPT = (
+    "You are a JSON summarization bot. You MUST respond with ONLY a valid JSON "
+    'object in the format {"summary": "your_summary_here"}.'
+)
+
+PACKED_SYSTEM_PROMPT = (
+    "You are a JSON summarization bot. You will receive a JSON object mapping "
+    "article keys to news articles. Summarize each article independently. You "
+    "MUST respond with ONLY a valid JSON object mapping every key to its "
+    'summary, in the format {"<key>": "summary_here"}.'
 )
 
 
 class OpenAIRepository(AbstractAIRepository):
-    """Implementação concreta usando OpenAI API."""
+    """Implementação concreta usando OpenAI API.
+
+    Respostas 429 e 5xx (e falhas de conexão) são repetidas com backoff
+    exponencial com jitter, respeitando ``retry-after`` quando presente. Um
+    ``RateLimiter`` opcional controla requisições/min e tokens/min entre
+    todas as threads que compartilham a instância.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-3.5-turbo",
+        temperature: float = 0.5,
+        max_tokens: int = 200,
+        rate_limiter: RateLimiter | None = None,
+        max_retries: int = 6,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+        metrics: MetricsRegistry | None = None,
+    ):
+        # As repetições são feitas aqui para poderem acionar o rate limiter
+        self._client = OpenAI(api_key=api_key, max_retries=0)
+        self._model = model
+        self._temperature = temperature
+        self._max_tokens = max_tokens
+        self._rate_limiter = rate_limiter
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._sleep = sleep
+        self._metrics = metrics if metrics is not None else REGISTRY
+
+    @staticmethod
+    def _is_retryable(exc: Exception) -> bool:
+        if isinstance(exc, openai.RateLimitError):
+            # Cota esgotada não se resolve esperando
+            return getattr(exc, "code", None) != "insufficient_quota"
+        if isinstance(exc, openai.APIStatusError):
+            return exc.status_code >= 500
+        return isinstance(exc, (openai.APIConnectionError, openai.APITimeoutError))
+
+    @staticmethod
+    def _retry_after(exc: Exception) -> float | None:
+        """Lê ``retry-after-ms``/``retry-after`` da resposta, se houver."""
+        response = getattr(exc, "response", None)
+        if response is None:
+            return None
+        headers = response.headers
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            try:
+                return float(retry_after_ms) / 1000
+            except ValueError:
+                pass
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(self._backoff_max, self._backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    def build_request_body(self, content: str) -> dict[str, Any]:
+        """Corpo da requisição de chat completion para um conteúdo."""
+        return {
+            "model": self._model,
+            "response_format": {"type": "json_object"},
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": content},
+            ],
+            "temperature": self._temperature,
+            "max_tokens": self._max_tokens,
+        }
+
+    def _create_completion(
+        self, body: dict[str, Any], estimated_tokens: int
+    ) -> str | None:
+        """Chama a API repetindo erros transitórios."""
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(estimated_tokens)
+            try:
+                with self._metrics.time("ai_request_seconds"):
+                    response = self._client.chat.completions.create(**body)
+                self._record_usage(response)
+                raw_response: str | None = response.choices[0].message.content
+                return raw_response
+            except openai.APIError as exc:
+                if not self._is_retryable(exc):
+                    raise
+                if attempt >= self._max_retries:
+                    raise SummaryUnavailableError(str(exc)) from exc
+                self._metrics.inc("ai_retries_total", error=type(exc).__name__)
+                retry_after = self._retry_after(exc)
+                delay = (
+                    retry_after if retry_after is not None else self._backoff(attempt)
+                )
+                if (
+                    isinstance(exc, openai.RateLimitError)
+                    and self._rate_limiter is not None
+                ):
+                    # Pausa todas as threads, não apenas a que recebeu o 429
+                    self._rate_limiter.pause(delay)
+                else:
+                    self._sleep(delay)
+                attempt += 1
+
+    def _record_usage(self, response: Any) -> None:
+        """Soma os tokens informados pela API, quando presentes."""
+        usage = getattr(response, "usage", None)
+        for kind in ("prompt", "completion"):
+            tokens = getattr(usage, f"{kind}_tokens", None)
+            if isinstance(tokens, int):
+                self._metrics.inc("ai_tokens_total", tokens, kind=kind)
 
-    def __init__(self, api_key: str):
-        self._client = OpenAI(api_key=api_key)
+    def generation_params(self) -> dict[str, object]:
+        """Parâmetros da requisição que influenciam o resumo."""
+        return {
+            "model": self._model,
+            "system_prompt": SYSTEM_PROMPT,
+            "temperature": self._temperature,
+            "max_tokens": self._max_tokens,
+        }
+
+    def packed_generation_params(self) -> dict[str, object]:
+        """Parâmetros das requisições agrupadas de ``generate_summaries``."""
+        return {
+            **self.generation_params(),
+            "mode": "packed",
+            "system_prompt": PACKED_SYSTEM_PROMPT,
+        }
+
+    @staticmethod
+    def _parse_json_object(raw_response: str | None) -> dict[str, Any]:
+        """Decodifica o objeto JSON da resposta do modelo.
+
+        Levanta ``SummaryGenerationError`` se a resposta estiver vazia, fora do
+        formato JSON ou não for um objeto.
+        """
+        if not raw_response:
+            raise SummaryGenerationError("Resposta vazia da API")
+        if not isinstance(raw_response, str):
+            raise SummaryGenerationError("Resposta fora do formato JSON")
+
+        try:
+            data = json.loads(raw_response)
+        except json.JSONDecodeError:
+            # Extração robusta de JSON
+            start_index = raw_response.find("{")
+            end_index = raw_response.rfind("}") + 1
+            if start_index == -1 or end_index == 0:
+                raise SummaryGenerationError("Resposta fora do formato JSON") from None
+            try:
+                data = json.loads(raw_response[start_index:end_index])
+            except json.JSONDecodeError as exc:
+                raise SummaryGenerationError("Resposta fora do formato JSON") from exc
+        if not isinstance(data, dict):
+            raise SummaryGenerationError("Resposta JSON não é um objeto")
+        return data
+
+    @classmethod
+    def parse_summary(cls, raw_response: str | None) -> str:
+        """Extrai o resumo da resposta JSON do modelo.
+
+        Levanta ``SummaryGenerationError`` se a resposta estiver vazia ou fora
+        do formato esperado.
+        """
+        summary = cls._parse_json_object(raw_response).get("summary")
+        if not isinstance(summary, str):
+            raise SummaryGenerationError("Resposta sem o campo 'summary'")
+        return summary
 
     def generate_summary(self, content: str) -> str:
         """Gera resumo usando OpenAI."""
         try:
-            response = self._client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                response_format={"type": "json_object"},
-                messages=[
-                    {
-                        "role": "system",
-                        "content": 'You are a JSON summarization bot. You MUST respond with ONLY a valid JSON object in the format {"summary": "your_summary_here"}.'
-                    },
-                    {"role": "user", "content": content}
-                ],
-                temperature=0.5,
-                max_tokens=200
+            raw_response = self._create_completion(
+                self.build_request_body(content),
+                estimate_tokens(content) + self._max_tokens,
             )
+            return self.parse_summary(raw_response)
+        except (SummaryUnavailableError, SummaryGenerationError):
+            raise
+        except openai.APIError as api_exc:
+            raise SummaryGenerationError(f"Erro na API: {api_exc}") from api_exc
+        except Exception as exc:
+            raise SummaryGenerationError(f"Erro inesperado: {exc}") from exc
 
-            raw_response = response.choices[0].message.content
+    def generate_packed_summaries(self, contents: dict[str, str]) -> PackedSummaries:
+        """Resume vários artigos em uma única requisição.
 
-            if not raw_response:
-                return "Erro: resposta vazia da API"
+        Os artigos são enviados como um objeto JSON com chaves curtas e a
+        resposta deve mapear cada chave ao seu resumo. Chaves ausentes ou
+        inválidas na resposta são resumidas individualmente; se a requisição
+        agrupada falhar ou a resposta vier malformada, todos os artigos são.
+        Só ``SummaryUnavailableError`` adia o grupo inteiro.
+        """
+        if len(contents) <= 1:
+            return super().generate_packed_summaries(contents)
 
-            try:
-                summary_data = json.loads(raw_response)
-                return summary_data.get("summary", "Erro ao extrair resumo")
-            except json.JSONDecodeError:
-                # Extração robusta de JSON
-                start_index = raw_response.find('{')
-                end_index = raw_response.rfind('}') + 1
-                if start_index != -1 and end_index != 0:
-                    clean_json = raw_response[start_index:end_index]
-                    summary_data = json.loads(clean_json)
-                    return summary_data.get("summary", "Erro ao extrair resumo")
-                return "Erro no formato da resposta"
-
-        except (openai.APIError, openai.AuthenticationError, openai.RateLimitError) as api_exc:
-            return f"Erro na API: {str(api_exc)}"
+        keys = list(contents)
+        packed = {str(index): contents[key] for index, key in enumerate(keys)}
+        user_content = json.dumps(packed, ensure_ascii=False)
+        body = self.build_request_body(user_content)
+        body["messages"][0]["content"] = PACKED_SYSTEM_PROMPT
+        body["max_tokens"] = self._max_tokens * len(packed)
+
+        try:
+            data = self._parse_json_object(
+                self._create_completion(
+                    body, estimate_tokens(user_content) + body["max_tokens"]
+                )
+            )
+        except SummaryUnavailableError:
+            return PackedSummaries(packed={}, individual={})
         except Exception as exc:
-            return f"Erro inesperado: {str(exc)}"
+            # Erro não repetível da API ou resposta fora do formato esperado
+            self._metrics.inc(
+                "pipeline_errors_total", stage="summarize", error=type(exc).__name__
+            )
+            data = {}
+
+        summaries: dict[str, str] = {}
+        missing: dict[str, str] = {}
+        for short_key, key in zip(packed, keys, strict=True):
+            summary = data.get(short_key)
+            if isinstance(summary, str) and summary.strip():
+                summaries[key] = summary
+            else:
+                missing[key] = contents[key]
 
+        # Fallback: uma chamada por artigo que faltou na resposta agrupada
+        individual = super().generate_packed_summaries(missing).individual
+        return PackedSummaries(packed=summaries, individual=individual)
@@ -0,0 +1,72 @@
+"""JSONL file format shared by the batch summarization backends.
+
+Follows the OpenAI Batch API layout: one request per input line and one
+``{"custom_id", "response", "error"}`` object per output line.
+"""
+import json
+import os
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+
+def request_line(custom_id: str, body: dict[str, Any]) -> dict[str, Any]:
+    """Monta uma linha de requisição do arquivo de entrada."""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": CHAT_COMPLETIONS_ENDPOINT,
+        "body": body,
+    }
+
+
+def result_line(
+    custom_id: str, content: str | None, error: str | None = None
+) -> dict[str, Any]:
+    """Monta uma linha de resultado no formato da Batch API."""
+    if error is not None:
+        return {
+            "custom_id": custom_id,
+            "response": None,
+            "error": {"message": error},
+        }
+    message = {"role": "assistant", "content": content}
+    return {
+        "custom_id": custom_id,
+        "response": {"status_code": 200, "body": {"choices": [{"message": message}]}},
+        "error": None,
+    }
+
+
+def write_jsonl(path: str, records: Iterable[dict[str, Any]]) -> None:
+    """Grava os registros em ``path`` de forma atômica."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def iter_jsonl(path: str) -> Iterator[dict[str, Any]]:
+    """Lê um arquivo JSONL linha a linha."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def result_content(record: dict[str, Any]) -> str | None:
+    """Extrai o conteúdo da resposta de uma linha de resultado, se houver."""
+    response = record.get("response")
+    if record.get("error") or not response or response.get("status_code") != 200:
+        return None
+    try:
+        content = response["body"]["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return content if isinstance(content, str) else None
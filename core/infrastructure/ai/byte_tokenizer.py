@@ -0,0 +1,48 @@
+"""Dependency-free byte-level tokenizer."""
+import re
+
+from core.domain.entities.training_example import MARKERS
+from core.domain.repositories.abstracts.abstract_tokenizer import AbstractTokenizer
+
+PAD = "<pad>"
+EOS = "<eos>"
+
+
+class ByteTokenizer(AbstractTokenizer):
+    """Tokeniza em bytes UTF-8 (IDs 0-255) mais um ID para cada token especial.
+
+    Não depende de vocabulário externo, então serve como padrão e para testes;
+    outros tokenizadores podem ser usados implementando ``AbstractTokenizer``.
+    """
+
+    def __init__(self) -> None:
+        specials = (*MARKERS, PAD, EOS)
+        self._special_tokens = {
+            token: 256 + index for index, token in enumerate(specials)
+        }
+        self._marker_pattern = re.compile(
+            "(" + "|".join(re.escape(marker) for marker in MARKERS) + ")"
+        )
+
+    @property
+    def name(self) -> str:
+        return "byte"
+
+    @property
+    def vocab_size(self) -> int:
+        return 256 + len(self._special_tokens)
+
+    @property
+    def special_tokens(self) -> dict[str, int]:
+        return dict(self._special_tokens)
+
+    def encode(self, text: str) -> list[int]:
+        """Converte texto em IDs; marcadores viram um único token cada."""
+        ids: list[int] = []
+        # re.split com grupo intercala texto comum e marcadores
+        for index, part in enumerate(self._marker_pattern.split(text)):
+            if index % 2:
+                ids.append(self._special_tokens[part])
+            elif part:
+                ids.extend(part.encode("utf-8"))
+        return ids
@@ -0,0 +1,48 @@
+"""Dependency-free hashing embedding encoder."""
+import hashlib
+import math
+from collections import Counter
+
+from core.application.services.text_analysis import tokenize
+from core.domain.repositories.abstracts.abstract_embedding_encoder import (
+    AbstractEmbeddingEncoder,
+)
+
+
+class HashingEncoder(AbstractEmbeddingEncoder):
+    """Projeta termos e bigramas em ``dimension`` posições por hashing.
+
+    Cada atributo soma ``1 + log(tf)`` com sinal definido pelo hash, e o vetor
+    é normalizado. É determinístico e local, então serve para testes e como
+    alternativa sem rede; a similaridade capturada é apenas lexical.
+    """
+
+    def __init__(self, dimension: int = 256):
+        if dimension < 1:
+            raise ValueError("dimension deve ser positiva")
+        self._dimension = dimension
+
+    @property
+    def name(self) -> str:
+        return f"hashing-{self._dimension}"
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _encode_one(self, text: str) -> list[float]:
+        terms = tokenize(text)
+        features = Counter(terms)
+        features.update(f"{first} {second}" for first, second in zip(terms, terms[1:]))
+        vector = [0.0] * self._dimension
+        for feature, count in features.items():
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            sign = 1.0 if value & 1 else -1.0
+            vector[(value >> 1) % self._dimension] += sign * (1 + math.log(count))
+        norm = math.sqrt(sum(component * component for component in vector))
+        return [component / norm for component in vector] if norm else vector
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        """Codifica cada texto localmente."""
+        return [self._encode_one(text) for text in texts]
@@ -0,0 +1,94 @@
+"""OpenAI embeddings API encoder."""
+import openai
+from openai import OpenAI
+
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.application.services.token_estimator import (
+    estimate_tokens,
+    truncate_to_budget,
+)
+from core.domain.repositories.abstracts.abstract_embedding_encoder import (
+    AbstractEmbeddingEncoder,
+    EmbeddingUnavailableError,
+)
+from core.infrastructure.ai.rate_limiter import RateLimiter
+
+
+class OpenAIEmbeddingEncoder(AbstractEmbeddingEncoder):
+    """Gera embeddings pela API da OpenAI, em lotes.
+
+    Os textos são cortados em ``max_input_tokens`` e enviados em requisições
+    de até ``batch_size`` textos e ``max_request_tokens`` tokens estimados.
+    Erros transitórios são repetidos pelo próprio cliente; o ``RateLimiter``
+    opcional limita requisições e tokens por minuto.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        dimension: int = 1536,
+        batch_size: int = 256,
+        max_input_tokens: int = 8000,
+        max_request_tokens: int = 250_000,
+        rate_limiter: RateLimiter | None = None,
+        max_retries: int = 6,
+        metrics: MetricsRegistry | None = None,
+    ):
+        self._client = OpenAI(api_key=api_key, max_retries=max_retries)
+        self._model = model
+        self._dimension = dimension
+        self._batch_size = batch_size
+        self._max_input_tokens = max_input_tokens
+        self._max_request_tokens = max_request_tokens
+        self._rate_limiter = rate_limiter
+        self._metrics = metrics if metrics is not None else REGISTRY
+
+    @property
+    def name(self) -> str:
+        return f"openai:{self._model}:{self._dimension}"
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _batches(self, texts: list[str]) -> list[tuple[list[str], int]]:
+        """Agrupa os textos respeitando os limites por requisição."""
+        batches: list[tuple[list[str], int]] = []
+        current: list[str] = []
+        used = 0
+        for text in texts:
+            text = truncate_to_budget(text, self._max_input_tokens) or " "
+            cost = estimate_tokens(text)
+            if current and (
+                len(current) >= self._batch_size
+                or used + cost > self._max_request_tokens
+            ):
+                batches.append((current, used))
+                current, used = [], 0
+            current.append(text)
+            used += cost
+        if current:
+            batches.append((current, used))
+        return batches
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        """Codifica os textos com uma requisição por lote."""
+        vectors: list[list[float]] = []
+        for batch, tokens in self._batches(texts):
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(tokens)
+            try:
+                with self._metrics.time("ai_request_seconds"):
+                    response = self._client.embeddings.create(
+                        model=self._model, input=batch, dimensions=self._dimension
+                    )
+            except openai.APIError as exc:
+                raise EmbeddingUnavailableError(str(exc)) from exc
+            self._metrics.inc(
+                "ai_tokens_total", response.usage.prompt_tokens, kind="embedding"
+            )
+            # A API pode devolver os itens fora de ordem; ``index`` os identifica
+            items = sorted(response.data, key=lambda item: item.index)
+            vectors.extend(item.embedding for item in items)
+        return vectors
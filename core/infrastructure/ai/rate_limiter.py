@@ -0,0 +1,93 @@
+"""Token-bucket rate limiting for requests/min and tokens/min."""
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """Balde de tokens com reposição contínua.
+
+    Não é thread-safe; o ``RateLimiter`` serializa o acesso.
+    """
+
+    def __init__(
+        self, capacity: float, refill_per_second: float, now: float = 0.0
+    ):
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity e refill_per_second devem ser positivos")
+        self.capacity = capacity
+        self._refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated_at = now
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        refilled = self._tokens + elapsed * self._refill_per_second
+        self._tokens = min(self.capacity, refilled)
+        self._updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Segundos até que ``amount`` tokens estejam disponíveis."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) / self._refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Retira ``amount`` tokens do balde."""
+        self._tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """Limita requisições/min e tokens/min compartilhados entre threads.
+
+    ``pause`` suspende todas as threads até um instante, usado quando a API
+    responde 429 com ``retry-after``.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        now = clock()
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60, now)
+            if requests_per_minute
+            else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60, now)
+            if tokens_per_minute
+            else None
+        )
+        self._paused_until = now
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Bloqueia até haver capacidade para uma requisição de ``tokens``."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                wait = max(0.0, self._paused_until - now)
+                if self._requests is not None:
+                    wait = max(wait, self._requests.wait_time(1, now))
+                if self._tokens is not None:
+                    wait = max(wait, self._tokens.wait_time(tokens, now))
+                if wait <= 0:
+                    if self._requests is not None:
+                        self._requests.consume(1)
+                    if self._tokens is not None:
+                        self._tokens.consume(tokens)
+                    return
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Suspende novas requisições por ``seconds`` segundos."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
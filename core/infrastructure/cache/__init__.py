@@ -0,0 +1 @@
+"""Persistent caches used by the infrastructure adapters."""
@@ -0,0 +1,164 @@
+"""Two-tier (memory LRU + SQLite) content-addressed summary cache."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_last_access ON summaries (last_access);
+"""
+
+
+@dataclass
+class CacheStats:
+    """Contadores de acerto e falha do cache."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Total de acertos nas duas camadas."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração de consultas atendidas pelo cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SummaryCache:
+    """Cache de resumos endereçado pelo conteúdo.
+
+    A camada em memória é um LRU limitado por número de entradas; a camada em
+    disco é uma tabela SQLite limitada por ``max_disk_bytes``, que remove as
+    entradas acessadas há mais tempo quando o limite é excedido.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        memory_entries: int = 10_000,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._memory_entries = memory_entries
+        self._max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries")
+        self._disk_bytes: int = row.fetchone()[0]
+        self.stats = CacheStats()
+
+    @staticmethod
+    def make_key(content: str, params: dict[str, object]) -> str:
+        """Gera a chave a partir do conteúdo e dos parâmetros de geração."""
+        payload = json.dumps(
+            {"content": content, "params": params}, sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, summary: str) -> None:
+        self._memory[key] = summary
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> str | None:
+        """Busca um resumo, primeiro em memória e depois em disco."""
+        found = self.get_first([key])
+        return found[1] if found is not None else None
+
+    def get_first(self, keys: Sequence[str]) -> tuple[str, str] | None:
+        """Primeira das ``keys`` em cache e o seu resumo, na ordem dada.
+
+        Conta um único acerto ou falha para a consulta inteira, para que
+        procurar um mesmo resumo sob chaves alternativas não distorça as
+        estatísticas.
+        """
+        with self._lock:
+            for key in keys:
+                summary = self._memory.get(key)
+                if summary is not None:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return key, summary
+
+                row = self._conn.execute(
+                    "SELECT summary FROM summaries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    continue
+
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE summaries SET last_access = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                self.stats.disk_hits += 1
+                self._remember(key, row[0])
+                return key, str(row[0])
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, summary: str) -> None:
+        """Grava um resumo nas duas camadas."""
+        size = len(summary.encode("utf-8")) + len(key)
+        with self._lock:
+            self._remember(key, summary)
+            with self._conn:
+                previous = self._conn.execute(
+                    "SELECT size FROM summaries WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO summaries (key, summary, size, last_access)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, summary, size, time.time()),
+                )
+            self._disk_bytes += size - (previous[0] if previous else 0)
+            if self._disk_bytes > self._max_disk_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove as entradas menos usadas até ficar 10% abaixo do limite."""
+        target = int(self._max_disk_bytes * 0.9)
+        with self._conn:
+            rows = self._conn.execute(
+                "SELECT key, size FROM summaries ORDER BY last_access"
+            )
+            victims = []
+            for key, size in rows:
+                if self._disk_bytes <= target:
+                    break
+                victims.append((key,))
+                self._disk_bytes -= size
+            self._conn.executemany("DELETE FROM summaries WHERE key = ?", victims)
+        for (key,) in victims:
+            self._memory.pop(key, None)
+        self.stats.evictions += len(victims)
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1 @@
+"""HTTP helpers shared by the scraping adapters."""
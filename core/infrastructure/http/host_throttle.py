@@ -0,0 +1,55 @@
+"""Per-host concurrency limit and politeness delay."""
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+class HostThrottle:
+    """Limita requisições simultâneas e o intervalo mínimo por host."""
+
+    def __init__(
+        self,
+        max_per_host: int = 4,
+        politeness_delay: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if max_per_host < 1:
+            raise ValueError("max_per_host deve ser >= 1")
+        self._max_per_host = max_per_host
+        self._politeness_delay = politeness_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._next_slot: dict[str, float] = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._max_per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    def _reserve_slot(self, host: str) -> float:
+        """Reserva o próximo horário de início permitido para o host."""
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = start + self._politeness_delay
+            return start - now
+
+    @contextmanager
+    def acquire(self, url: str) -> Iterator[None]:
+        """Bloqueia até que uma requisição para o host de ``url`` seja permitida."""
+        host = urlsplit(url).netloc
+        semaphore = self._semaphore(host)
+        with semaphore:
+            if self._politeness_delay > 0:
+                wait = self._reserve_slot(host)
+                if wait > 0:
+                    self._sleep(wait)
+            yield
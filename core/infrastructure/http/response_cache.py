@@ -0,0 +1,140 @@
+"""On-disk HTTP response cache with conditional revalidation."""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+import requests
+
+# URLs de artigos da CNN têm a data no caminho: /2025/01/31/...
+_ARTICLE_URL = re.compile(r"/\d{4}/\d{2}/\d{2}/")
+
+
+@dataclass
+class CachedResponse:
+    """Corpo de uma resposta com os validadores necessários para revalidar."""
+
+    url: str
+    body: bytes
+    encoding: str | None
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    @property
+    def text(self) -> str:
+        """Corpo decodificado com o encoding original da resposta."""
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+
+class HTTPResponseCache:
+    """Cache persistente de respostas HTTP por URL.
+
+    Respostas dentro do TTL são servidas do disco sem rede; respostas
+    vencidas são revalidadas com ``If-None-Match``/``If-Modified-Since``.
+    O TTL depende da classe da URL: páginas de seção mudam a todo momento,
+    artigos publicados quase nunca. No modo ``offline`` apenas o que já está
+    em disco é servido, independentemente do TTL.
+
+    Corpo e metadados são publicados com ``os.replace`` a partir de arquivos
+    temporários únicos, e os metadados, gravados por último, guardam o hash
+    do corpo: um par inconsistente (crash entre as duas trocas ou escritas
+    concorrentes da mesma URL) é tratado como ausência no cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        section_ttl: float = 10 * 60,
+        article_ttl: float = 30 * 24 * 60 * 60,
+        offline: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._cache_dir = cache_dir
+        self._section_ttl = section_ttl
+        self._article_ttl = article_ttl
+        self.offline = offline
+        self._clock = clock
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self._cache_dir, digest[:2], digest)
+        return f"{base}.body", f"{base}.meta.json"
+
+    def ttl_for(self, url: str) -> float:
+        """TTL em segundos conforme a classe da URL."""
+        return self._article_ttl if _ARTICLE_URL.search(url) else self._section_ttl
+
+    def is_fresh(self, cached: CachedResponse) -> bool:
+        """Indica se a resposta pode ser servida sem revalidação."""
+        return self._clock() - cached.fetched_at < self.ttl_for(cached.url)
+
+    @staticmethod
+    def conditional_headers(cached: CachedResponse) -> dict[str, str]:
+        """Cabeçalhos para um GET condicional."""
+        headers = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Lê a resposta armazenada para ``url``, se houver."""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, json.JSONDecodeError):
+            return None
+        if meta.pop("body_sha256", None) != hashlib.sha256(body).hexdigest():
+            return None
+        return CachedResponse(body=body, **meta)
+
+    @staticmethod
+    def _replace(path: str, data: bytes) -> None:
+        """Publica ``data`` em ``path`` a partir de um temporário exclusivo."""
+        directory, name = os.path.split(path)
+        with tempfile.NamedTemporaryFile(
+            dir=directory, prefix=f"{name}.", suffix=".tmp", delete=False
+        ) as f:
+            f.write(data)
+        try:
+            os.replace(f.name, path)
+        except OSError:
+            os.remove(f.name)
+            raise
+
+    def _write(self, cached: CachedResponse, write_body: bool = True) -> None:
+        body_path, meta_path = self._paths(cached.url)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        if write_body:
+            self._replace(body_path, cached.body)
+        meta = asdict(cached)
+        del meta["body"]
+        meta["body_sha256"] = hashlib.sha256(cached.body).hexdigest()
+        self._replace(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def put(self, url: str, response: requests.Response) -> CachedResponse:
+        """Armazena uma resposta 200 com seus validadores."""
+        cached = CachedResponse(
+            url=url,
+            body=response.content,
+            encoding=response.encoding,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            fetched_at=self._clock(),
+        )
+        self._write(cached)
+        return cached
+
+    def touch(self, cached: CachedResponse) -> None:
+        """Renova o TTL após uma revalidação 304."""
+        cached.fetched_at = self._clock()
+        self._write(cached, write_body=False)
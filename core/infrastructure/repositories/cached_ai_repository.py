@@ -0,0 +1,81 @@
+"""Caching decorator for any AbstractAIRepository."""
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+    PackedSummaries,
+)
+from core.infrastructure.cache.summary_cache import CacheStats, SummaryCache
+
+
+class CachedAIRepository(AbstractAIRepository):
+    """Decora um repositório de IA com um cache de resumos persistente.
+
+    A chave combina o conteúdo com ``generation_params()`` do repositório
+    decorado, então trocar modelo, prompt ou parâmetros invalida o cache.
+    Resumos agrupados são guardados com ``packed_generation_params()`` e não
+    atendem chamadas individuais; os que o lote gerou um a um, como fallback,
+    ficam sob a chave individual. Falhas são exceções e, portanto, nunca são
+    armazenadas.
+    """
+
+    def __init__(self, ai_repo: AbstractAIRepository, cache: SummaryCache):
+        self._ai_repo = ai_repo
+        self._cache = cache
+
+    @property
+    def stats(self) -> CacheStats:
+        """Estatísticas de acerto do cache."""
+        return self._cache.stats
+
+    def generation_params(self) -> dict[str, object]:
+        """Repassa os parâmetros do repositório decorado."""
+        return self._ai_repo.generation_params()
+
+    def packed_generation_params(self) -> dict[str, object]:
+        """Repassa os parâmetros agrupados do repositório decorado."""
+        return self._ai_repo.packed_generation_params()
+
+    def generate_summary(self, content: str) -> str:
+        """Retorna o resumo em cache ou delega ao repositório decorado."""
+        key = self._cache.make_key(content, self._ai_repo.generation_params())
+        summary = self._cache.get(key)
+        if summary is not None:
+            return summary
+
+        summary = self._ai_repo.generate_summary(content)
+        self._cache.put(key, summary)
+        return summary
+
+    def generate_packed_summaries(self, contents: dict[str, str]) -> PackedSummaries:
+        """Atende do cache o que puder e delega o restante em um único lote.
+
+        Um resumo individual em cache também serve ao lote. Cada artigo conta
+        um único acerto ou falha, mesmo consultando as duas chaves.
+        """
+        params = self._ai_repo.generation_params()
+        packed_params = self._ai_repo.packed_generation_params()
+        packed: dict[str, str] = {}
+        individual: dict[str, str] = {}
+        misses: dict[str, str] = {}
+        for key, content in contents.items():
+            individual_key = self._cache.make_key(content, params)
+            candidates = [individual_key]
+            if packed_params != params:
+                candidates.append(self._cache.make_key(content, packed_params))
+            found = self._cache.get_first(candidates)
+            if found is None:
+                misses[key] = content
+            elif found[0] == individual_key:
+                individual[key] = found[1]
+            else:
+                packed[key] = found[1]
+
+        if misses:
+            generated = self._ai_repo.generate_packed_summaries(misses)
+            for key, summary in generated.packed.items():
+                packed_key = self._cache.make_key(misses[key], packed_params)
+                self._cache.put(packed_key, summary)
+            for key, summary in generated.individual.items():
+                self._cache.put(self._cache.make_key(misses[key], params), summary)
+            packed.update(generated.packed)
+            individual.update(generated.individual)
+        return PackedSummaries(packed=packed, individual=individual)
@@ -0,0 +1,67 @@
+"""News repository decorator that keeps a search index up to date."""
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from core.domain.entities.news_article import NewsArticle
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+    ArticlePage,
+    ArticleQuery,
+)
+from core.domain.repositories.abstracts.abstract_search_index import (
+    AbstractSearchIndex,
+)
+
+
+class IndexingNewsRepository(AbstractNewsRepository):
+    """Decora um repositório de artigos indexando cada artigo salvo.
+
+    O índice é atualizado depois da gravação, no mesmo lote; artigos cujo
+    texto não mudou (por exemplo, só avançaram de estágio) não são
+    reindexados. As leituras são repassadas sem alteração.
+    """
+
+    def __init__(self, news_repo: AbstractNewsRepository, index: AbstractSearchIndex):
+        self._news_repo = news_repo
+        self._index = index
+
+    def save(self, article: NewsArticle) -> None:
+        """Salva o artigo e o indexa."""
+        self._news_repo.save(article)
+        self._index.add_batch([article])
+
+    def save_batch(self, articles: list[NewsArticle]) -> None:
+        """Salva os artigos e os indexa em um único segmento."""
+        self._news_repo.save_batch(articles)
+        self._index.add_batch(articles)
+
+    def find_by_id(self, article_id: str) -> NewsArticle | None:
+        """Repassa ao repositório decorado."""
+        return self._news_repo.find_by_id(article_id)
+
+    def find_all(self) -> list[NewsArticle]:
+        """Repassa ao repositório decorado."""
+        return self._news_repo.find_all()
+
+    def iter_all(self) -> Iterator[NewsArticle]:
+        """Repassa ao repositório decorado."""
+        return self._news_repo.iter_all()
+
+    def iter_articles(self, query: ArticleQuery | None = None) -> Iterator[NewsArticle]:
+        """Repassa ao repositório decorado."""
+        return self._news_repo.iter_articles(query)
+
+    def iter_projected(
+        self, query: ArticleQuery | None = None, fields: Sequence[str] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Repassa ao repositório decorado."""
+        return self._news_repo.iter_projected(query, fields)
+
+    def find_page(
+        self,
+        query: ArticleQuery | None = None,
+        limit: int = 100,
+        fields: Sequence[str] | None = None,
+    ) -> ArticlePage:
+        """Repassa ao repositório decorado."""
+        return self._news_repo.find_page(query, limit, fields)
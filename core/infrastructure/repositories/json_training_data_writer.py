@@ -0,0 +1,48 @@
+"""Streaming writer for the training_data.json array."""
+import json
+import os
+
+from core.domain.entities.training_example import TrainingExample
+from core.domain.repositories.abstracts.abstract_training_data_writer import (
+    AbstractTrainingDataWriter,
+)
+
+
+class JSONTrainingDataWriter(AbstractTrainingDataWriter):
+    """Grava ``[{"input": ...}, ...]`` incrementalmente, um exemplo por vez.
+
+    A saída é idêntica a ``json.dump(lista, indent=4)``, mas sem manter a
+    lista em memória. O arquivo é escrito em ``<arquivo>.tmp`` e publicado
+    com ``os.replace`` no ``close``; ``abort`` apenas remove o temporário.
+    """
+
+    def __init__(self, output_file: str):
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._output_file = output_file
+        self._tmp_file = f"{output_file}.tmp"
+        self._file = open(self._tmp_file, "w", encoding="utf-8")
+        self.count = 0
+
+    def write(self, example: TrainingExample) -> None:
+        """Acrescenta um exemplo ao array."""
+        item = json.dumps({"input": example.input_text}, indent=4, ensure_ascii=False)
+        indented = "\n".join(f"    {line}" for line in item.splitlines())
+        self._file.write(("[\n" if self.count == 0 else ",\n") + indented)
+        self.count += 1
+
+    def close(self) -> None:
+        """Fecha o array e publica o arquivo."""
+        if self._file.closed:
+            return
+        self._file.write("\n]" if self.count else "[]")
+        self._file.close()
+        os.replace(self._tmp_file, self._output_file)
+
+    def abort(self) -> None:
+        """Descarta o arquivo temporário sem publicá-lo."""
+        if self._file.closed:
+            return
+        self._file.close()
+        os.remove(self._tmp_file)
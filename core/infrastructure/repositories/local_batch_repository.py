@@ -0,0 +1,79 @@
+"""File-based stand-in for a batch summarization backend."""
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from typing import Any
+
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+    SummaryGenerationError,
+    SummaryUnavailableError,
+)
+from core.domain.repositories.abstracts.abstract_batch_ai_repository import (
+    AbstractBatchAIRepository,
+)
+from core.infrastructure.ai.batch_files import (
+    iter_jsonl,
+    request_line,
+    result_content,
+    result_line,
+    write_jsonl,
+)
+
+
+class LocalBatchRepository(AbstractBatchAIRepository):
+    """Simula a Batch API com arquivos locais.
+
+    O lote é gravado e lido no mesmo formato JSONL da OpenAI; o
+    processamento, feito em ``wait_for_batch``, delega cada requisição a um
+    ``AbstractAIRepository`` comum. Permite testar o fluxo sem rede.
+    """
+
+    def __init__(self, ai_repo: AbstractAIRepository, work_dir: str):
+        self._ai_repo = ai_repo
+        self._work_dir = work_dir
+
+    def _path(self, batch_id: str, kind: str) -> str:
+        return os.path.join(self._work_dir, f"{batch_id}.{kind}.jsonl")
+
+    def submit_batch(self, contents: dict[str, str]) -> str:
+        """Grava o arquivo de entrada do lote."""
+        batch_id = f"batch_{uuid.uuid4().hex}"
+        write_jsonl(
+            self._path(batch_id, "input"),
+            (
+                request_line(
+                    custom_id, {"messages": [{"role": "user", "content": text}]}
+                )
+                for custom_id, text in contents.items()
+            ),
+        )
+        return batch_id
+
+    def _process(self, record: dict[str, Any]) -> dict[str, Any]:
+        custom_id = record["custom_id"]
+        content = record["body"]["messages"][-1]["content"]
+        try:
+            summary = self._ai_repo.generate_summary(content)
+        except (SummaryUnavailableError, SummaryGenerationError) as exc:
+            return result_line(custom_id, None, error=str(exc))
+        return result_line(custom_id, json.dumps({"summary": summary}))
+
+    def wait_for_batch(self, batch_id: str) -> None:
+        """Processa o arquivo de entrada, se ainda não houver saída."""
+        input_path = self._path(batch_id, "input")
+        output_path = self._path(batch_id, "output")
+        if os.path.exists(output_path):
+            return
+        if not os.path.exists(input_path):
+            raise SummaryUnavailableError(f"Lote {batch_id} não encontrado")
+        write_jsonl(output_path, (self._process(r) for r in iter_jsonl(input_path)))
+
+    def iter_results(self, batch_id: str) -> Iterator[tuple[str, str]]:
+        """Lê o arquivo de saída do lote."""
+        for record in iter_jsonl(self._path(batch_id, "output")):
+            content = result_content(record)
+            if content is None:
+                continue
+            yield record["custom_id"], json.loads(content)["summary"]
@@ -0,0 +1,348 @@
+"""Dense vector index on a memory-mapped NumPy matrix, with optional IVF."""
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depende do ambiente
+    raise ImportError(
+        "O índice vetorial requer o pacote opcional 'numpy' "
+        "(pip install 'fine-tuning-rag[embeddings]')"
+    ) from exc
+
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.domain.entities.news_article import NewsArticle
+from core.domain.repositories.abstracts.abstract_embedding_encoder import (
+    AbstractEmbeddingEncoder,
+)
+from core.domain.repositories.abstracts.abstract_search_index import (
+    AbstractSearchIndex,
+    SearchHit,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    row INTEGER PRIMARY KEY,
+    article_id TEXT NOT NULL UNIQUE,
+    digest BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Linhas por multiplicação ao atribuir vetores aos centróides
+_ASSIGN_CHUNK = 65_536
+
+
+def embedding_text(article: NewsArticle, max_chars: int = 4000) -> str:
+    """Texto codificado: título e resumo; sem resumo, o início do conteúdo."""
+    body = article.summary or (article.content or "")[:max_chars]
+    return "\n".join(part for part in (article.title, body) if part)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+class MemmapVectorIndex(AbstractSearchIndex):
+    """Índice de vetores normalizados em uma matriz ``float32`` mapeada em disco.
+
+    A linha de cada artigo e o hash do texto codificado ficam em
+    ``rows.db``; um artigo só é recodificado quando esse hash muda, e o vetor
+    novo sobrescreve a linha antiga. Sem IVF, a busca é um produto escalar
+    com todas as linhas. Depois de ``train_ivf``, os vetores são agrupados em
+    ``nlist`` centróides (k-means esférico), cada um com a sua lista
+    invertida de linhas, e a busca lê só as listas dos ``nprobe`` grupos mais
+    próximos. Os centróides ficam em ``centroids.npy``; a atribuição das
+    linhas e as listas são recalculadas ao abrir.
+
+    A codificação, que pode ser uma chamada de rede, acontece fora do lock
+    que protege a matriz: buscas não esperam a codificação de um lote, e
+    ``add_batch`` concorrentes são serializados por um lock próprio.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        encoder: AbstractEmbeddingEncoder,
+        encode_batch_size: int = 256,
+        nprobe: int = 8,
+        max_chars: int = 4000,
+        metrics: MetricsRegistry | None = None,
+    ):
+        os.makedirs(directory, exist_ok=True)
+        self._encoder = encoder
+        self._dimension = encoder.dimension
+        self._encode_batch_size = encode_batch_size
+        self._nprobe = nprobe
+        self._max_chars = max_chars
+        self._metrics = metrics if metrics is not None else REGISTRY
+        self._vectors_path = os.path.join(directory, "vectors.f32")
+        self._centroids_path = os.path.join(directory, "centroids.npy")
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "rows.db"), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._check_settings(
+            {"encoder": encoder.name, "dimension": str(encoder.dimension)}
+        )
+
+        self._rows: dict[str, tuple[int, bytes]] = {}
+        self._article_ids: list[str] = []
+        for row, article_id, digest in self._conn.execute(
+            "SELECT row, article_id, digest FROM rows ORDER BY row"
+        ):
+            self._rows[article_id] = (row, digest)
+            self._article_ids.append(article_id)
+        row_bytes = self._dimension * 4
+        stored = (
+            os.path.getsize(self._vectors_path) // row_bytes
+            if os.path.exists(self._vectors_path)
+            else 0
+        )
+        self._vectors = self._map(max(stored, len(self._article_ids), 1024))
+        self._centroids: np.ndarray | None = None
+        self._assignments = np.full(len(self._vectors), -1, dtype=np.int32)
+        self._lists: list[array[int]] = []
+        if os.path.exists(self._centroids_path):
+            self._set_centroids(np.load(self._centroids_path))
+
+    def _check_settings(self, settings: dict[str, str]) -> None:
+        with self._conn:
+            for key, value in settings.items():
+                row = self._conn.execute(
+                    "SELECT value FROM settings WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute(
+                        "INSERT INTO settings (key, value) VALUES (?, ?)",
+                        (key, value),
+                    )
+                elif row[0] != value:
+                    raise ValueError(
+                        f"Índice criado com {key}={row[0]}, recebido {value}"
+                    )
+
+    def _map(self, capacity: int) -> np.memmap:
+        """Mapeia o arquivo de vetores, aumentando-o até ``capacity`` linhas."""
+        size = capacity * self._dimension * 4
+        with open(self._vectors_path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+        return np.memmap(
+            self._vectors_path,
+            dtype=np.float32,
+            mode="r+",
+            shape=(capacity, self._dimension),
+        )
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = len(self._vectors)
+        if rows <= capacity:
+            return
+        self._vectors.flush()
+        capacity = max(rows, capacity * 2)
+        self._vectors = self._map(capacity)
+        assignments = np.full(capacity, -1, dtype=np.int32)
+        assignments[: len(self._assignments)] = self._assignments
+        self._assignments = assignments
+
+    def close(self) -> None:
+        """Grava os vetores pendentes e fecha o banco de linhas."""
+        with self._write_lock, self._lock:
+            self._vectors.flush()
+            self._conn.close()
+
+    @property
+    def document_count(self) -> int:
+        """Quantidade de artigos indexados."""
+        return len(self._article_ids)
+
+    def add_batch(self, articles: list[NewsArticle]) -> int:
+        """Codifica em lotes só os artigos novos ou com texto alterado.
+
+        Cada lote é gravado e confirmado antes do próximo, então uma falha
+        no meio de uma atualização longa preserva o que já foi codificado.
+        """
+        with self._write_lock:
+            pending: dict[str, tuple[str, bytes]] = {}
+            for article in articles:
+                text = embedding_text(article, self._max_chars)
+                if not text:
+                    continue
+                digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+                known = self._rows.get(article.id)
+                if known is None or known[1] != digest:
+                    pending[article.id] = (text, digest)
+
+            items = list(pending.items())
+            for start in range(0, len(items), self._encode_batch_size):
+                self._write(items[start : start + self._encode_batch_size])
+            return len(items)
+
+    def _write(self, items: list[tuple[str, tuple[str, bytes]]]) -> None:
+        # Só escritores alteram as linhas, e eles já estão serializados
+        vectors = np.asarray(
+            self._encoder.encode([text for _, (text, _) in items]), dtype=np.float32
+        )
+        if vectors.shape != (len(items), self._dimension):
+            raise ValueError(
+                f"Codificador retornou vetores {vectors.shape}, "
+                f"esperado ({len(items)}, {self._dimension})"
+            )
+        vectors = _normalize(vectors)
+
+        with self._lock:
+            self._store(items, vectors)
+
+    def _store(
+        self, items: list[tuple[str, tuple[str, bytes]]], vectors: np.ndarray
+    ) -> None:
+        rows: list[int] = []
+        added: list[str] = []
+        for article_id, _ in items:
+            known = self._rows.get(article_id)
+            if known is not None:
+                rows.append(known[0])
+            else:
+                rows.append(len(self._article_ids) + len(added))
+                added.append(article_id)
+        self._ensure_capacity(len(self._article_ids) + len(added))
+        self._vectors[rows] = vectors
+        self._vectors.flush()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO rows (row, article_id, digest) VALUES (?, ?, ?) "
+                "ON CONFLICT (row) DO UPDATE SET digest = excluded.digest",
+                [
+                    (row, article_id, digest)
+                    for row, (article_id, (_, digest)) in zip(rows, items, strict=True)
+                ],
+            )
+
+        self._article_ids.extend(added)
+        for row, (article_id, (_, digest)) in zip(rows, items, strict=True):
+            self._rows[article_id] = (row, digest)
+        if self._centroids is not None:
+            labels = self._assign(vectors, self._centroids)
+            moved = self._assignments[rows] != labels
+            self._assignments[rows] = labels
+            # A entrada antiga de uma linha que mudou de grupo fica na lista
+            # anterior e é descartada na busca, que confere a atribuição
+            for row, label in zip(
+                np.asarray(rows)[moved].tolist(), labels[moved].tolist(), strict=True
+            ):
+                self._lists[label].append(row)
+
+    def _set_centroids(self, centroids: np.ndarray) -> None:
+        """Atribui todas as linhas aos centróides e refaz as listas invertidas."""
+        count = self.document_count
+        labels = self._assign(self._vectors[:count], centroids)
+        self._centroids = centroids
+        self._assignments[:count] = labels
+        order = np.argsort(labels, kind="stable").astype(np.int64)
+        bounds = np.cumsum(np.bincount(labels, minlength=len(centroids)))
+        self._lists = [
+            array("q", chunk.tobytes()) for chunk in np.split(order, bounds[:-1])
+        ]
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Centróide mais próximo de cada vetor, em blocos de linhas."""
+        labels = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), _ASSIGN_CHUNK):
+            chunk = vectors[start : start + _ASSIGN_CHUNK]
+            labels[start : start + len(chunk)] = np.argmax(
+                chunk @ centroids.T, axis=1
+            )
+        return labels
+
+    def train_ivf(
+        self,
+        nlist: int,
+        iterations: int = 10,
+        sample_size: int | None = None,
+        seed: int = 0,
+    ) -> None:
+        """Treina ``nlist`` centróides com k-means esférico sobre uma amostra.
+
+        A amostra padrão tem 256 vetores por centróide. Depois do treino,
+        as buscas passam a usar o IVF, inclusive após reabrir o índice.
+        """
+        with self._write_lock, self._lock:
+            count = self.document_count
+            if not 1 <= nlist <= count:
+                raise ValueError("nlist deve estar entre 1 e o número de vetores")
+            rng = np.random.default_rng(seed)
+            size = min(count, sample_size or nlist * 256)
+            sample_rows = np.sort(rng.choice(count, size=size, replace=False))
+            sample = np.asarray(self._vectors[sample_rows])
+            centroids = sample[rng.choice(size, size=nlist, replace=False)]
+            for _ in range(iterations):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, labels, sample)
+                # Um grupo que ficou vazio mantém o centróide anterior
+                empty = np.bincount(labels, minlength=nlist) == 0
+                sums[empty] = centroids[empty]
+                centroids = _normalize(sums).astype(np.float32)
+
+            temporary = f"{self._centroids_path}.tmp"
+            with open(temporary, "wb") as f:
+                np.save(f, centroids)
+            os.replace(temporary, self._centroids_path)
+            self._set_centroids(centroids)
+
+    def search(self, query: str, k: int = 10) -> list[SearchHit]:
+        """Os ``k`` vetores com maior similaridade de cosseno com a consulta."""
+        if not query.strip() or k < 1 or not self.document_count:
+            return []
+        with self._metrics.time("search_query_seconds", index="vector"):
+            encoded = np.asarray(self._encoder.encode([query]), dtype=np.float32)
+            vector = _normalize(encoded)[0]
+            with self._lock:
+                return self._search_vector(vector, k)
+
+    def _search_vector(self, vector: np.ndarray, k: int) -> list[SearchHit]:
+        count = self.document_count
+        if self._centroids is not None:
+            nprobe = min(self._nprobe, len(self._centroids))
+            closest = np.argpartition(-(self._centroids @ vector), nprobe - 1)
+            rows = self._probe(closest[:nprobe].tolist())
+            scores = self._vectors[rows] @ vector
+        else:
+            rows = np.arange(count)
+            scores = self._vectors[:count] @ vector
+        k = min(k, len(scores))
+        if not k:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            SearchHit(self._article_ids[rows[index]], float(scores[index]))
+            for index in top
+        ]
+
+    def _probe(self, centroids: list[int]) -> np.ndarray:
+        """Linhas das listas invertidas dos ``centroids``, sem entradas antigas.
+
+        O custo é proporcional ao tamanho das listas lidas, não ao índice.
+        """
+        rows = [
+            np.frombuffer(self._lists[centroid], dtype=np.int64)
+            for centroid in centroids
+        ]
+        labels = np.repeat(centroids, [len(chunk) for chunk in rows])
+        candidates = np.concatenate(rows)
+        # Uma linha que voltou a um grupo aparece nele mais de uma vez
+        return np.unique(candidates[self._assignments[candidates] == labels])
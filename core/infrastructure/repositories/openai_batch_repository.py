@@ -0,0 +1,95 @@
+"""OpenAI Batch API implementation of the batch summarization port."""
+import os
+import time
+from collections.abc import Callable, Iterator
+
+from openai import OpenAI
+
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    SummaryGenerationError,
+    SummaryUnavailableError,
+)
+from core.domain.repositories.abstracts.abstract_batch_ai_repository import (
+    AbstractBatchAIRepository,
+)
+from core.domain.repositories.open_ai_repository import OpenAIRepository
+from core.infrastructure.ai.batch_files import (
+    iter_jsonl,
+    request_line,
+    result_content,
+    write_jsonl,
+)
+
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class OpenAIBatchRepository(AbstractBatchAIRepository):
+    """Gera resumos pela Batch API da OpenAI.
+
+    As requisições são montadas por um ``OpenAIRepository`` (mesmo modelo,
+    prompt e parâmetros do modo interativo) e os arquivos de entrada e saída
+    ficam em ``work_dir`` para auditoria.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        request_builder: OpenAIRepository,
+        work_dir: str,
+        poll_interval: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._client = OpenAI(api_key=api_key)
+        self._request_builder = request_builder
+        self._work_dir = work_dir
+        self._poll_interval = poll_interval
+        self._sleep = sleep
+
+    def submit_batch(self, contents: dict[str, str]) -> str:
+        """Grava o arquivo JSONL, faz upload e cria o lote."""
+        input_path = os.path.join(self._work_dir, f"batch-{time.time_ns()}.input.jsonl")
+        write_jsonl(
+            input_path,
+            (
+                request_line(custom_id, self._request_builder.build_request_body(text))
+                for custom_id, text in contents.items()
+            ),
+        )
+        with open(input_path, "rb") as f:
+            input_file = self._client.files.create(file=f, purpose="batch")
+        batch = self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def wait_for_batch(self, batch_id: str) -> None:
+        """Consulta o status do lote até um estado final."""
+        while True:
+            batch = self._client.batches.retrieve(batch_id)
+            if batch.status in _TERMINAL_STATUSES:
+                break
+            self._sleep(self._poll_interval)
+        if batch.status != "completed":
+            raise SummaryUnavailableError(
+                f"Lote {batch_id} terminou como {batch.status}"
+            )
+
+    def iter_results(self, batch_id: str) -> Iterator[tuple[str, str]]:
+        """Baixa o arquivo de saída e gera os resumos linha a linha."""
+        batch = self._client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            return
+        output_path = os.path.join(self._work_dir, f"{batch_id}.output.jsonl")
+        self._client.files.content(batch.output_file_id).write_to_file(output_path)
+
+        for record in iter_jsonl(output_path):
+            content = result_content(record)
+            if content is None:
+                continue
+            try:
+                summary = self._request_builder.parse_summary(content)
+            except SummaryGenerationError:
+                continue
+            yield record["custom_id"], summary
@@ -0,0 +1,219 @@
+"""Writer for pre-tokenized, sequence-packed training data."""
+import json
+import os
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO
+
+from core.domain.entities.training_example import (
+    NEWS_END,
+    NEWS_START,
+    SUMMARY_START,
+    TrainingExample,
+)
+from core.domain.repositories.abstracts.abstract_tokenizer import AbstractTokenizer
+from core.domain.repositories.abstracts.abstract_training_data_writer import (
+    AbstractTrainingDataWriter,
+)
+
+# Valores de segments.bin
+SEGMENT_PADDING = 0
+SEGMENT_PROMPT = 1
+SEGMENT_SUMMARY = 2
+
+_FILES = ("tokens.bin", "segments.bin", "offsets.bin")
+
+
+@dataclass
+class _Sequence:
+    tokens: list[int] = field(default_factory=list)
+    segments: bytearray = field(default_factory=bytearray)
+    # (início dentro da sequência, tamanho) de cada exemplo
+    documents: list[tuple[int, int]] = field(default_factory=list)
+
+
+class PackedSequenceTrainingDataWriter(AbstractTrainingDataWriter):
+    """Tokeniza os exemplos e os empacota em sequências de ``seq_len`` tokens.
+
+    Saída em ``output_dir``, em little-endian, pronta para ``numpy.memmap``:
+
+    - ``tokens.bin``: IDs (uint16 ou uint32), forma ``(sequências, seq_len)``;
+    - ``segments.bin``: uint8 por token, 0 padding, 1 notícia, 2 resumo
+      (o resumo e o ``<eos>`` são os tokens que entram na loss);
+    - ``offsets.bin``: int64 ``(início, fim)`` de cada exemplo no array
+      achatado, para montar máscaras de atenção por documento;
+    - ``meta.json``: dtype, ``seq_len``, contagens e IDs dos tokens especiais.
+
+    O empacotamento é first-fit sobre ``open_sequences`` sequências abertas,
+    o que reduz o padding sem manter o dataset em memória. Exemplos maiores
+    que ``seq_len`` têm o fim da notícia truncado; se nem o resumo couber,
+    o exemplo é descartado.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        tokenizer: AbstractTokenizer,
+        seq_len: int = 2048,
+        open_sequences: int = 16,
+    ):
+        special_tokens = tokenizer.special_tokens
+        self._pad_id = special_tokens["<pad>"]
+        self._eos_id = special_tokens["<eos>"]
+        self._news_start_id = special_tokens[NEWS_START]
+        self._news_end_id = special_tokens[NEWS_END]
+        self._summary_start_id = special_tokens[SUMMARY_START]
+        os.makedirs(output_dir, exist_ok=True)
+        self._output_dir = output_dir
+        self._tokenizer = tokenizer
+        self._seq_len = seq_len
+        self._open_sequences = open_sequences
+        self._token_typecode = "H" if tokenizer.vocab_size <= 2**16 else "I"
+        self._files: dict[str, BinaryIO] = {
+            name: open(self._tmp_path(name), "wb") for name in _FILES
+        }
+        self._open: list[_Sequence] = []
+        self._closed = False
+        self.count = 0
+        self.sequences = 0
+        self.truncated = 0
+        self.skipped = 0
+        self.padding_tokens = 0
+
+    def _tmp_path(self, name: str) -> str:
+        return os.path.join(self._output_dir, f"{name}.tmp")
+
+    def _tokenize(self, example: TrainingExample) -> tuple[list[int], bytearray] | None:
+        """IDs e segmentos de um exemplo, já truncado para caber em uma sequência."""
+        ids = self._tokenizer.encode(example.input_text) + [self._eos_id]
+        try:
+            summary_start = ids.index(self._summary_start_id)
+        except ValueError:
+            return None
+
+        overflow = len(ids) - self._seq_len
+        if overflow > 0:
+            try:
+                news_start = ids.index(self._news_start_id)
+                news_end = ids.index(self._news_end_id, news_start)
+            except ValueError:
+                return None
+            if news_end > summary_start or overflow >= news_end - news_start - 1:
+                return None
+            del ids[news_end - overflow : news_end]
+            summary_start -= overflow
+            self.truncated += 1
+
+        segments = bytearray([SEGMENT_PROMPT]) * summary_start + bytearray(
+            [SEGMENT_SUMMARY]
+        ) * (len(ids) - summary_start)
+        return ids, segments
+
+    def _flush(self, sequence: _Sequence) -> None:
+        """Completa a sequência com padding e a grava em disco."""
+        padding = self._seq_len - len(sequence.tokens)
+        tokens = array(self._token_typecode, sequence.tokens)
+        tokens.extend([self._pad_id] * padding)
+        segments = sequence.segments + bytearray([SEGMENT_PADDING]) * padding
+        base = self.sequences * self._seq_len
+        offsets = array("q")
+        for start, length in sequence.documents:
+            offsets.extend((base + start, base + start + length))
+        for values in (tokens, offsets):
+            if sys.byteorder == "big":
+                values.byteswap()
+        self._files["tokens.bin"].write(tokens.tobytes())
+        self._files["segments.bin"].write(segments)
+        self._files["offsets.bin"].write(offsets.tobytes())
+        self.sequences += 1
+        self.padding_tokens += padding
+
+    def write(self, example: TrainingExample) -> None:
+        """Tokeniza o exemplo e o coloca na primeira sequência aberta com espaço."""
+        tokenized = self._tokenize(example)
+        if tokenized is None:
+            self.skipped += 1
+            return
+        ids, segments = tokenized
+
+        target = next(
+            (
+                sequence
+                for sequence in self._open
+                if self._seq_len - len(sequence.tokens) >= len(ids)
+            ),
+            None,
+        )
+        if target is None:
+            if len(self._open) >= self._open_sequences:
+                # Libera a sequência mais cheia, que é a que menos desperdiça
+                fullest = max(self._open, key=lambda sequence: len(sequence.tokens))
+                self._open.remove(fullest)
+                self._flush(fullest)
+            target = _Sequence()
+            self._open.append(target)
+
+        target.documents.append((len(target.tokens), len(ids)))
+        target.tokens.extend(ids)
+        target.segments.extend(segments)
+        self.count += 1
+        if len(target.tokens) == self._seq_len:
+            self._open.remove(target)
+            self._flush(target)
+
+    def _meta(self) -> dict[str, Any]:
+        total = self.sequences * self._seq_len
+        return {
+            "format": "packed",
+            "tokenizer": self._tokenizer.name,
+            "vocab_size": self._tokenizer.vocab_size,
+            "special_tokens": self._tokenizer.special_tokens,
+            "seq_len": self._seq_len,
+            "byte_order": "little",
+            "dtypes": {
+                "tokens.bin": "uint16" if self._token_typecode == "H" else "uint32",
+                "segments.bin": "uint8",
+                "offsets.bin": "int64",
+            },
+            "segments": {
+                "padding": SEGMENT_PADDING,
+                "prompt": SEGMENT_PROMPT,
+                "summary": SEGMENT_SUMMARY,
+            },
+            "sequences": self.sequences,
+            "examples": self.count,
+            "truncated": self.truncated,
+            "skipped": self.skipped,
+            "padding_ratio": self.padding_tokens / total if total else 0.0,
+        }
+
+    def close(self) -> None:
+        """Grava as sequências abertas, publica os arquivos e o ``meta.json``."""
+        if self._closed:
+            return
+        self._closed = True
+        for sequence in self._open:
+            self._flush(sequence)
+        self._open.clear()
+
+        for name, file in self._files.items():
+            file.flush()
+            os.fsync(file.fileno())
+            file.close()
+            os.replace(self._tmp_path(name), os.path.join(self._output_dir, name))
+
+        meta_path = os.path.join(self._output_dir, "meta.json")
+        with open(f"{meta_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(self._meta(), f, indent=4)
+        os.replace(f"{meta_path}.tmp", meta_path)
+
+    def abort(self) -> None:
+        """Descarta os arquivos temporários sem publicá-los."""
+        if self._closed:
+            return
+        self._closed = True
+        self._open.clear()
+        for name, file in self._files.items():
+            file.close()
+            os.remove(self._tmp_path(name))
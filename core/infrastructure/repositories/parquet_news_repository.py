@@ -0,0 +1,172 @@
+"""Parquet snapshot implementation of the news article repository."""
+import itertools
+import os
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as exc:  # pragma: no cover - depende do ambiente
+    raise ImportError(
+        "Parquet requer o pacote opcional 'pyarrow' "
+        "(pip install 'fine-tuning-rag[parquet]')"
+    ) from exc
+
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+
+ARTICLE_SCHEMA = pa.schema(
+    [
+        pa.field("id", pa.string(), nullable=False),
+        pa.field("url", pa.string(), nullable=False),
+        pa.field("title", pa.string()),
+        pa.field("content", pa.large_string()),
+        pa.field("summary", pa.string()),
+        pa.field("published_date", pa.timestamp("us")),
+        pa.field("source", pa.string()),
+        pa.field("stage", pa.string()),
+    ]
+)
+
+
+class ParquetNewsRepository(AbstractNewsRepository):
+    """Snapshot colunar dos artigos, otimizado para leitura.
+
+    O arquivo é lido com memory map e em lotes, com projeção de colunas
+    (por exemplo, ler só ``id`` e ``summary`` sem tocar em ``content``).
+    Gravações reescrevem o snapshot inteiro de forma atômica, então o uso
+    esperado é gerar o snapshot em massa com ``write_snapshot`` a partir de
+    outro repositório, e não salvar artigo por artigo.
+    """
+
+    def __init__(self, file_path: str, row_group_size: int = 10_000):
+        self._file_path = file_path
+        self._row_group_size = row_group_size
+
+    # ------------------------------------------------------------------ #
+    # Conversão
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _to_row(article: NewsArticle) -> dict[str, Any]:
+        return {
+            "id": article.id,
+            "url": article.url,
+            "title": article.title,
+            "content": article.content,
+            "summary": article.summary,
+            "published_date": article.published_date,
+            "source": article.source,
+            "stage": article.stage.value,
+        }
+
+    @staticmethod
+    def _to_article(row: dict[str, Any]) -> NewsArticle:
+        stage = row.get("stage")
+        return NewsArticle(
+            id=row["id"],
+            url=row["url"],
+            title=row.get("title"),
+            content=row.get("content"),
+            summary=row.get("summary"),
+            published_date=row.get("published_date"),
+            source=row.get("source") or "CNN",
+            stage=ArticleStage(stage)
+            if stage
+            else ArticleStage.infer(row.get("content"), row.get("summary")),
+        )
+
+    # ------------------------------------------------------------------ #
+    # Escrita
+    # ------------------------------------------------------------------ #
+
+    def write_snapshot(self, articles: Iterable[NewsArticle]) -> int:
+        """Grava os artigos em row groups de ``row_group_size``, sem lista total.
+
+        O arquivo é escrito em ``.tmp`` e publicado com ``os.replace``.
+        Retorna o número de artigos gravados.
+        """
+        directory = os.path.dirname(self._file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self._file_path}.tmp"
+        count = 0
+        with pq.ParquetWriter(tmp_path, ARTICLE_SCHEMA) as writer:
+            rows: list[dict[str, Any]] = []
+            for article in articles:
+                rows.append(self._to_row(article))
+                if len(rows) >= self._row_group_size:
+                    writer.write_table(pa.Table.from_pylist(rows, ARTICLE_SCHEMA))
+                    count += len(rows)
+                    rows = []
+            if rows:
+                writer.write_table(pa.Table.from_pylist(rows, ARTICLE_SCHEMA))
+                count += len(rows)
+        os.replace(tmp_path, self._file_path)
+        return count
+
+    def save(self, article: NewsArticle) -> None:
+        """Salva um artigo (reescreve o snapshot)."""
+        self.save_batch([article])
+
+    def save_batch(self, articles: list[NewsArticle]) -> None:
+        """Faz upsert dos artigos reescrevendo o snapshot em streaming."""
+        if not articles:
+            return
+        updated = {article.id: article for article in articles}
+        existing = (
+            article for article in self.iter_all() if article.id not in updated
+        )
+        self.write_snapshot(itertools.chain(existing, updated.values()))
+
+    # ------------------------------------------------------------------ #
+    # Leitura
+    # ------------------------------------------------------------------ #
+
+    def _parquet_file(self) -> "pq.ParquetFile | None":
+        if not os.path.exists(self._file_path):
+            return None
+        return pq.ParquetFile(self._file_path, memory_map=True)
+
+    def iter_records(
+        self, columns: list[str] | None = None, batch_size: int = 10_000
+    ) -> Iterator[dict[str, Any]]:
+        """Percorre os registros lendo apenas ``columns``, um lote por vez."""
+        parquet_file = self._parquet_file()
+        if parquet_file is None:
+            return
+        for batch in parquet_file.iter_batches(
+            batch_size=batch_size, columns=columns
+        ):
+            yield from batch.to_pylist()
+
+    def read_table(self, columns: list[str] | None = None) -> "pa.Table":
+        """Lê o snapshot como ``pyarrow.Table`` (memory map, sem cópia)."""
+        if not os.path.exists(self._file_path):
+            return ARTICLE_SCHEMA.empty_table().select(
+                columns or ARTICLE_SCHEMA.names
+            )
+        return pq.read_table(self._file_path, columns=columns, memory_map=True)
+
+    def iter_all(self) -> Iterator[NewsArticle]:
+        """Percorre todos os artigos, um row group por vez."""
+        for record in self.iter_records():
+            yield self._to_article(record)
+
+    def find_by_id(self, article_id: str) -> NewsArticle | None:
+        """Busca artigo por ID, usando as estatísticas dos row groups."""
+        if not os.path.exists(self._file_path):
+            return None
+        table = pq.read_table(
+            self._file_path, filters=[("id", "=", article_id)], memory_map=True
+        )
+        records = table.to_pylist()
+        return self._to_article(records[0]) if records else None
+
+    def find_all(self) -> list[NewsArticle]:
+        """Retorna todos os artigos."""
+        return list(self.iter_all())
+
@@ -0,0 +1,83 @@
+"""Parquet writer and reader for training examples."""
+import os
+from collections.abc import Iterator
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as exc:  # pragma: no cover - depende do ambiente
+    raise ImportError(
+        "Parquet requer o pacote opcional 'pyarrow' "
+        "(pip install 'fine-tuning-rag[parquet]')"
+    ) from exc
+
+from core.domain.entities.training_example import TrainingExample
+from core.domain.repositories.abstracts.abstract_training_data_writer import (
+    AbstractTrainingDataWriter,
+)
+
+TRAINING_EXAMPLE_SCHEMA = pa.schema(
+    [pa.field("input", pa.large_string(), nullable=False)]
+)
+
+
+class ParquetTrainingDataWriter(AbstractTrainingDataWriter):
+    """Grava exemplos em um arquivo Parquet, um row group a cada N exemplos.
+
+    Apenas o row group corrente fica em memória. O arquivo é escrito em
+    ``<arquivo>.tmp`` e publicado com ``os.replace`` no ``close``; ``abort``
+    apenas remove o temporário.
+    """
+
+    def __init__(self, output_file: str, row_group_size: int = 10_000):
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._output_file = output_file
+        self._tmp_file = f"{output_file}.tmp"
+        self._row_group_size = row_group_size
+        self._writer = pq.ParquetWriter(self._tmp_file, TRAINING_EXAMPLE_SCHEMA)
+        self._pending: list[str] = []
+        self._closed = False
+        self.count = 0
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._writer.write_table(
+                pa.table({"input": self._pending}, schema=TRAINING_EXAMPLE_SCHEMA)
+            )
+            self._pending = []
+
+    def write(self, example: TrainingExample) -> None:
+        """Acrescenta um exemplo ao row group corrente."""
+        self._pending.append(example.input_text)
+        self.count += 1
+        if len(self._pending) >= self._row_group_size:
+            self._flush()
+
+    def close(self) -> None:
+        """Grava o último row group e publica o arquivo."""
+        if self._closed:
+            return
+        self._closed = True
+        self._flush()
+        self._writer.close()
+        os.replace(self._tmp_file, self._output_file)
+
+    def abort(self) -> None:
+        """Descarta o arquivo temporário sem publicá-lo."""
+        if self._closed:
+            return
+        self._closed = True
+        self._writer.close()
+        os.remove(self._tmp_file)
+
+
+def iter_training_examples(
+    file_path: str, batch_size: int = 10_000
+) -> Iterator[TrainingExample]:
+    """Lê os exemplos de um arquivo Parquet com memory map, um lote por vez."""
+    parquet_file = pq.ParquetFile(file_path, memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        for input_text in batch.column("input").to_pylist():
+            yield TrainingExample(input_text=input_text)
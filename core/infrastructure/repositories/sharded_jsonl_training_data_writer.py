@@ -0,0 +1,236 @@
+"""Streaming writer for sharded, optionally compressed JSONL training data."""
+import gzip
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Protocol
+
+from core.domain.entities.training_example import TrainingExample
+from core.domain.repositories.abstracts.abstract_training_data_writer import (
+    AbstractTrainingDataWriter,
+)
+
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+MANIFEST_FILE = "manifest.json"
+
+
+def is_validation(example: TrainingExample, validation_ratio: float) -> bool:
+    """Decide o split pelo hash do texto: o mesmo exemplo cai sempre no mesmo."""
+    digest = hashlib.sha256(example.input_text.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2**64 < validation_ratio
+
+
+class _Stream(Protocol):
+    def write(self, data: bytes, /) -> int: ...
+
+    def close(self) -> None: ...
+
+
+class _HashingFile:
+    """Arquivo binário que calcula sha256 e tamanho do que é gravado."""
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self._raw.write(data)
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+    def fileno(self) -> int:
+        return self._raw.fileno()
+
+    def close(self) -> None:
+        self._raw.close()
+
+
+@dataclass
+class _Shard:
+    split: str
+    file_name: str
+    file: _HashingFile
+    stream: _Stream
+    count: int = 0
+
+
+class ShardedJSONLTrainingDataWriter(AbstractTrainingDataWriter):
+    """Grava exemplos em shards JSONL, separados em treino e validação.
+
+    Cada linha é ``{"input": ...}``. Um shard é fechado ao atingir
+    ``shard_size`` exemplos, então a memória usada não depende do tamanho do
+    dataset. O split é determinístico (hash do exemplo). Os shards são
+    escritos como ``.tmp`` e publicados no ``close``, seguidos do
+    ``manifest.json`` com contagens e sha256 de cada arquivo; shards de uma
+    exportação anterior que não fazem parte da nova são removidos. Com
+    ``abort``, os ``.tmp`` são descartados e a exportação anterior fica
+    intacta.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        shard_size: int = 100_000,
+        compression: str = "none",
+        validation_ratio: float = 0.05,
+    ):
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Compressão desconhecida: {compression}")
+        if compression == "zstd":
+            # Falha cedo, antes de gravar qualquer shard
+            self._zstd_compressor()
+        if shard_size <= 0:
+            raise ValueError("shard_size deve ser positivo")
+        os.makedirs(output_dir, exist_ok=True)
+        self._output_dir = output_dir
+        self._shard_size = shard_size
+        self._compression = compression
+        self._validation_ratio = validation_ratio
+        self._open: dict[str, _Shard] = {}
+        self._next_index: dict[str, int] = {"train": 0, "validation": 0}
+        self._finished: list[dict[str, Any]] = []
+        self._closed = False
+        self.count = 0
+
+    @staticmethod
+    def _zstd_compressor() -> Any:
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(
+                "Compressão zstd requer o pacote opcional 'zstandard' "
+                "(pip install 'fine-tuning-rag[zstd]')"
+            ) from exc
+        return zstandard.ZstdCompressor()
+
+    def _open_shard(self, split: str) -> _Shard:
+        index = self._next_index[split]
+        self._next_index[split] = index + 1
+        file_name = (
+            f"{split}-{index:05d}.jsonl{COMPRESSION_SUFFIXES[self._compression]}"
+        )
+        tmp_path = os.path.join(self._output_dir, f"{file_name}.tmp")
+        hashing_file = _HashingFile(open(tmp_path, "wb"))
+        stream: _Stream
+        if self._compression == "gzip":
+            # mtime fixo: a mesma entrada gera os mesmos bytes (e checksums)
+            stream = gzip.GzipFile(fileobj=hashing_file, mode="wb", mtime=0)
+        elif self._compression == "zstd":
+            stream = self._zstd_compressor().stream_writer(
+                hashing_file, closefd=False
+            )
+        else:
+            stream = hashing_file
+        return _Shard(split, file_name, hashing_file, stream)
+
+    def _finish_shard(self, shard: _Shard) -> None:
+        if shard.stream is not shard.file:
+            shard.stream.close()
+        shard.file.flush()
+        os.fsync(shard.file.fileno())
+        shard.file.close()
+        self._finished.append(
+            {
+                "file": shard.file_name,
+                "split": shard.split,
+                "examples": shard.count,
+                "bytes": shard.file.size,
+                "sha256": shard.file.sha256.hexdigest(),
+            }
+        )
+
+    def write(self, example: TrainingExample) -> None:
+        """Acrescenta um exemplo ao shard atual do seu split."""
+        split = (
+            "validation"
+            if is_validation(example, self._validation_ratio)
+            else "train"
+        )
+        shard = self._open.get(split)
+        if shard is None:
+            shard = self._open[split] = self._open_shard(split)
+        line = json.dumps({"input": example.input_text}, ensure_ascii=False) + "\n"
+        shard.stream.write(line.encode("utf-8"))
+        shard.count += 1
+        self.count += 1
+        if shard.count >= self._shard_size:
+            self._finish_shard(shard)
+            del self._open[split]
+
+    def abort(self) -> None:
+        """Descarta os shards temporários sem publicá-los."""
+        if self._closed:
+            return
+        self._closed = True
+        for shard in self._open.values():
+            shard.stream.close()
+            shard.file.close()
+        file_names = [shard.file_name for shard in self._open.values()]
+        file_names += [shard_info["file"] for shard_info in self._finished]
+        self._open.clear()
+        for file_name in file_names:
+            os.remove(os.path.join(self._output_dir, f"{file_name}.tmp"))
+
+    def _previous_files(self) -> set[str]:
+        path = os.path.join(self._output_dir, MANIFEST_FILE)
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return set()
+        return {shard["file"] for shard in manifest.get("shards", [])}
+
+    def close(self) -> None:
+        """Fecha os shards abertos, publica-os e grava o manifesto."""
+        if self._closed:
+            return
+        self._closed = True
+        for shard in self._open.values():
+            self._finish_shard(shard)
+        self._open.clear()
+
+        stale = self._previous_files()
+        for shard_info in self._finished:
+            file_name = shard_info["file"]
+            os.replace(
+                os.path.join(self._output_dir, f"{file_name}.tmp"),
+                os.path.join(self._output_dir, file_name),
+            )
+            stale.discard(file_name)
+
+        splits = {
+            split: {
+                "examples": sum(
+                    s["examples"] for s in self._finished if s["split"] == split
+                ),
+                "shards": sum(1 for s in self._finished if s["split"] == split),
+            }
+            for split in ("train", "validation")
+        }
+        manifest = {
+            "format": "jsonl",
+            "compression": self._compression,
+            "shard_size": self._shard_size,
+            "validation_ratio": self._validation_ratio,
+            "examples": self.count,
+            "splits": splits,
+            "shards": sorted(self._finished, key=lambda s: (s["split"], s["file"])),
+        }
+        manifest_path = os.path.join(self._output_dir, MANIFEST_FILE)
+        with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=4, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+        for file_name in stale:
+            try:
+                os.remove(os.path.join(self._output_dir, file_name))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,176 @@
+"""Link discovery from XML sitemaps and RSS feeds."""
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
+from email.utils import parsedate_to_datetime
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractPageFetchingRepository,
+    AbstractScrapingRepository,
+    ContentUnavailableError,
+)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    kind: str  # "sitemap" (filho de um sitemap index) ou "link"
+    url: str
+    lastmod: str | None
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(element: Element, *names: str) -> str | None:
+    """Texto do primeiro descendente com um dos nomes, ignorando namespaces."""
+    for child in element.iter():
+        if child is not element and _local_name(child.tag) in names and child.text:
+            return child.text.strip()
+    return None
+
+
+def _atom_link(element: Element) -> str | None:
+    """``href`` do ``<link>`` de uma entrada Atom."""
+    for child in element:
+        if _local_name(child.tag) == "link" and child.get("href"):
+            return child.get("href")
+    return None
+
+
+def parse_entry_date(value: str | None) -> date | None:
+    """Data de um ``lastmod``/``publication_date`` (ISO 8601) ou ``pubDate``."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).date()
+    except (TypeError, ValueError):
+        return None
+
+
+class SitemapDiscoveryRepository(AbstractScrapingRepository):
+    """Descobre links lendo sitemaps XML e feeds RSS em streaming.
+
+    Os documentos são baixados por ``content_repo.fetch_page``, com o mesmo
+    pool de conexões, limite por host e cache de respostas da extração: um
+    sitemap que não mudou é revalidado sem ser baixado de novo. O XML é
+    consumido em blocos por um ``XMLPullParser`` e cada entrada é descartada
+    depois de lida, então a árvore não fica em memória. Sitemap indexes são
+    seguidos apenas para filhos cujo ``lastmod`` pode conter o intervalo
+    pedido. Links já processados não são lembrados aqui: no modo incremental,
+    o estágio salvo de cada artigo decide o que ainda falta, então links de
+    uma execução interrompida voltam na seguinte. A extração de conteúdo é
+    delegada a ``content_repo``.
+    """
+
+    def __init__(
+        self,
+        content_repo: AbstractPageFetchingRepository,
+        chunk_size: int = 64 * 1024,
+        exclude_patterns: tuple[str, ...] = ("/video/",),
+        max_depth: int = 2,
+    ):
+        self._content_repo = content_repo
+        self._chunk_size = chunk_size
+        self._exclude_patterns = exclude_patterns
+        self._max_depth = max_depth
+
+    def _iter_entries(self, url: str) -> Iterator[_Entry]:
+        """Interpreta o XML em blocos, gerando uma entrada por vez."""
+        document = memoryview(self._content_repo.fetch_page(url))
+        # Sitemaps .gz são arquivos gzip, não Content-Encoding
+        decompressor = (
+            zlib.decompressobj(16 + zlib.MAX_WBITS) if url.endswith(".gz") else None
+        )
+        parser: XMLPullParser[Element] = XMLPullParser(events=("start", "end"))
+        stack: list[Element] = []
+        for start in range(0, len(document), self._chunk_size):
+            chunk = bytes(document[start : start + self._chunk_size])
+            if decompressor is not None:
+                chunk = decompressor.decompress(chunk)
+            parser.feed(chunk)
+            yield from self._drain(parser, stack)
+        parser.close()
+        yield from self._drain(parser, stack)
+
+    @staticmethod
+    def _drain(
+        parser: "XMLPullParser[Element]", stack: list[Element]
+    ) -> Iterator[_Entry]:
+        for item in parser.read_events():
+            event, element = item[0], item[-1]
+            if not isinstance(element, Element):
+                continue
+            if event == "start":
+                stack.append(element)
+                continue
+            stack.pop()
+            name = _local_name(element.tag)
+            if name == "sitemap":
+                loc = _child_text(element, "loc")
+                if loc:
+                    yield _Entry("sitemap", loc, _child_text(element, "lastmod"))
+            elif name == "url":
+                loc = _child_text(element, "loc")
+                if loc:
+                    lastmod = _child_text(element, "publication_date", "lastmod")
+                    yield _Entry("link", loc, lastmod)
+            elif name in ("item", "entry"):
+                link = _child_text(element, "link", "guid") or _atom_link(element)
+                if link:
+                    published = _child_text(element, "pubDate", "published", "updated")
+                    yield _Entry("link", link, published)
+            else:
+                continue
+            # Remove a entrada já lida da árvore para manter a memória constante
+            if stack:
+                stack[-1].remove(element)
+
+    def _discover(
+        self, url: str, start_date: date, end_date: date, depth: int
+    ) -> Iterator[str]:
+        for entry in self._iter_entries(url):
+            entry_date = parse_entry_date(entry.lastmod)
+            if entry.kind == "sitemap":
+                # lastmod de um sitemap é a última alteração: se for anterior
+                # ao início do intervalo, nada nele é novo o bastante
+                if depth >= self._max_depth or (
+                    entry_date is not None and entry_date < start_date
+                ):
+                    continue
+                yield from self._discover(entry.url, start_date, end_date, depth + 1)
+                continue
+
+            if any(pattern in entry.url for pattern in self._exclude_patterns):
+                continue
+            if entry_date is not None and not start_date <= entry_date <= end_date:
+                continue
+            yield entry.url
+
+    def scrape_news_links_in_range(
+        self, base_url: str, start_date: date, end_date: date
+    ) -> list[str]:
+        """Links do sitemap/feed ``base_url`` publicados no intervalo."""
+        try:
+            discovered = self._discover(base_url, start_date, end_date, 0)
+            links = list(dict.fromkeys(discovered))
+        except (ContentUnavailableError, ParseError, zlib.error) as e:
+            print(f"Error discovering links from {base_url}: {e}")
+            return []
+        return sorted(links)
+
+    def scrape_news_links(self, base_url: str, target_date: datetime) -> list[str]:
+        """Links do sitemap/feed publicados em ``target_date``."""
+        day = target_date.date()
+        return self.scrape_news_links_in_range(base_url, day, day)
+
+    def extract_content(self, url: str) -> str:
+        """Delega a extração ao repositório de conteúdo."""
+        return self._content_repo.extract_content(url)
+
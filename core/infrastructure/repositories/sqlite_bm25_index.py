@@ -0,0 +1,402 @@
+"""SQLite-backed BM25 inverted index with block-packed posting lists."""
+import hashlib
+import heapq
+import itertools
+import math
+import os
+import sqlite3
+import sys
+import threading
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from operator import itemgetter
+
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.application.services.text_analysis import tokenize
+from core.domain.entities.news_article import NewsArticle
+from core.domain.repositories.abstracts.abstract_search_index import (
+    AbstractSearchIndex,
+    SearchHit,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS segments (
+    segment INTEGER PRIMARY KEY,
+    doc_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    doc INTEGER PRIMARY KEY,
+    article_id TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    segment INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    live INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_documents_segment ON documents (segment);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    df INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (term, segment)
+) WITHOUT ROWID;
+"""
+
+# Postings por bloco; cada bloco guarda as distâncias e frequências com a
+# menor largura fixa (1, 2 ou 4 bytes) que comporta seus valores
+_BLOCK_SIZE = 128
+_TYPECODES = {1: "B", 2: "H", 4: "I"}
+_MAX_TF = 0xFFFF
+
+
+def _width(value: int) -> int:
+    return 1 if value < 1 << 8 else 2 if value < 1 << 16 else 4
+
+
+def _pack(width: int, values: Sequence[int]) -> bytes:
+    packed = array(_TYPECODES[width], values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(width: int, data: memoryview) -> array[int]:
+    values = array(_TYPECODES[width])
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def encode_postings(docs: Sequence[int], tfs: Sequence[int]) -> bytes:
+    """Codifica uma lista de postings ordenada por documento.
+
+    Os documentos viram distâncias para o anterior, agrupadas em blocos de
+    até 128 postings. Cada bloco tem 2 bytes de cabeçalho (tamanho e
+    larguras) e usa a menor largura fixa para distâncias e frequências, o que
+    comprime listas densas para cerca de 2 bytes por posting e permite
+    decodificar com ``array`` em vez de byte a byte.
+    """
+    out = bytearray()
+    previous = 0
+    for start in range(0, len(docs), _BLOCK_SIZE):
+        block = docs[start : start + _BLOCK_SIZE]
+        gaps = [doc - before for doc, before in zip(block, [previous, *block[:-1]])]
+        block_tfs = [min(tf, _MAX_TF) for tf in tfs[start : start + _BLOCK_SIZE]]
+        gap_width, tf_width = _width(max(gaps)), _width(max(block_tfs))
+        out.append(len(block) - 1)
+        out.append(gap_width << 4 | tf_width)
+        out += _pack(gap_width, gaps)
+        out += _pack(tf_width, block_tfs)
+        previous = block[-1]
+    return bytes(out)
+
+
+def decode_postings(data: bytes) -> tuple[list[int], list[int]]:
+    """Inverso de ``encode_postings``: listas de documentos e de frequências."""
+    gaps: list[int] = []
+    tfs: list[int] = []
+    view = memoryview(data)
+    position = 0
+    while position < len(data):
+        count = data[position] + 1
+        widths = data[position + 1]
+        position += 2
+        for values, width in ((gaps, widths >> 4), (tfs, widths & 0x0F)):
+            end = position + count * width
+            values.extend(_unpack(width, view[position:end]))
+            position = end
+    return list(itertools.accumulate(gaps)), tfs
+
+
+def _indexed_text(article: NewsArticle) -> str:
+    parts = (article.title, article.content, article.summary)
+    return "\n".join(part for part in parts if part)
+
+
+class SQLiteBM25Index(AbstractSearchIndex):
+    """Índice invertido BM25 em segmentos imutáveis gravados em SQLite.
+
+    Cada ``add_batch`` grava um segmento novo, com uma linha por termo cuja
+    lista de postings é gravada em blocos de 128 distâncias e frequências de
+    largura fixa (1, 2 ou 4 bytes por bloco). Um artigo reindexado apenas
+    marca o documento anterior como removido; quando há mais de
+    ``max_segments`` segmentos, os ``merge_factor`` menores são fundidos e os
+    documentos removidos descartados. Os comprimentos dos documentos vivos
+    ficam em memória para pontuar sem consultas extras, e a consulta lê só as
+    linhas dos termos pedidos pela chave primária.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        k1: float = 1.2,
+        b: float = 0.75,
+        max_segments: int = 8,
+        merge_factor: int = 4,
+        metrics: MetricsRegistry | None = None,
+    ):
+        if merge_factor < 2:
+            raise ValueError("merge_factor deve ser pelo menos 2")
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._k1 = k1
+        self._b = b
+        self._max_segments = max_segments
+        self._merge_factor = merge_factor
+        self._metrics = metrics if metrics is not None else REGISTRY
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._load()
+
+    def _load(self) -> None:
+        """Carrega os documentos vivos: ID do artigo, comprimento e digest."""
+        self._articles: dict[int, str] = {}
+        self._lengths: dict[int, int] = {}
+        self._by_article: dict[str, tuple[int, bytes]] = {}
+        rows = self._conn.execute(
+            "SELECT doc, article_id, length, digest FROM documents WHERE live = 1"
+        )
+        for doc, article_id, length, digest in rows:
+            self._articles[doc] = article_id
+            self._lengths[doc] = length
+            self._by_article[article_id] = (doc, digest)
+        self._total_length = sum(self._lengths.values())
+        last = self._conn.execute("SELECT MAX(doc) FROM documents").fetchone()[0]
+        self._next_doc = (last or 0) + 1
+        self._norms: dict[int, float] | None = None
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conn.close()
+
+    @property
+    def document_count(self) -> int:
+        """Quantidade de artigos indexados."""
+        with self._lock:
+            return len(self._lengths)
+
+    @property
+    def segment_count(self) -> int:
+        """Quantidade de segmentos gravados."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM segments").fetchone()
+            return int(row[0])
+
+    def add_batch(self, articles: list[NewsArticle]) -> int:
+        """Grava os artigos novos ou alterados em um novo segmento."""
+        with self._lock:
+            pending: dict[str, tuple[Counter[str], bytes]] = {}
+            for article in articles:
+                text = _indexed_text(article)
+                digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+                known = self._by_article.get(article.id)
+                if known is not None and known[1] == digest:
+                    continue
+                pending[article.id] = (Counter(tokenize(text)), digest)
+            if not pending:
+                return 0
+
+            replaced = [
+                self._by_article[article_id][0]
+                for article_id in pending
+                if article_id in self._by_article
+            ]
+            documents: list[tuple[int, str, int, bytes]] = []
+            postings: dict[str, tuple[list[int], list[int]]] = {}
+            for offset, (article_id, (terms, digest)) in enumerate(pending.items()):
+                doc = self._next_doc + offset
+                documents.append((doc, article_id, sum(terms.values()), digest))
+                for term, tf in terms.items():
+                    docs, tfs = postings.setdefault(term, ([], []))
+                    docs.append(doc)
+                    tfs.append(tf)
+
+            with self._conn:
+                segment = self._conn.execute(
+                    "INSERT INTO segments (doc_count) VALUES (?)", (len(documents),)
+                ).lastrowid
+                self._conn.executemany(
+                    "UPDATE documents SET live = 0 WHERE doc = ?",
+                    [(old,) for old in replaced],
+                )
+                self._conn.executemany(
+                    "INSERT INTO documents (doc, article_id, length, segment, digest) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (doc, article_id, length, segment, digest)
+                        for doc, article_id, length, digest in documents
+                    ],
+                )
+                self._conn.executemany(
+                    "INSERT INTO postings (term, segment, df, data) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (term, segment, len(docs), encode_postings(docs, tfs))
+                        for term, (docs, tfs) in postings.items()
+                    ],
+                )
+
+            # O estado em memória só muda depois do commit
+            for old in replaced:
+                del self._articles[old]
+                self._total_length -= self._lengths.pop(old)
+            for doc, article_id, length, digest in documents:
+                self._articles[doc] = article_id
+                self._lengths[doc] = length
+                self._by_article[article_id] = (doc, digest)
+                self._total_length += length
+            self._next_doc += len(documents)
+            self._norms = None
+            self._merge_small_segments()
+            return len(documents)
+
+    def _merge_small_segments(self) -> None:
+        while True:
+            rows = self._conn.execute(
+                "SELECT segment FROM segments ORDER BY doc_count, segment"
+            ).fetchall()
+            if len(rows) <= self._max_segments:
+                return
+            self._merge([row[0] for row in rows[: self._merge_factor]])
+
+    def optimize(self) -> None:
+        """Funde todos os segmentos em um só, descartando documentos removidos."""
+        with self._lock:
+            rows = self._conn.execute("SELECT segment FROM segments").fetchall()
+            if len(rows) > 1:
+                self._merge([row[0] for row in rows])
+
+    def _merge(self, segments: list[int]) -> None:
+        """Funde os segmentos em um novo, mantendo só os documentos vivos."""
+        marks = ", ".join("?" * len(segments))
+        rows = self._conn.execute(
+            f"SELECT term, df, data FROM postings WHERE segment IN ({marks}) "
+            "ORDER BY term",
+            segments,
+        ).fetchall()
+        removed = self._conn.execute(
+            f"SELECT COUNT(*) FROM documents WHERE segment IN ({marks}) AND live = 0",
+            segments,
+        ).fetchone()[0]
+        with self._conn:
+            merged = self._conn.execute(
+                "INSERT INTO segments (doc_count) VALUES (0)"
+            ).lastrowid
+            batch: list[tuple[str, int | None, int, bytes]] = []
+            for term, group in itertools.groupby(rows, key=itemgetter(0)):
+                lists = [(df, data) for _, df, data in group]
+                if len(lists) == 1 and not removed:
+                    # Sem nada a descartar, a lista de um só segmento é copiada
+                    batch.append((term, merged, *lists[0]))
+                    continue
+                # Os segmentos não são contíguos: intercala por documento
+                entries = heapq.merge(
+                    *(zip(*decode_postings(data), strict=True) for _, data in lists)
+                )
+                docs, tfs = [], []
+                for doc, tf in entries:
+                    if doc in self._lengths:
+                        docs.append(doc)
+                        tfs.append(tf)
+                if docs:
+                    batch.append((term, merged, len(docs), encode_postings(docs, tfs)))
+            self._conn.executemany(
+                "INSERT INTO postings (term, segment, df, data) VALUES (?, ?, ?, ?)",
+                batch,
+            )
+            self._conn.execute(
+                f"DELETE FROM postings WHERE segment IN ({marks})", segments
+            )
+            self._conn.execute(
+                f"DELETE FROM documents WHERE segment IN ({marks}) AND live = 0",
+                segments,
+            )
+            self._conn.execute(
+                f"UPDATE documents SET segment = ? WHERE segment IN ({marks})",
+                (merged, *segments),
+            )
+            self._conn.execute(
+                f"DELETE FROM segments WHERE segment IN ({marks})", segments
+            )
+            self._conn.execute(
+                "UPDATE segments SET doc_count = "
+                "(SELECT COUNT(*) FROM documents WHERE segment = ?) "
+                "WHERE segment = ?",
+                (merged, merged),
+            )
+
+    def _doc_norms(self) -> dict[int, float]:
+        """Parte de BM25 que depende só do comprimento do documento."""
+        if self._norms is None:
+            average = self._total_length / len(self._lengths) or 1.0
+            k1, b = self._k1, self._b
+            self._norms = {
+                doc: k1 * (1 - b + b * length / average)
+                for doc, length in self._lengths.items()
+            }
+        return self._norms
+
+    def search(self, query: str, k: int = 10) -> list[SearchHit]:
+        """Pontua com BM25 os documentos que contêm termos da consulta.
+
+        Os termos são processados do mais raro ao mais comum (MaxScore). A
+        contribuição de um termo nunca passa de ``idf * (k1 + 1)``; quando a
+        soma desse limite para os termos restantes não alcança a ``k``-ésima
+        pontuação parcial, nenhum documento novo pode entrar no resultado e os
+        termos restantes só atualizam os candidatos já encontrados. A
+        frequência de documento soma a de todos os segmentos, incluindo
+        documentos removidos ainda não descartados por uma fusão.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or k < 1:
+            return []
+        with self._lock, self._metrics.time("search_query_seconds", index="bm25"):
+            total = len(self._lengths)
+            if not total:
+                return []
+            norms = self._doc_norms()
+            weighted: list[tuple[float, list[bytes]]] = []
+            for term in terms:
+                rows = self._conn.execute(
+                    "SELECT df, data FROM postings WHERE term = ?", (term,)
+                ).fetchall()
+                df = sum(row[0] for row in rows)
+                if df:
+                    idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                    weighted.append((idf * (self._k1 + 1), [row[1] for row in rows]))
+            weighted.sort(key=itemgetter(0), reverse=True)
+
+            scores: dict[int, float] = {}
+            remaining = sum(weight for weight, _ in weighted)
+            for weight, blobs in weighted:
+                threshold = (
+                    heapq.nlargest(k, scores.values())[-1] if len(scores) >= k else 0.0
+                )
+                essential = remaining > threshold
+                remaining -= weight
+                for data in blobs:
+                    docs, tfs = decode_postings(data)
+                    if essential:
+                        for doc, tf in zip(docs, tfs, strict=True):
+                            norm = norms.get(doc)
+                            if norm is not None:
+                                scores[doc] = scores.get(doc, 0.0) + weight * tf / (
+                                    tf + norm
+                                )
+                    else:
+                        frequencies = dict(zip(docs, tfs, strict=True))
+                        for doc in scores:
+                            frequency = frequencies.get(doc)
+                            if frequency is not None:
+                                scores[doc] += (
+                                    weight * frequency / (frequency + norms[doc])
+                                )
+            best = heapq.nlargest(k, scores.items(), key=itemgetter(1))
+            return [SearchHit(self._articles[doc], score) for doc, score in best]
@@ -0,0 +1,123 @@
+"""SQLite-backed LSH index of MinHash signatures."""
+import os
+import sqlite3
+import threading
+from array import array
+
+from core.application.services.minhash import band_keys, similarity
+from core.domain.repositories.abstracts.abstract_near_duplicate_index import (
+    AbstractNearDuplicateIndex,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    id TEXT PRIMARY KEY,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_buckets ON buckets (band, bucket);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class SQLiteMinHashIndex(AbstractNearDuplicateIndex):
+    """Índice LSH em SQLite: cada banda da assinatura vira uma linha indexada.
+
+    Uma consulta faz ``bands`` buscas pelo índice ``(band, bucket)`` e só
+    compara a assinatura completa com os candidatos encontrados, então o
+    custo por artigo não cresce com o tamanho do corpus. ``num_perm`` e
+    ``bands`` ficam gravados no banco e precisam ser os mesmos entre
+    execuções, senão as assinaturas não são comparáveis.
+    """
+
+    def __init__(self, db_path: str, num_perm: int, bands: int):
+        if num_perm % bands:
+            raise ValueError("num_perm deve ser múltiplo de bands")
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._bands = bands
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._check_settings({"num_perm": num_perm, "bands": bands})
+
+    def _check_settings(self, settings: dict[str, int]) -> None:
+        with self._conn:
+            for key, value in settings.items():
+                row = self._conn.execute(
+                    "SELECT value FROM settings WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute(
+                        "INSERT INTO settings (key, value) VALUES (?, ?)",
+                        (key, value),
+                    )
+                elif row[0] != value:
+                    raise ValueError(
+                        f"Índice criado com {key}={row[0]}, recebido {value}"
+                    )
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _encode(signature: list[int]) -> bytes:
+        return array("Q", signature).tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> list[int]:
+        values = array("Q")
+        values.frombytes(blob)
+        return values.tolist()
+
+    def _candidates(self, keys: list[int]) -> set[str]:
+        candidates: set[str] = set()
+        for band, bucket in enumerate(keys):
+            rows = self._conn.execute(
+                "SELECT id FROM buckets WHERE band = ? AND bucket = ?",
+                (band, bucket),
+            )
+            candidates.update(row[0] for row in rows)
+        return candidates
+
+    def find_or_add(
+        self, article_id: str, signature: list[int], threshold: float
+    ) -> str | None:
+        """Procura um artigo similar pelas bandas LSH; indexa se não houver."""
+        keys = band_keys(signature, self._bands)
+        with self._lock:
+            known = self._conn.execute(
+                "SELECT 1 FROM signatures WHERE id = ?", (article_id,)
+            ).fetchone()
+            if known is not None:
+                return None
+
+            for candidate in sorted(self._candidates(keys)):
+                row = self._conn.execute(
+                    "SELECT signature FROM signatures WHERE id = ?", (candidate,)
+                ).fetchone()
+                if similarity(signature, self._decode(row[0])) >= threshold:
+                    return candidate
+
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO signatures (id, signature) VALUES (?, ?)",
+                    (article_id, self._encode(signature)),
+                )
+                self._conn.executemany(
+                    "INSERT INTO buckets (band, bucket, id) VALUES (?, ?, ?)",
+                    [(band, bucket, article_id) for band, bucket in enumerate(keys)],
+                )
+            return None
@@ -0,0 +1,276 @@
+"""SQLite implementation of the news article repository."""
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from core.application.services.metrics import REGISTRY, MetricsRegistry
+from core.domain.entities.news_article import ArticleStage, LazyContent, NewsArticle
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+    ArticleQuery,
+    check_fields,
+    naive_utc,
+)
+
+_COLUMNS = (
+    "id",
+    "url",
+    "title",
+    "content",
+    "summary",
+    "published_date",
+    "source",
+    "stage",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT,
+    content TEXT,
+    summary TEXT,
+    published_date TEXT,
+    source TEXT NOT NULL DEFAULT 'CNN',
+    stage TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_url ON articles (url);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source);
+CREATE INDEX IF NOT EXISTS idx_articles_published_date
+    ON articles (published_date);
+"""
+
+# Artigos antigos não têm estágio gravado: deduz como ArticleStage.infer
+_STAGE_EXPR = (
+    "COALESCE(stage, CASE WHEN summary != '' THEN 'summarized' "
+    "WHEN content != '' THEN 'extracted' ELSE 'scraped' END)"
+)
+
+# Leitura sem o texto: 1 quando há conteúdo, carregado depois sob demanda;
+# NULL e texto vazio são devolvidos como estão
+_LAZY_COLUMNS = (
+    "id",
+    "url",
+    "title",
+    "CASE WHEN content != '' THEN 1 ELSE content END",
+    "summary",
+    "published_date",
+    "source",
+    _STAGE_EXPR,
+)
+
+_UPSERT = f"""
+INSERT INTO articles ({", ".join(_COLUMNS)})
+VALUES ({", ".join("?" for _ in _COLUMNS)})
+ON CONFLICT (id) DO UPDATE SET
+    {", ".join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])}
+"""
+
+
+class SQLiteNewsRepository(AbstractNewsRepository):
+    """Implementação usando SQLite em modo WAL."""
+
+    def __init__(
+        self,
+        db_path: str,
+        fetch_size: int = 500,
+        metrics: MetricsRegistry | None = None,
+    ):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fetch_size = fetch_size
+        self._metrics = metrics if metrics is not None else REGISTRY
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        # Um único método ligado compartilhado por todas as LazyContent
+        self._content_loader = self._load_content
+
+    def _migrate(self) -> None:
+        """Adiciona colunas criadas depois da primeira versão do esquema."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(articles)")}
+        if "stage" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE articles ADD COLUMN stage TEXT")
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_row(article: NewsArticle) -> tuple[Any, ...]:
+        return (
+            article.id,
+            article.url,
+            article.title,
+            article.content,
+            article.summary,
+            naive_utc(article.published_date).isoformat()
+            if article.published_date
+            else None,
+            article.source,
+            article.stage.value,
+        )
+
+    @staticmethod
+    def _to_article(row: tuple[Any, ...]) -> NewsArticle:
+        article_id, url, title, content, summary, published_date, source, stage = row
+        return NewsArticle(
+            id=article_id,
+            url=url,
+            title=title,
+            content=content,
+            summary=summary,
+            published_date=datetime.fromisoformat(published_date)
+            if published_date
+            else None,
+            source=source,
+            stage=ArticleStage(stage)
+            if stage
+            else ArticleStage.infer(content, summary),
+        )
+
+    def _to_lazy_article(self, row: tuple[Any, ...]) -> NewsArticle:
+        article_id, url, title, content, summary, published, source, stage = row
+        return NewsArticle(
+            id=article_id,
+            url=url,
+            title=title,
+            content=LazyContent(self._content_loader, article_id)
+            if content == 1
+            else content,
+            summary=summary,
+            published_date=datetime.fromisoformat(published) if published else None,
+            source=source,
+            stage=ArticleStage(stage),
+        )
+
+    def _load_content(self, article_id: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM articles WHERE id = ?", (article_id,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def _iter_query(
+        self, where: str = "", params: tuple[Any, ...] = (), lazy: bool = False
+    ) -> Iterator[NewsArticle]:
+        """Percorre o resultado com um cursor, em lotes de ``fetch_size``.
+
+        Com ``lazy``, a coluna ``content`` não é lida: cada artigo recebe uma
+        ``LazyContent`` que a busca pelo ID quando acessada.
+        """
+        columns = _LAZY_COLUMNS if lazy else _COLUMNS
+        to_article = self._to_lazy_article if lazy else self._to_article
+        sql = f"SELECT {', '.join(columns)} FROM articles {where}"
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            rows = cursor.fetchmany(self._fetch_size)
+        while rows:
+            for row in rows:
+                yield to_article(row)
+            with self._lock:
+                rows = cursor.fetchmany(self._fetch_size)
+
+    def save(self, article: NewsArticle) -> None:
+        """Salva um artigo."""
+        self.save_batch([article])
+
+    def save_batch(self, articles: list[NewsArticle]) -> None:
+        """Salva múltiplos artigos com um upsert em uma única transação."""
+        rows = [self._to_row(article) for article in articles]
+        if not rows:
+            return
+        with (
+            self._metrics.time("repository_write_seconds", repository="sqlite"),
+            self._lock,
+            self._conn,
+        ):
+            self._conn.executemany(_UPSERT, rows)
+
+    def find_by_id(self, article_id: str) -> NewsArticle | None:
+        """Busca artigo por ID."""
+        return next(self._iter_query("WHERE id = ?", (article_id,)), None)
+
+    def find_by_url(self, url: str) -> list[NewsArticle]:
+        """Busca artigos pela URL."""
+        return list(self._iter_query("WHERE url = ?", (url,)))
+
+    def find_by_source(self, source: str) -> Iterator[NewsArticle]:
+        """Percorre os artigos de uma fonte."""
+        return self._iter_query("WHERE source = ? ORDER BY id", (source,))
+
+    def find_by_date_range(
+        self, start: datetime, end: datetime
+    ) -> Iterator[NewsArticle]:
+        """Percorre os artigos publicados no intervalo ``[start, end)``."""
+        return self._iter_query(
+            "WHERE published_date >= ? AND published_date < ? "
+            "ORDER BY published_date",
+            (naive_utc(start).isoformat(), naive_utc(end).isoformat()),
+        )
+
+    def iter_all(self) -> Iterator[NewsArticle]:
+        """Percorre todos os artigos sem materializá-los de uma vez."""
+        return self._iter_query("ORDER BY id")
+
+    @staticmethod
+    def _keyset(query: ArticleQuery) -> tuple[str, tuple[Any, ...]]:
+        """``WHERE ... ORDER BY id LIMIT`` de uma consulta paginada por chave."""
+        conditions: list[str] = []
+        params: list[Any] = []
+        if query.after_id is not None:
+            conditions.append("id > ?")
+            params.append(query.after_id)
+        if query.source is not None:
+            conditions.append("source = ?")
+            params.append(query.source)
+        if query.published_from is not None:
+            conditions.append("published_date >= ?")
+            params.append(query.published_from.isoformat())
+        if query.published_to is not None:
+            conditions.append("published_date < ?")
+            params.append(query.published_to.isoformat())
+        sql = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        sql += "ORDER BY id"
+        if query.limit is not None:
+            sql += " LIMIT ?"
+            params.append(query.limit)
+        return sql, tuple(params)
+
+    def iter_articles(self, query: ArticleQuery | None = None) -> Iterator[NewsArticle]:
+        """Percorre os artigos da consulta pelo índice da chave primária."""
+        return self._iter_query(*self._keyset(query or ArticleQuery()))
+
+    def iter_projected(
+        self, query: ArticleQuery | None = None, fields: Sequence[str] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Lê só as colunas pedidas; ``content`` não é carregado se omitido."""
+        selected = check_fields(fields)
+        columns = [_STAGE_EXPR if name == "stage" else name for name in selected]
+        where, params = self._keyset(query or ArticleQuery())
+        sql = f"SELECT {', '.join(columns)} FROM articles {where}"
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            rows = cursor.fetchmany(self._fetch_size)
+        while rows:
+            for row in rows:
+                yield dict(zip(selected, row, strict=True))
+            with self._lock:
+                rows = cursor.fetchmany(self._fetch_size)
+
+    def find_all(self) -> list[NewsArticle]:
+        """Retorna todos os artigos, com o conteúdo carregado sob demanda.
+
+        A lista guarda só os metadados; o texto de cada artigo é lido do
+        banco ao acessar ``content`` (e exige o repositório aberto).
+        """
+        return list(self._iter_query("ORDER BY id", lazy=True))
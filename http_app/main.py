@@ -1,15 +1,72 @@
 """HTTP API application using FastAPI."""
+import asyncio
+import base64
+import binascii
+import itertools
+import json
+import os
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
 
+from core.application.services.job_manager import JobManager, JobStatus
+from core.application.services.metrics import REGISTRY
 from core.application.use_cases.create_item_uc import CreateItemUseCase
+from core.application.use_cases.export_training_data_usecase import (
+    ExportTrainingDataUseCase,
+)
+from core.application.use_cases.prepare_training_data_usecase import (
+    PrepareTrainingDataUseCase,
+)
+from core.application.use_cases.search_articles_usecase import SearchArticlesUseCase
+from core.domain.repositories.abstracts.abstract_embedding_encoder import (
+    EmbeddingUnavailableError,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+    ArticleQuery,
+    check_fields,
+)
+from core.domain.repositories.abstracts.abstract_search_index import (
+    AbstractSearchIndex,
+)
 from core.infrastructure.repositories.in_memory_item_repo import InMemoryItemRepository
+from http_app.pipeline_jobs import PipelineJobRunner
 
-app = FastAPI(title="Item Management API", version="1.0.0")
+# Interval between job state checks in the event stream
+EVENT_POLL_INTERVAL = 0.25
+# A comment line is sent after this many seconds without changes
+EVENT_KEEPALIVE = 15.0
+
+# Records per page when the request does not set a limit
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
 
 repository = InMemoryItemRepository()
+pipeline_runner = PipelineJobRunner(
+    os.getenv("PIPELINE_OUTPUT_DIR", "./data"),
+    storage=os.getenv("PIPELINE_STORAGE", "sqlite"),
+    embedding_encoder=os.getenv("PIPELINE_EMBEDDING_ENCODER", "openai"),
+)
+job_manager = JobManager(
+    pipeline_runner, max_workers=int(os.getenv("PIPELINE_JOB_WORKERS", "2"))
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Cancel running pipeline jobs when the server stops."""
+    yield
+    await asyncio.to_thread(job_manager.shutdown)
+
+
+app = FastAPI(title="Item Management API", version="1.0.0", lifespan=lifespan)
 
 
 class CreateItemRequest(BaseModel):
@@ -68,3 +125,270 @@ def delete_item(item_id: UUID) -> None:
     deleted = repository.delete(item_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Item not found")
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """Expose pipeline metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        REGISTRY.render_prometheus(), media_type="text/plain; version=0.0.4"
+    )
+
+
+class PipelineJobRequest(BaseModel):
+    """Request model for submitting a pipeline run."""
+    sections: list[str] = Field(default_factory=lambda: ["world"], min_length=1)
+    days_ago: int = Field(1, ge=0)
+    days: int = Field(1, ge=1)
+    until: Literal["scraped", "extracted", "summarized", "exported"] = "exported"
+    resume: bool = False
+    incremental: bool = False
+
+
+class JobResponse(BaseModel):
+    """Response model for a pipeline job."""
+    id: str
+    params: dict[str, Any]
+    status: str
+    progress: dict[str, int]
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    version: int
+
+
+def _job_or_404(job_id: str) -> dict[str, Any]:
+    snapshot = job_manager.snapshot(job_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return snapshot
+
+
+@app.post("/jobs", response_model=JobResponse, status_code=202)
+def submit_job(request: PipelineJobRequest) -> JobResponse:
+    """Queue a pipeline run on the background worker pool."""
+    job = job_manager.submit(request.model_dump())
+    return JobResponse(**_job_or_404(job.id))
+
+
+@app.get("/jobs", response_model=list[JobResponse])
+def list_jobs() -> list[JobResponse]:
+    """List known jobs, most recent first."""
+    return [JobResponse(**snapshot) for snapshot in job_manager.list_jobs()]
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str) -> JobResponse:
+    """Get the status and per-stage progress of a job."""
+    return JobResponse(**_job_or_404(job_id))
+
+
+@app.post("/jobs/{job_id}/cancel", response_model=JobResponse, status_code=202)
+def cancel_job(job_id: str) -> JobResponse:
+    """Request cancellation of a queued or running job."""
+    _job_or_404(job_id)
+    if not job_manager.cancel(job_id):
+        raise HTTPException(status_code=409, detail="Job already finished")
+    return JobResponse(**_job_or_404(job_id))
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str) -> StreamingResponse:
+    """Stream job state changes as Server-Sent Events until the job finishes."""
+    _job_or_404(job_id)
+
+    async def events() -> AsyncIterator[str]:
+        version = -1
+        idle = 0.0
+        while True:
+            snapshot = job_manager.snapshot(job_id)
+            if snapshot is None:
+                return
+            if snapshot["version"] != version:
+                version = snapshot["version"]
+                idle = 0.0
+                finished = JobStatus(snapshot["status"]).finished
+                event = "done" if finished else "progress"
+                yield f"event: {event}\nid: {version}\ndata: {json.dumps(snapshot)}\n\n"
+                if finished:
+                    return
+            elif idle >= EVENT_KEEPALIVE:
+                idle = 0.0
+                yield ": keepalive\n\n"
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+            idle += EVENT_POLL_INTERVAL
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def get_news_repository() -> AbstractNewsRepository:
+    """Article repository written by the pipeline jobs."""
+    return pipeline_runner.news_repository()
+
+
+NewsRepository = Annotated[AbstractNewsRepository, Depends(get_news_repository)]
+
+
+def get_search_use_case(
+    mode: Literal["lexical", "semantic"] = "lexical",
+) -> SearchArticlesUseCase:
+    """Search over the BM25 index or, in semantic mode, the embedding index."""
+    index: AbstractSearchIndex
+    if mode == "semantic":
+        try:
+            index = pipeline_runner.vector_index()
+        except (RuntimeError, ImportError) as e:
+            raise HTTPException(
+                status_code=503, detail=f"Semantic search unavailable: {e}"
+            ) from None
+    else:
+        index = pipeline_runner.search_index()
+    return SearchArticlesUseCase(index, pipeline_runner.news_repository())
+
+
+def encode_cursor(article_id: str) -> str:
+    """Opaque cursor pointing just after ``article_id``."""
+    return base64.urlsafe_b64encode(article_id.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Article ID of a cursor returned by a previous page."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.b64decode(padded, altchars=b"-_", validate=True)
+        return raw.decode()
+    except (binascii.Error, UnicodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+def article_query(
+    cursor: str | None = None,
+    source: str | None = None,
+    published_from: datetime | None = None,
+    published_to: datetime | None = None,
+) -> ArticleQuery:
+    """Filters shared by the article and training example endpoints."""
+    return ArticleQuery(
+        source=source,
+        published_from=published_from,
+        published_to=published_to,
+        after_id=decode_cursor(cursor) if cursor else None,
+    )
+
+
+ArticleFilters = Annotated[ArticleQuery, Depends(article_query)]
+PageSize = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+
+
+def _fields(fields: str | None) -> tuple[str, ...]:
+    names = [name.strip() for name in fields.split(",")] if fields else None
+    try:
+        return check_fields(names)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
+
+
+def _ndjson(records: Iterator[dict[str, Any]]) -> StreamingResponse:
+    lines = (json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+def _examples(
+    news_repo: AbstractNewsRepository, query: ArticleQuery
+) -> Iterator[dict[str, Any]]:
+    export_uc = ExportTrainingDataUseCase(news_repo, PrepareTrainingDataUseCase())
+    for article_id, example in export_uc.iter_examples(query):
+        yield {"id": article_id, "input_text": example.input_text}
+
+
+class Page(BaseModel):
+    """One page of records and the cursor of the next one."""
+    items: list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+@app.get("/articles", response_model=Page)
+def list_articles(
+    news_repo: NewsRepository,
+    query: ArticleFilters,
+    limit: PageSize = DEFAULT_PAGE_SIZE,
+    fields: str | None = None,
+) -> Page:
+    """List articles in ID order, one page per request.
+
+    ``fields`` is a comma-separated projection; pass the returned
+    ``next_cursor`` as ``cursor`` to get the next page.
+    """
+    page = news_repo.find_page(query, limit=limit, fields=_fields(fields))
+    next_cursor = encode_cursor(page.next_after_id) if page.next_after_id else None
+    return Page(items=page.records, next_cursor=next_cursor)
+
+
+@app.get("/articles/export")
+def export_articles(
+    news_repo: NewsRepository, query: ArticleFilters, fields: str | None = None
+) -> StreamingResponse:
+    """Stream every matching article as newline-delimited JSON."""
+    return _ndjson(news_repo.iter_projected(query, _fields(fields)))
+
+
+@app.get("/training-examples", response_model=Page)
+def list_training_examples(
+    news_repo: NewsRepository,
+    query: ArticleFilters,
+    limit: PageSize = DEFAULT_PAGE_SIZE,
+) -> Page:
+    """List training examples in article ID order, one page per request."""
+    items = list(itertools.islice(_examples(news_repo, query), limit + 1))
+    next_cursor = encode_cursor(items[limit - 1]["id"]) if len(items) > limit else None
+    return Page(items=items[:limit], next_cursor=next_cursor)
+
+
+@app.get("/training-examples/export")
+def export_training_examples(
+    news_repo: NewsRepository, query: ArticleFilters
+) -> StreamingResponse:
+    """Stream every training example as newline-delimited JSON."""
+    return _ndjson(_examples(news_repo, query))
+
+
+class SearchResultResponse(BaseModel):
+    """Response model for one search result."""
+    id: str
+    score: float
+    url: str
+    title: str | None = None
+    summary: str | None = None
+    source: str
+    published_date: datetime | None = None
+
+
+@app.get("/search", response_model=list[SearchResultResponse])
+def search_articles(
+    search_uc: Annotated[SearchArticlesUseCase, Depends(get_search_use_case)],
+    q: Annotated[str, Query(min_length=1)],
+    k: Annotated[int, Query(ge=1, le=100)] = 10,
+) -> list[SearchResultResponse]:
+    """Return the ``k`` articles that best match ``q``.
+
+    ``mode=lexical`` ranks with BM25; ``mode=semantic`` ranks by embedding
+    similarity.
+    """
+    try:
+        results = search_uc.execute(q, k)
+    except EmbeddingUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from None
+    return [
+        SearchResultResponse(
+            id=result.article.id,
+            score=result.score,
+            url=result.article.url,
+            title=result.article.title,
+            summary=result.article.summary,
+            source=result.article.source,
+            published_date=result.article.published_date,
+        )
+        for result in results
+    ]
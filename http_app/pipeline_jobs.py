@@ -0,0 +1,233 @@
+"""Pipeline wiring for jobs submitted through the HTTP API."""
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from core.application.services.job_manager import Job
+from core.application.services.minhash import MinHasher
+from core.application.use_cases.deduplicate_articles_usecase import (
+    DeduplicateArticlesUseCase,
+)
+from core.application.use_cases.extract_news_content_usecase import (
+    ExtractNewsContentUseCase,
+)
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.application.use_cases.prepare_training_data_usecase import (
+    PrepareTrainingDataUseCase,
+)
+from core.application.use_cases.scrape_news_links_usecase import ScrapeNewsLinksUseCase
+from core.application.use_cases.streaming_pipeline_usecase import (
+    StreamingPipelineUseCase,
+)
+from core.domain.entities.news_article import ArticleStage
+from core.domain.repositories.abstracts.abstract_embedding_encoder import (
+    AbstractEmbeddingEncoder,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from core.domain.repositories.abstracts.abstract_search_index import (
+    AbstractSearchIndex,
+)
+from core.domain.repositories.cnn_scraping_repository import CNNScrapingRepository
+from core.domain.repositories.json_news_repository import JSONNewsRepository
+from core.domain.repositories.open_ai_repository import OpenAIRepository
+from core.infrastructure.ai.hashing_encoder import HashingEncoder
+from core.infrastructure.ai.openai_embedding_encoder import OpenAIEmbeddingEncoder
+from core.infrastructure.ai.rate_limiter import RateLimiter
+from core.infrastructure.cache.summary_cache import SummaryCache
+from core.infrastructure.http.response_cache import HTTPResponseCache
+from core.infrastructure.repositories.cached_ai_repository import CachedAIRepository
+from core.infrastructure.repositories.indexing_news_repository import (
+    IndexingNewsRepository,
+)
+from core.infrastructure.repositories.json_training_data_writer import (
+    JSONTrainingDataWriter,
+)
+from core.infrastructure.repositories.sqlite_bm25_index import SQLiteBM25Index
+from core.infrastructure.repositories.sqlite_minhash_index import SQLiteMinHashIndex
+from core.infrastructure.repositories.sqlite_news_repository import (
+    SQLiteNewsRepository,
+)
+
+
+@dataclass
+class _Components:
+    """Use cases shared by every job, so connections and caches stay warm."""
+
+    scrape_links_uc: ScrapeNewsLinksUseCase
+    extract_content_uc: ExtractNewsContentUseCase
+    generate_summaries_uc: GenerateSummariesUseCase
+    prepare_data_uc: PrepareTrainingDataUseCase
+    deduplicate_uc: DeduplicateArticlesUseCase
+
+
+class PipelineJobRunner:
+    """Run one streaming pipeline per job on long-lived repositories.
+
+    The repositories, HTTP connection pool, rate limiter and summary cache are
+    created on the first job and reused by all later (and concurrent) jobs.
+    Each job writes its examples to ``<output_dir>/jobs/<job_id>/``.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        storage: str = "sqlite",
+        api_key: Callable[[], str | None] = lambda: os.getenv("OPENAI_API_KEY"),
+        embedding_encoder: str = "openai",
+    ):
+        self._output_dir = output_dir
+        self._storage = storage
+        self._api_key = api_key
+        self._embedding_encoder = embedding_encoder
+        self._lock = threading.RLock()
+        self._components: _Components | None = None
+        self._news_repo: AbstractNewsRepository | None = None
+        self._search_index: SQLiteBM25Index | None = None
+        self._vector_index: AbstractSearchIndex | None = None
+
+    def _open_news_repository(self) -> AbstractNewsRepository:
+        if self._storage == "sqlite":
+            return SQLiteNewsRepository(os.path.join(self._output_dir, "articles.db"))
+        return JSONNewsRepository(os.path.join(self._output_dir, "articles.json"))
+
+    def search_index(self) -> SQLiteBM25Index:
+        """BM25 index of the stored articles, opened on first use."""
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = SQLiteBM25Index(
+                    os.path.join(self._output_dir, "search_index.db")
+                )
+            return self._search_index
+
+    def _encoder(self) -> AbstractEmbeddingEncoder:
+        if self._embedding_encoder == "hashing":
+            return HashingEncoder()
+        api_key = self._api_key()
+        if not api_key:
+            raise RuntimeError("OPENAI_API_KEY is not set")
+        return OpenAIEmbeddingEncoder(api_key)
+
+    def vector_index(self) -> AbstractSearchIndex:
+        """Embedding index built by ``cli index-embeddings``, opened on first use.
+
+        Raises ``RuntimeError`` when the encoder cannot be configured and
+        ``ImportError`` when the optional numpy dependency is missing.
+        """
+        with self._lock:
+            if self._vector_index is None:
+                from core.infrastructure.repositories.memmap_vector_index import (
+                    MemmapVectorIndex,
+                )
+
+                self._vector_index = MemmapVectorIndex(
+                    os.path.join(self._output_dir, "embeddings"), self._encoder()
+                )
+            return self._vector_index
+
+    def news_repository(self) -> AbstractNewsRepository:
+        """Article repository shared by the jobs and the read endpoints.
+
+        Articles saved through it are added to ``search_index()``.
+        """
+        with self._lock:
+            if self._news_repo is None:
+                self._news_repo = IndexingNewsRepository(
+                    self._open_news_repository(), self.search_index()
+                )
+            return self._news_repo
+
+    def _build(self) -> _Components:
+        api_key = self._api_key()
+        if not api_key:
+            raise RuntimeError("OPENAI_API_KEY is not set")
+        news_repo = self.news_repository()
+        scraping_repo = CNNScrapingRepository(
+            response_cache=HTTPResponseCache(
+                os.path.join(self._output_dir, "http_cache")
+            )
+        )
+        ai_repo = CachedAIRepository(
+            OpenAIRepository(api_key, rate_limiter=RateLimiter(500, 200_000)),
+            SummaryCache(os.path.join(self._output_dir, "summary_cache.db")),
+        )
+        hasher = MinHasher(num_perm=128)
+        minhash_index = SQLiteMinHashIndex(
+            os.path.join(self._output_dir, "minhash_index.db"),
+            num_perm=hasher.num_perm,
+            bands=DeduplicateArticlesUseCase.bands_for(0.8, hasher.num_perm),
+        )
+        return _Components(
+            scrape_links_uc=ScrapeNewsLinksUseCase(scraping_repo),
+            extract_content_uc=ExtractNewsContentUseCase(scraping_repo, news_repo),
+            generate_summaries_uc=GenerateSummariesUseCase(
+                ai_repo, news_repo, input_token_budget=3000, map_reduce=True
+            ),
+            prepare_data_uc=PrepareTrainingDataUseCase(news_repo),
+            deduplicate_uc=DeduplicateArticlesUseCase(minhash_index, hasher),
+        )
+
+    def components(self) -> _Components:
+        """Shared use cases, built on first use."""
+        with self._lock:
+            if self._components is None:
+                self._components = self._build()
+            return self._components
+
+    def __call__(
+        self, job: Job, report: Callable[[str, int], None]
+    ) -> dict[str, Any]:
+        """Run the pipeline with the job parameters and return its counts."""
+        components = self.components()
+        params = job.params
+        until = ArticleStage(params.get("until", ArticleStage.EXPORTED))
+        section_urls = [
+            section
+            if section.startswith("http")
+            else f"https://edition.cnn.com/{section}"
+            for section in params.get("sections", ["world"])
+        ]
+        pipeline = StreamingPipelineUseCase(
+            components.scrape_links_uc,
+            components.extract_content_uc,
+            components.generate_summaries_uc,
+            components.prepare_data_uc,
+            deduplicate_uc=components.deduplicate_uc,
+        )
+        output_path = os.path.join(
+            self._output_dir, "jobs", job.id, "training_data.json"
+        )
+        writer = JSONTrainingDataWriter(output_path)
+        with writer:
+            result = pipeline.execute(
+                section_urls,
+                writer,
+                days_ago=params.get("days_ago", 1),
+                days=params.get("days", 1),
+                resume=params.get("resume", False),
+                incremental=params.get("incremental", False),
+                until=until,
+                cancel=job.cancel_event,
+                on_progress=report,
+            )
+            # A cancelled or partial run must not replace a previous output
+            published = not result.cancelled and until == ArticleStage.EXPORTED
+            if not published:
+                writer.abort()
+        if published:
+            # Only marked as exported once the output file has been published
+            components.prepare_data_uc.mark_exported(result.exported_ids)
+        return {
+            "links": result.links,
+            "extracted": result.extracted,
+            "duplicates": result.duplicates,
+            "summarized": result.summarized,
+            "examples": result.examples,
+            "cancelled": result.cancelled,
+            "output_path": output_path if published else None,
+        }
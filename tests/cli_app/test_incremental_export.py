@@ -0,0 +1,99 @@
+"""Tests for incremental runs of the run_pipeline command."""
+import glob
+import json
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+import cli_app.main
+from cli_app.main import app
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+)
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractScrapingRepository,
+)
+
+BASE_URL = "https://edition.cnn.com/2025/01/01/world"
+
+
+class FakeScrapingRepository(AbstractScrapingRepository):
+    """Serves the links in ``LINKS`` and a fixed body for every article."""
+
+    LINKS: list[str] = []
+
+    def __init__(self, **kwargs: Any):
+        pass
+
+    def scrape_news_links(self, base_url: str, target_date: datetime) -> list[str]:
+        return list(self.LINKS)
+
+    def extract_content(self, url: str) -> str:
+        return f"Conteúdo de {url}. " * 20
+
+    def fetch_page(self, url: str) -> bytes:
+        return self.extract_content(url).encode("utf-8")
+
+    def page_parser(self) -> Callable[[bytes], str]:
+        return lambda page: page.decode("utf-8")
+
+
+class FakeAIRepository(AbstractAIRepository):
+    def __init__(self, api_key: str, **kwargs: Any):
+        pass
+
+    def generate_summary(self, content: str) -> str:
+        return "Resumo: " + content[:40]
+
+
+@pytest.fixture
+def run(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[list[str]], None]:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(cli_app.main, "CNNScrapingRepository", FakeScrapingRepository)
+    monkeypatch.setattr(cli_app.main, "OpenAIRepository", FakeAIRepository)
+
+    def invoke(links: list[str]) -> None:
+        FakeScrapingRepository.LINKS = links
+        result = CliRunner().invoke(
+            app,
+            [
+                "run-pipeline",
+                "--output-dir",
+                str(tmp_path),
+                "--incremental",
+                "--no-http-cache",
+                "--no-cache",
+                "--no-dedupe",
+                "--parse-workers",
+                "1",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+
+    return invoke
+
+
+def test_incremental_runs_keep_previous_exports(tmp_path, run) -> None:
+    """Test that a second incremental run does not replace the first dataset."""
+    run([f"{BASE_URL}/a", f"{BASE_URL}/b"])
+    run([f"{BASE_URL}/a", f"{BASE_URL}/b", f"{BASE_URL}/c"])
+
+    outputs = sorted(glob.glob(str(tmp_path / "incremental" / "*" / "*.json")))
+    examples = []
+    for output in outputs:
+        with open(output, encoding="utf-8") as f:
+            examples.append(json.load(f))
+
+    assert len(outputs) == 2
+    assert [len(run_examples) for run_examples in examples] == [2, 1]
+    first_run, second_run = (
+        json.dumps(run_examples, ensure_ascii=False) for run_examples in examples
+    )
+    assert f"{BASE_URL}/a" in first_run and f"{BASE_URL}/b" in first_run
+    assert f"{BASE_URL}/c" in second_run
+    assert not (tmp_path / "training_data.json").exists()
@@ -0,0 +1,64 @@
+"""Shared fixtures for the core tests."""
+from collections.abc import Callable
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from core.domain.repositories.json_news_repository import JSONNewsRepository
+from core.infrastructure.repositories.sqlite_news_repository import (
+    SQLiteNewsRepository,
+)
+
+ArticleFactory = Callable[..., NewsArticle]
+
+
+def _make_article(
+    article_id: str,
+    content: str | None = "Content",
+    summary: str | None = None,
+    *,
+    day: int | None = None,
+    source: str = "CNN",
+    stage: ArticleStage | None = None,
+) -> NewsArticle:
+    """Article published on ``2025-01-<day>``; the stage follows the fields."""
+    return NewsArticle(
+        id=article_id,
+        url=f"https://edition.cnn.com/2025/01/{day or 1:02d}/world/{article_id}",
+        content=content,
+        summary=summary,
+        published_date=datetime(2025, 1, day) if day else None,
+        source=source,
+        stage=stage or ArticleStage.infer(content, summary),
+    )
+
+
+@pytest.fixture
+def make_article() -> ArticleFactory:
+    """Factory for test articles."""
+    return _make_article
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def news_repo(request: pytest.FixtureRequest, tmp_path) -> AbstractNewsRepository:
+    """Each news repository backend, empty."""
+    factories: dict[str, Callable[[], AbstractNewsRepository]] = {
+        "json": lambda: JSONNewsRepository(str(tmp_path / "articles.json")),
+        "sqlite": lambda: SQLiteNewsRepository(
+            str(tmp_path / "articles.db"), fetch_size=2
+        ),
+    }
+    return factories[request.param]()
+
+
+@pytest.fixture
+def empty_news_repo() -> Mock:
+    """A repository mock with no stored articles."""
+    news_repo = Mock(spec=AbstractNewsRepository)
+    news_repo.find_by_id.return_value = None
+    return news_repo
@@ -0,0 +1,82 @@
+"""Tests for keyset pagination, filters and projection on news repositories."""
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+    ArticleQuery,
+)
+from tests.core.conftest import ArticleFactory
+
+
+@pytest.fixture
+def repo(
+    news_repo: AbstractNewsRepository, make_article: ArticleFactory
+) -> AbstractNewsRepository:
+    news_repo.save_batch(
+        [
+            make_article("d", day=4),
+            make_article("a", day=1),
+            make_article("c", day=3, source="Reuters"),
+            make_article("b", day=2),
+            make_article("e", day=5),
+        ]
+    )
+    return news_repo
+
+
+def test_pages_follow_id_order_until_the_last(repo: AbstractNewsRepository) -> None:
+    """Test that consecutive pages cover every article exactly once."""
+    seen: list[str] = []
+    query = ArticleQuery()
+    while True:
+        page = repo.find_page(query, limit=2, fields=["id"])
+        seen.extend(record["id"] for record in page.records)
+        if page.next_after_id is None:
+            break
+        query = ArticleQuery(after_id=page.next_after_id)
+
+    assert seen == ["a", "b", "c", "d", "e"]
+
+
+def test_filters_by_source_and_date_range(repo: AbstractNewsRepository) -> None:
+    """Test the source filter and the half-open published_date range."""
+    query = ArticleQuery(
+        source="CNN",
+        published_from=datetime(2025, 1, 2),
+        published_to=datetime(2025, 1, 5),
+    )
+
+    assert [article.id for article in repo.iter_articles(query)] == ["b", "d"]
+
+
+def test_aware_date_filters_match_naive_stored_dates(
+    repo: AbstractNewsRepository,
+) -> None:
+    """Test that both backends compare tz-aware filters in UTC."""
+    brasilia = timezone(timedelta(hours=-3))
+    query = ArticleQuery(
+        published_from=datetime(2025, 1, 1, 21, tzinfo=brasilia),
+        published_to=datetime(2025, 1, 4, tzinfo=UTC),
+    )
+
+    assert [article.id for article in repo.iter_articles(query)] == ["b", "c"]
+
+
+def test_projection_returns_only_requested_fields(
+    repo: AbstractNewsRepository,
+) -> None:
+    """Test that the page keeps the cursor even when id is not projected."""
+    page = repo.find_page(ArticleQuery(after_id="c"), limit=1, fields=["url", "stage"])
+
+    assert page.records == [
+        {"url": "https://edition.cnn.com/2025/01/04/world/d", "stage": "extracted"}
+    ]
+    assert page.next_after_id == "d"
+
+
+def test_projection_rejects_unknown_fields(repo: AbstractNewsRepository) -> None:
+    """Test that an unknown field is reported instead of ignored."""
+    with pytest.raises(ValueError, match="password"):
+        list(repo.iter_projected(fields=["id", "password"]))
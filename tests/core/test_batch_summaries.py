@@ -0,0 +1,102 @@
+"""Unit tests for the offline batch summarization mode."""
+import json
+from unittest.mock import Mock
+
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+    SummaryUnavailableError,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from core.domain.repositories.open_ai_repository import OpenAIRepository
+from core.infrastructure.ai.batch_files import result_line
+from core.infrastructure.repositories.local_batch_repository import (
+    LocalBatchRepository,
+)
+from core.infrastructure.repositories.openai_batch_repository import (
+    OpenAIBatchRepository,
+)
+from tests.core.conftest import ArticleFactory
+
+
+def test_execute_batch_matches_results_by_custom_id(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test the full submit/poll/stream flow with the local backend."""
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.side_effect = lambda content: f"resumo {content[:3]}"
+    news_repo = Mock(spec=AbstractNewsRepository)
+    batch_repo = LocalBatchRepository(ai_repo, str(tmp_path))
+    use_case = GenerateSummariesUseCase(
+        ai_repo, news_repo, batch_repo, save_batch_size=1
+    )
+
+    result = use_case.execute_batch(
+        [
+            make_article("a", "aaa" * 100),
+            make_article("short", "x"),
+            make_article("b", "bbb" * 100),
+        ]
+    )
+
+    assert [(article.id, article.summary) for article in result] == [
+        ("a", "resumo aaa"),
+        ("b", "resumo bbb"),
+    ]
+    assert news_repo.save_batch.call_count == 2
+    input_file = next(tmp_path.glob("*.input.jsonl"))
+    lines = [json.loads(line) for line in input_file.read_text().splitlines()]
+    assert [line["custom_id"] for line in lines] == ["a", "b"]
+    assert lines[0]["url"] == "/v1/chat/completions"
+
+
+def test_failed_requests_are_left_pending(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that per-request errors in the batch do not produce summaries."""
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.side_effect = [SummaryUnavailableError("429"), "ok"]
+    use_case = GenerateSummariesUseCase(
+        ai_repo,
+        Mock(spec=AbstractNewsRepository),
+        LocalBatchRepository(ai_repo, str(tmp_path)),
+    )
+
+    result = use_case.execute_batch(
+        [make_article("a", "x" * 200), make_article("b", "x" * 200)]
+    )
+
+    assert [article.id for article in result] == ["b"]
+
+
+def test_openai_batch_repository_polls_and_parses_output(tmp_path) -> None:
+    """Test the OpenAI backend against a mocked client."""
+    request_builder = OpenAIRepository("test-key")
+    repo = OpenAIBatchRepository(
+        "test-key", request_builder, str(tmp_path), sleep=lambda _: None
+    )
+    repo._client = Mock()
+    repo._client.files.create.return_value = Mock(id="file-in")
+    repo._client.batches.create.return_value = Mock(id="batch-1")
+    repo._client.batches.retrieve.side_effect = [
+        Mock(status="in_progress"),
+        Mock(status="completed"),
+        Mock(status="completed", output_file_id="file-out"),
+    ]
+    output = result_line("a", '{"summary": "resumo"}')
+
+    def write_to_file(path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(output) + "\n")
+
+    repo._client.files.content.return_value = Mock(write_to_file=write_to_file)
+
+    batch_id = repo.submit_batch({"a": "conteúdo"})
+    repo.wait_for_batch(batch_id)
+
+    assert list(repo.iter_results(batch_id)) == [("a", "resumo")]
+    assert repo._client.batches.retrieve.call_count == 3
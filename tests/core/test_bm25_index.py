@@ -0,0 +1,85 @@
+"""Tests for the SQLite BM25 search index and the indexing repository."""
+from core.application.use_cases.search_articles_usecase import SearchArticlesUseCase
+from core.domain.repositories.json_news_repository import JSONNewsRepository
+from core.infrastructure.repositories.indexing_news_repository import (
+    IndexingNewsRepository,
+)
+from core.infrastructure.repositories.sqlite_bm25_index import (
+    SQLiteBM25Index,
+    decode_postings,
+    encode_postings,
+)
+from tests.core.conftest import ArticleFactory
+
+
+def test_postings_round_trip_across_blocks_and_widths() -> None:
+    """Test the block codec with gaps and frequencies of every width."""
+    docs = [1, 2, 300, 70_000, *range(70_001, 70_300)]
+    tfs = [1, 300, 2, 5, *[1] * 299]
+
+    assert decode_postings(encode_postings(docs, tfs)) == (docs, tfs)
+    # A dense block: 2 header bytes plus 1 byte per gap and per frequency
+    assert len(encode_postings([1, 2, 3], [1, 1, 1])) == 8
+
+
+def test_ranks_by_bm25_and_reindexes_changed_articles(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test ranking, replacement of a changed article and skipping unchanged ones."""
+    index = SQLiteBM25Index(str(tmp_path / "index.db"))
+    index.add_batch(
+        [
+            make_article("a", "Flooding hits the coast. Flooding closes roads."),
+            make_article("b", "Elections were held in the capital."),
+            make_article("c", "Coast guard rescues fishermen."),
+        ]
+    )
+
+    assert [hit.article_id for hit in index.search("flooding coast")] == ["a", "c"]
+    unchanged = make_article("b", "Elections were held in the capital.")
+    assert index.add_batch([unchanged]) == 0
+
+    index.add_batch([make_article("a", "Markets rally on trade deal.")])
+
+    assert [hit.article_id for hit in index.search("flooding coast")] == ["c"]
+    assert [hit.article_id for hit in index.search("markets")] == ["a"]
+    assert index.document_count == 3
+
+
+def test_merges_segments_and_survives_reopen(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that small segments are merged and the index is reloaded from disk."""
+    path = str(tmp_path / "index.db")
+    index = SQLiteBM25Index(path, max_segments=3, merge_factor=2)
+    for number in range(10):
+        index.add_batch([make_article(f"id-{number}", f"common topic{number}")])
+    index.add_batch([make_article("id-0", "replaced text")])
+
+    assert index.segment_count <= 3
+    index.optimize()
+    assert index.segment_count == 1
+    index.close()
+
+    reopened = SQLiteBM25Index(path)
+    assert reopened.document_count == 10
+    assert len(reopened.search("common", k=20)) == 9
+    assert [hit.article_id for hit in reopened.search("topic7")] == ["id-7"]
+    assert reopened.search("topic0") == []
+
+
+def test_indexing_repository_feeds_the_search_use_case(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that saved articles become searchable through the use case."""
+    index = SQLiteBM25Index(str(tmp_path / "index.db"))
+    repo = IndexingNewsRepository(
+        JSONNewsRepository(str(tmp_path / "articles.json")), index
+    )
+    repo.save_batch([make_article("a", "Volcano erupts in Iceland.")])
+    repo.save(make_article("b", "Storm reaches Florida.", summary="Hurricane warning"))
+
+    results = SearchArticlesUseCase(index, repo).execute("hurricane")
+
+    assert [result.article.id for result in results] == ["b"]
+    assert results[0].score > 0
@@ -0,0 +1,115 @@
+"""Unit tests for the content-addressed summary cache."""
+from unittest.mock import Mock
+
+import pytest
+
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+    PackedSummaries,
+    SummaryGenerationError,
+)
+from core.infrastructure.cache.summary_cache import SummaryCache
+from core.infrastructure.repositories.cached_ai_repository import CachedAIRepository
+
+
+def _ai_repo(params: dict[str, object] | None = None) -> Mock:
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generation_params.return_value = params or {"model": "m"}
+    ai_repo.generate_summary.side_effect = lambda content: f"resumo {content}"
+    return ai_repo
+
+
+def test_hits_memory_then_disk_across_instances(tmp_path) -> None:
+    """Test that a new process is served from the on-disk tier."""
+    db_path = str(tmp_path / "cache.db")
+    ai_repo = _ai_repo()
+    first = CachedAIRepository(ai_repo, SummaryCache(db_path))
+    assert first.generate_summary("texto") == "resumo texto"
+    assert first.generate_summary("texto") == "resumo texto"
+
+    second = CachedAIRepository(ai_repo, SummaryCache(db_path))
+    assert second.generate_summary("texto") == "resumo texto"
+
+    assert ai_repo.generate_summary.call_count == 1
+    assert first.stats.memory_hits == 1
+    assert second.stats.disk_hits == 1
+
+
+def test_key_depends_on_generation_params(tmp_path) -> None:
+    """Test that changing the model invalidates cached summaries."""
+    cache = SummaryCache(str(tmp_path / "cache.db"))
+    CachedAIRepository(_ai_repo({"model": "a"}), cache).generate_summary("texto")
+    other = _ai_repo({"model": "b"})
+
+    CachedAIRepository(other, cache).generate_summary("texto")
+
+    other.generate_summary.assert_called_once_with("texto")
+
+
+def test_failed_summaries_are_not_cached(tmp_path) -> None:
+    """Test that a failed generation is not stored."""
+    ai_repo = _ai_repo()
+    ai_repo.generate_summary.side_effect = [SummaryGenerationError("boom"), "resumo"]
+    repo = CachedAIRepository(ai_repo, SummaryCache(str(tmp_path / "cache.db")))
+
+    with pytest.raises(SummaryGenerationError):
+        repo.generate_summary("texto")
+
+    assert repo.generate_summary("texto") == "resumo"
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path) -> None:
+    """Test size-based eviction of the oldest entries."""
+    cache = SummaryCache(
+        str(tmp_path / "cache.db"), memory_entries=1, max_disk_bytes=300
+    )
+    keys = [SummaryCache.make_key(str(i), {}) for i in range(4)]
+    for key in keys:
+        cache.put(key, "x" * 50)
+
+    assert cache.stats.evictions > 0
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[-1]) == "x" * 50
+
+
+def test_packed_summaries_do_not_serve_single_requests(tmp_path) -> None:
+    """Test that packed results are keyed by the packed prompt."""
+    ai_repo = _ai_repo()
+    ai_repo.packed_generation_params.return_value = {"model": "m", "mode": "packed"}
+    ai_repo.generate_packed_summaries.side_effect = lambda contents: PackedSummaries(
+        packed={key: f"agrupado {content}" for key, content in contents.items()},
+        individual={},
+    )
+    repo = CachedAIRepository(ai_repo, SummaryCache(str(tmp_path / "cache.db")))
+
+    assert repo.generate_summaries({"a": "texto"}) == {"a": "agrupado texto"}
+    assert repo.generate_summaries({"a": "texto"}) == {"a": "agrupado texto"}
+    assert repo.generate_summary("texto") == "resumo texto"
+    # A single summary in the cache also serves later packed requests
+    assert repo.generate_summaries({"b": "texto"}) == {"b": "resumo texto"}
+
+    ai_repo.generate_packed_summaries.assert_called_once_with({"a": "texto"})
+
+
+def test_packed_lookups_count_once_and_cache_fallbacks_individually(
+    tmp_path,
+) -> None:
+    """Test the hit/miss stats and the key used for fallback summaries."""
+    ai_repo = _ai_repo()
+    ai_repo.packed_generation_params.return_value = {"model": "m", "mode": "packed"}
+    ai_repo.generate_packed_summaries.return_value = PackedSummaries(
+        packed={"a": "agrupado a"}, individual={"b": "individual b"}
+    )
+    repo = CachedAIRepository(ai_repo, SummaryCache(str(tmp_path / "cache.db")))
+
+    repo.generate_summaries({"a": "texto a", "b": "texto b"})
+    assert (repo.stats.hits, repo.stats.misses) == (0, 2)
+
+    result = repo.generate_packed_summaries({"a": "texto a", "b": "texto b"})
+    assert result == PackedSummaries(
+        packed={"a": "agrupado a"}, individual={"b": "individual b"}
+    )
+    assert (repo.stats.hits, repo.stats.misses) == (2, 2)
+    # The fallback used the single-article prompt, so it serves single requests
+    assert repo.generate_summary("texto b") == "individual b"
+    ai_repo.generate_summary.assert_not_called()
@@ -0,0 +1,39 @@
+"""Unit tests for CNN article content parsing."""
+from pathlib import Path
+from unittest.mock import patch
+
+from core.domain.repositories import cnn_scraping_repository
+from core.domain.repositories.cnn_scraping_repository import parse_article_content
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "cnn"
+
+
+def test_json_ld_fast_path_skips_full_soup() -> None:
+    """Test that articleBody is read from JSON-LD without building a DOM."""
+    html = (FIXTURES / "article_json_ld.html").read_text(encoding="utf-8")
+    expected = (FIXTURES / "article_body.txt").read_text(encoding="utf-8")
+
+    with patch.object(cnn_scraping_repository, "BeautifulSoup") as soup:
+        content = parse_article_content(html)
+
+    assert content == expected
+    soup.assert_not_called()
+
+
+def test_html_fallback_when_json_ld_is_missing() -> None:
+    """Test that paragraphs are joined when there is no JSON-LD block."""
+    html = (FIXTURES / "article_html_only.html").read_text(encoding="utf-8")
+    expected = (FIXTURES / "article_body.txt").read_text(encoding="utf-8")
+
+    assert parse_article_content(html) == expected
+
+
+def test_invalid_json_ld_blocks_are_ignored() -> None:
+    """Test that malformed JSON-LD falls through to the next block."""
+    html = (
+        "<script type='application/ld+json'>{not json</script>"
+        '<SCRIPT TYPE="application/ld+json">{"articleBody": "corpo"}</SCRIPT>'
+    )
+
+    assert parse_article_content(html) == "corpo"
+    assert parse_article_content("<html></html>") == "Conteúdo não encontrado"
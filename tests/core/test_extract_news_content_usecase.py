@@ -0,0 +1,86 @@
+"""Unit tests for ExtractNewsContentUseCase."""
+import threading
+import time
+from unittest.mock import Mock
+
+from core.application.use_cases.extract_news_content_usecase import (
+    ExtractNewsContentUseCase,
+)
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractScrapingRepository,
+)
+from core.infrastructure.http.host_throttle import HostThrottle
+
+
+def test_concurrent_execute_preserves_input_order(empty_news_repo: Mock) -> None:
+    """Test that concurrent extraction returns articles in input order."""
+    delays = {"https://a.com/1": 0.05, "https://a.com/2": 0.0, "https://a.com/3": 0.02}
+    scraping_repo = Mock(spec=AbstractScrapingRepository)
+
+    def extract_content(url: str) -> str:
+        time.sleep(delays[url])
+        return f"content {url}"
+
+    scraping_repo.extract_content.side_effect = extract_content
+
+    use_case = ExtractNewsContentUseCase(scraping_repo, empty_news_repo)
+    articles = use_case.execute(list(delays), max_workers=3)
+
+    assert [article.url for article in articles] == list(delays)
+    assert empty_news_repo.save.call_count == 3
+
+
+def test_execute_as_completed_yields_completion_order(empty_news_repo: Mock) -> None:
+    """Test that results arrive in completion order with input indexes."""
+    scraping_repo = Mock(spec=AbstractScrapingRepository)
+    scraping_repo.extract_content.side_effect = lambda url: (
+        time.sleep(0.05 if url.endswith("slow") else 0) or "content"
+    )
+    use_case = ExtractNewsContentUseCase(scraping_repo, empty_news_repo)
+
+    results = list(
+        use_case.execute_as_completed(["https://a.com/slow", "https://a.com/fast"], 2)
+    )
+
+    assert [index for index, _ in results] == [1, 0]
+
+
+def test_host_throttle_limits_concurrency_per_host() -> None:
+    """Test that no more than max_per_host requests run at once per host."""
+    throttle = HostThrottle(max_per_host=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def request() -> None:
+        nonlocal active, peak
+        with throttle.acquire("https://edition.cnn.com/page"):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+
+
+def test_host_throttle_spaces_requests_by_politeness_delay() -> None:
+    """Test that consecutive requests to a host are spaced by the delay."""
+    now = [0.0]
+    sleeps: list[float] = []
+    throttle = HostThrottle(
+        max_per_host=4, politeness_delay=1.0, clock=lambda: now[0], sleep=sleeps.append
+    )
+
+    for _ in range(3):
+        with throttle.acquire("https://edition.cnn.com/page"):
+            pass
+
+    assert sleeps == [1.0, 2.0]
@@ -0,0 +1,117 @@
+"""Unit tests for concurrent, rate-limit-aware summarization."""
+from unittest.mock import Mock
+
+import httpx
+import openai
+
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+    SummaryUnavailableError,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from core.domain.repositories.open_ai_repository import OpenAIRepository
+from core.infrastructure.ai.rate_limiter import RateLimiter
+from tests.core.conftest import ArticleFactory
+
+
+def _rate_limit_error(retry_after: str) -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(
+        429, headers={"retry-after": retry_after}, request=request
+    )
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def _completion(content: str) -> Mock:
+    completion = Mock()
+    completion.choices = [Mock(message=Mock(content=content))]
+    return completion
+
+
+def test_execute_skips_deferred_summaries(make_article: ArticleFactory) -> None:
+    """Test that deferred summaries are neither saved nor returned."""
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.side_effect = [
+        "resumo a",
+        SummaryUnavailableError("429"),
+        "resumo c",
+    ]
+    news_repo = Mock(spec=AbstractNewsRepository)
+    use_case = GenerateSummariesUseCase(ai_repo, news_repo)
+
+    articles = [make_article(article_id, "x" * 200) for article_id in "abc"]
+
+    result = use_case.execute(articles, max_concurrency=1)
+
+    assert [article.id for article in result] == ["a", "c"]
+    assert news_repo.save.call_count == 2
+
+
+def test_concurrent_execute_summarizes_all_articles(
+    make_article: ArticleFactory
+) -> None:
+    """Test that the thread pool summarizes every eligible article."""
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.return_value = "resumo"
+    use_case = GenerateSummariesUseCase(ai_repo, Mock(spec=AbstractNewsRepository))
+    articles = [make_article(str(index), "x" * 200) for index in range(10)]
+
+    result = use_case.execute(articles, max_concurrency=4)
+
+    assert [article.id for article in result] == [str(i) for i in range(10)]
+    assert all(article.summary == "resumo" for article in result)
+
+
+def test_openai_repository_retries_honoring_retry_after() -> None:
+    """Test that a 429 is retried after the server-provided delay."""
+    sleeps: list[float] = []
+    repo = OpenAIRepository("test-key", sleep=sleeps.append)
+    repo._client = Mock()
+    repo._client.chat.completions.create.side_effect = [
+        _rate_limit_error("3"),
+        _completion('{"summary": "ok"}'),
+    ]
+
+    assert repo.generate_summary("content") == "ok"
+    assert sleeps == [3.0]
+
+
+def test_openai_repository_raises_when_retries_are_exhausted() -> None:
+    """Test that exhausted retries surface as SummaryUnavailableError."""
+    repo = OpenAIRepository("test-key", max_retries=1, sleep=lambda _: None)
+    repo._client = Mock()
+    repo._client.chat.completions.create.side_effect = _rate_limit_error("0")
+
+    try:
+        repo.generate_summary("content")
+    except SummaryUnavailableError:
+        pass
+    else:
+        raise AssertionError("SummaryUnavailableError not raised")
+
+
+def test_rate_limiter_waits_for_token_budget() -> None:
+    """Test that the tokens/min bucket delays requests beyond the budget."""
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(
+        requests_per_minute=600,
+        tokens_per_minute=60,
+        clock=lambda: now[0],
+        sleep=sleep,
+    )
+
+    limiter.acquire(60)
+    limiter.acquire(30)
+
+    assert sleeps == [30.0]
@@ -0,0 +1,150 @@
+"""Unit tests for the log-structured JSONNewsRepository."""
+import json
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+from core.domain.repositories.json_news_repository import JSONNewsRepository
+from tests.core.conftest import ArticleFactory
+
+
+def test_save_batch_and_reload(tmp_path, make_article: ArticleFactory) -> None:
+    """Test that a batch is persisted and the index is rebuilt on load."""
+    path = str(tmp_path / "articles.json")
+    repo = JSONNewsRepository(path)
+    repo.save_batch([make_article("a", day=1), make_article("b", day=1)])
+    repo.save(make_article("a", summary="resumo", day=1))
+
+    reloaded = JSONNewsRepository(path)
+
+    assert {article.id for article in reloaded.find_all()} == {"a", "b"}
+    article = reloaded.find_by_id("a")
+    assert article is not None
+    assert article.summary == "resumo"
+    assert article.published_date == datetime(2025, 1, 1)
+
+
+def test_recovery_truncates_torn_tail(tmp_path, make_article: ArticleFactory) -> None:
+    """Test that a partially written record is discarded on load."""
+    path = str(tmp_path / "articles.json")
+    JSONNewsRepository(path).save(make_article("a"))
+    segment = tmp_path / "articles.000001.jsonl"
+    with open(segment, "ab") as f:
+        f.write(b'{"id": "b", "url": "https://x')
+
+    repo = JSONNewsRepository(path)
+    repo.save(make_article("c"))
+
+    assert repo.find_by_id("b") is None
+    assert {article.id for article in JSONNewsRepository(path).find_all()} == {
+        "a",
+        "c",
+    }
+
+
+def test_compaction_keeps_only_live_records(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that compaction streams live records into segments under the cap."""
+    path = str(tmp_path / "articles.json")
+    repo = JSONNewsRepository(path, max_segment_bytes=400)
+    for version in range(5):
+        repo.save_batch(
+            [make_article(article_id, summary=f"v{version}") for article_id in "abcde"]
+        )
+    old_segments = set(os.listdir(tmp_path))
+
+    repo.compact()
+
+    segments = sorted(p for p in os.listdir(tmp_path) if p.endswith(".jsonl"))
+    assert len(segments) > 1
+    assert not old_segments & set(segments)
+    lines = []
+    for segment in segments:
+        assert os.path.getsize(tmp_path / segment) <= 400
+        with open(tmp_path / segment, encoding="utf-8") as f:
+            lines.extend(f.readlines())
+    assert len(lines) == 5
+
+    repo.save(make_article("f"))
+    reloaded = JSONNewsRepository(path)
+    article = reloaded.find_by_id("b")
+    assert article is not None
+    assert article.summary == "v4"
+    assert reloaded.find_by_id("f") is not None
+
+
+def test_failed_compaction_removes_new_segments(
+    tmp_path, make_article: ArticleFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a compaction failure leaves only the original segments."""
+    path = str(tmp_path / "articles.json")
+    repo = JSONNewsRepository(path, max_segment_bytes=400)
+    repo.save_batch([make_article(article_id) for article_id in "abcde"])
+    old_segments = sorted(os.listdir(tmp_path))
+    publish = repo._publish_segment
+    calls: list[int] = []
+
+    def failing_publish(segment, f) -> None:
+        calls.append(segment)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        publish(segment, f)
+
+    monkeypatch.setattr(repo, "_publish_segment", failing_publish)
+
+    with pytest.raises(OSError):
+        repo.compact()
+
+    assert sorted(os.listdir(tmp_path)) == old_segments
+    monkeypatch.undo()
+    repo.save(make_article("a", summary="after"))
+    article = JSONNewsRepository(path).find_by_id("a")
+    assert article is not None
+    assert article.summary == "after"
+
+
+def test_iter_all_does_not_block_writers(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that a paused iteration lets other threads save and compact."""
+    repo = JSONNewsRepository(str(tmp_path / "articles.json"))
+    repo.save_batch([make_article(article_id) for article_id in "abc"])
+    articles = repo.iter_all()
+    first = next(articles)
+
+    writer = threading.Thread(
+        target=lambda: (
+            repo.save(make_article("b", summary="updated")),
+            repo.compact(),
+        ),
+        daemon=True,
+    )
+    writer.start()
+    writer.join(timeout=5)
+
+    assert not writer.is_alive()
+    rest = {article.id: article.summary for article in articles}
+    assert (first.id, rest) == ("a", {"b": "updated", "c": None})
+
+
+def test_migrates_legacy_json_file(tmp_path) -> None:
+    """Test that the old single-object articles.json is imported."""
+    path = tmp_path / "articles.json"
+    legacy = {
+        "a": {
+            "id": "a",
+            "url": "https://edition.cnn.com/a",
+            "content": "legacy",
+            "source": "CNN",
+        }
+    }
+    path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    repo = JSONNewsRepository(str(path))
+
+    article = repo.find_by_id("a")
+    assert article is not None
+    assert article.content == "legacy"
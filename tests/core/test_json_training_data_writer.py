@@ -0,0 +1,51 @@
+"""Unit tests for JSONTrainingDataWriter."""
+import json
+
+import pytest
+
+from core.domain.entities.training_example import TrainingExample
+from core.infrastructure.repositories.json_training_data_writer import (
+    JSONTrainingDataWriter,
+)
+
+
+def test_output_matches_json_dump(tmp_path) -> None:
+    """Test that streaming output equals json.dump(..., indent=4)."""
+    output_file = tmp_path / "training_data.json"
+    examples = [TrainingExample(input_text=f'linha\n"{i}" ação') for i in range(3)]
+
+    with JSONTrainingDataWriter(str(output_file)) as writer:
+        for example in examples:
+            writer.write(example)
+
+    expected = json.dumps(
+        [{"input": example.input_text} for example in examples],
+        indent=4,
+        ensure_ascii=False,
+    )
+    assert output_file.read_text(encoding="utf-8") == expected
+
+
+def test_empty_output_is_an_empty_array(tmp_path) -> None:
+    """Test that closing without examples writes []."""
+    output_file = tmp_path / "training_data.json"
+
+    JSONTrainingDataWriter(str(output_file)).close()
+
+    assert json.loads(output_file.read_text(encoding="utf-8")) == []
+
+
+def test_error_inside_block_keeps_previous_output(tmp_path) -> None:
+    """Test that an exception discards the new file instead of publishing it."""
+    output_file = tmp_path / "training_data.json"
+    with JSONTrainingDataWriter(str(output_file)) as writer:
+        writer.write(TrainingExample(input_text="anterior"))
+    previous = output_file.read_text(encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with JSONTrainingDataWriter(str(output_file)) as writer:
+            writer.write(TrainingExample(input_text="parcial"))
+            raise RuntimeError("extraction failed")
+
+    assert output_file.read_text(encoding="utf-8") == previous
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,65 @@
+"""Unit tests for multi-section, multi-day link discovery."""
+import threading
+from datetime import date
+from unittest.mock import Mock
+
+from core.application.use_cases.scrape_news_links_usecase import ScrapeNewsLinksUseCase
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractScrapingRepository,
+)
+from core.domain.repositories.cnn_scraping_repository import CNNScrapingRepository
+
+SECTION_HTML = """
+<a href="/2025/01/01/world/first">1</a>
+<a href='/2025/01/02/world/second/index.html?ref=home'>2</a>
+<a href="https://edition.cnn.com/2025/01/03/business/third">3</a>
+<a href="/2025/01/02/world/video/clip">video</a>
+<a href="/2025/01/09/world/too-late">late</a>
+<a href="/2025/13/40/world/bad-date">bad</a>
+<a href="/world/undated">undated</a>
+<a href="/2025/01/01/world/first">again</a>
+"""
+
+
+def test_range_matching_in_one_pass() -> None:
+    """Test dated links are matched against the whole range at once."""
+    repo = CNNScrapingRepository()
+    repo._fetch = Mock(return_value=SECTION_HTML)  # type: ignore[method-assign]
+
+    links = repo.scrape_news_links_in_range(
+        "https://edition.cnn.com/world", date(2025, 1, 1), date(2025, 1, 3)
+    )
+
+    assert links == [
+        "https://edition.cnn.com/2025/01/01/world/first",
+        "https://edition.cnn.com/2025/01/02/world/second/index.html",
+        "https://edition.cnn.com/2025/01/03/business/third",
+    ]
+    repo._fetch.assert_called_once()
+
+
+def test_frontier_fetches_sections_concurrently_and_dedupes() -> None:
+    """Test that sections are fetched in parallel and links merged once."""
+    barrier = threading.Barrier(3, timeout=2)
+    scraping_repo = Mock(spec=AbstractScrapingRepository)
+
+    def scrape(section_url: str, start: date, end: date) -> list[str]:
+        # Só passa se as três seções estiverem sendo buscadas ao mesmo tempo
+        barrier.wait()
+        return ["https://edition.cnn.com/shared", f"{section_url}/own"]
+
+    scraping_repo.scrape_news_links_in_range.side_effect = scrape
+    use_case = ScrapeNewsLinksUseCase(scraping_repo)
+
+    links = use_case.execute_frontier(
+        ["https://a.com/world", "https://a.com/business", "https://a.com/us"],
+        date(2025, 1, 1),
+        date(2025, 1, 31),
+    )
+
+    assert links == [
+        "https://a.com/business/own",
+        "https://a.com/us/own",
+        "https://a.com/world/own",
+        "https://edition.cnn.com/shared",
+    ]
@@ -0,0 +1,123 @@
+"""Unit tests for token-budget truncation and map-reduce summarization."""
+import re
+from unittest.mock import Mock
+
+from core.application.services.metrics import MetricsRegistry
+from core.application.services.token_estimator import (
+    chunk_sentences,
+    estimate_tokens,
+    split_sentences,
+    truncate_to_budget,
+)
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.domain.entities.news_article import NewsArticle
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+
+_SENTENCE = "The minister said the new budget would be approved next week."
+
+
+def _long_article(sentences: int) -> NewsArticle:
+    return NewsArticle(
+        id="long",
+        url="https://edition.cnn.com/long",
+        content=" ".join(f"{_SENTENCE[:-1]} {index}." for index in range(sentences)),
+    )
+
+
+def test_estimator_counts_words_numbers_and_punctuation() -> None:
+    """Test the local estimator on the kinds of pieces it distinguishes."""
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("Hello, world!") == 5
+    assert estimate_tokens("1234567") == 4
+    assert estimate_tokens("internationalization") == 5
+
+
+def test_truncation_keeps_whole_sentences() -> None:
+    """Test that truncation stops at a sentence boundary within budget."""
+    text = " ".join([_SENTENCE] * 10)
+
+    truncated = truncate_to_budget(text, 30)
+
+    assert split_sentences(truncated) == [_SENTENCE, _SENTENCE]
+    assert estimate_tokens(truncated) <= 30
+    assert all(estimate_tokens(chunk) <= 30 for chunk in chunk_sentences(text, 30))
+
+
+def test_map_reduce_summarizes_chunks_then_combines() -> None:
+    """Test that every chunk is summarized and reduced level by level."""
+
+    def summarize(content: str) -> str:
+        # Each summary carries how many original chunks it covers
+        covered = [int(count) for count in re.findall(r"resumo (\d+)", content)]
+        return f"resumo {sum(covered) or 1}"
+
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.side_effect = summarize
+    metrics = MetricsRegistry()
+    use_case = GenerateSummariesUseCase(
+        ai_repo,
+        Mock(spec=AbstractNewsRepository),
+        input_token_budget=50,
+        map_reduce=True,
+        max_chunks=3,
+        metrics=metrics,
+    )
+    article = _long_article(20)
+    chunks = chunk_sentences(article.content or "", 50)
+
+    result = use_case.summarize_one(article)
+
+    assert result is not None
+    sent = [call.args[0] for call in ai_repo.generate_summary.call_args_list]
+    mapped = [content for content in sent if "resumo" not in content]
+    reduced = [content for content in sent if "resumo" in content]
+    # Nenhum bloco é descartado: todas as frases chegam à etapa de map
+    assert len(chunks) > 3
+    assert sorted(mapped) == sorted(chunks)
+    # Cada redução combina no máximo max_chunks resumos parciais
+    assert len(reduced) == 1 + -(-len(chunks) // 3)
+    assert all(1 <= content.count("\n\n") + 1 <= 3 for content in reduced)
+    assert all(estimate_tokens(content) <= 50 for content in sent)
+    assert result.summary == f"resumo {len(chunks)}"
+    assert metrics.value("summaries_truncated_total", stage="reduce") == 0
+
+
+def test_map_reduce_counts_truncated_reduce_inputs() -> None:
+    """Test that a reduce group cut to fit the budget is counted."""
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.return_value = _SENTENCE * 3
+    metrics = MetricsRegistry()
+    use_case = GenerateSummariesUseCase(
+        ai_repo,
+        Mock(spec=AbstractNewsRepository),
+        input_token_budget=50,
+        map_reduce=True,
+        max_chunks=2,
+        metrics=metrics,
+    )
+
+    use_case.summarize_one(_long_article(20))
+
+    assert metrics.value("summaries_truncated_total", stage="reduce") > 0
+
+
+def test_truncate_mode_sends_single_request_within_budget() -> None:
+    """Test that without map-reduce the article is truncated to the budget."""
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.return_value = "resumo"
+    use_case = GenerateSummariesUseCase(
+        ai_repo, Mock(spec=AbstractNewsRepository), input_token_budget=50
+    )
+
+    use_case.summarize_one(_long_article(20))
+
+    (content,) = ai_repo.generate_summary.call_args.args
+    assert estimate_tokens(content) <= 50
+    assert content.endswith(".")
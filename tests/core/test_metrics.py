@@ -0,0 +1,130 @@
+"""Unit tests for the metrics registry and pipeline instrumentation."""
+from unittest.mock import Mock
+
+import pytest
+
+from core.application.services.metrics import MetricsRegistry
+from core.application.use_cases.extract_news_content_usecase import (
+    ExtractNewsContentUseCase,
+)
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+    SummaryGenerationError,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractScrapingRepository,
+    ContentUnavailableError,
+)
+from core.domain.repositories.open_ai_repository import OpenAIRepository
+
+
+def test_prometheus_text_has_cumulative_buckets() -> None:
+    """Test counter, gauge and histogram rendering."""
+    metrics = MetricsRegistry()
+    metrics.inc("scrape_fetched_bytes_total", 1024)
+    metrics.max_gauge("pipeline_queue_depth_max", 3, queue="urls")
+    metrics.max_gauge("pipeline_queue_depth_max", 1, queue="urls")
+    for seconds in (0.004, 0.2, 0.2, 7.0):
+        metrics.observe("ai_request_seconds", seconds)
+
+    text = metrics.render_prometheus()
+
+    assert "# TYPE scrape_fetched_bytes_total counter" in text
+    assert "scrape_fetched_bytes_total 1024\n" in text
+    assert 'pipeline_queue_depth_max{queue="urls"} 3\n' in text
+    assert 'ai_request_seconds_bucket{le="0.005"} 1\n' in text
+    assert 'ai_request_seconds_bucket{le="0.25"} 3\n' in text
+    assert 'ai_request_seconds_bucket{le="+Inf"} 4\n' in text
+    assert "ai_request_seconds_count 4\n" in text
+
+
+def test_summaries_estimate_quantiles_from_buckets() -> None:
+    """Test the report row of a timed histogram."""
+    metrics = MetricsRegistry()
+    for _ in range(19):
+        metrics.observe("pipeline_stage_seconds", 0.02, stage="extract")
+    metrics.observe("pipeline_stage_seconds", 3.0, stage="extract")
+
+    (row,) = metrics.summaries()
+
+    assert row.label_text == "stage=extract"
+    assert row.count == 20
+    assert row.p50 == 0.025
+    assert row.p95 == 0.025
+    assert row.max == 3.0
+
+
+def test_fetch_failures_are_counted_by_error_class(empty_news_repo: Mock) -> None:
+    """Test that a network failure is counted instead of stored as content."""
+    metrics = MetricsRegistry()
+    scraping_repo = Mock(spec=AbstractScrapingRepository)
+    scraping_repo.extract_content.side_effect = ContentUnavailableError(
+        "https://a.com/1"
+    )
+    scraping_repo.extract_content.side_effect.__cause__ = TimeoutError()
+    use_case = ExtractNewsContentUseCase(
+        scraping_repo, empty_news_repo, metrics=metrics
+    )
+
+    article = use_case.extract_one("https://a.com/1")
+
+    assert article.content is None
+    assert article.stage == ArticleStage.SCRAPED
+    assert (
+        metrics.value("pipeline_errors_total", stage="extract", error="TimeoutError")
+        == 1
+    )
+
+
+def test_summary_failures_leave_article_unsummarized() -> None:
+    """Test that generation errors are counted and not saved as summaries."""
+    metrics = MetricsRegistry()
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.side_effect = SummaryGenerationError("vazio")
+    news_repo = Mock(spec=AbstractNewsRepository)
+    use_case = GenerateSummariesUseCase(ai_repo, news_repo, metrics=metrics)
+    article = NewsArticle(id="1", url="https://a.com/1", content="palavra " * 100)
+
+    assert use_case.summarize_one(article) is None
+    news_repo.save.assert_not_called()
+    assert (
+        metrics.value(
+            "pipeline_errors_total",
+            stage="summarize",
+            error="SummaryGenerationError",
+        )
+        == 1
+    )
+
+
+@pytest.mark.parametrize("raw", [None, "texto solto", '{"outro": "campo"}'])
+def test_unusable_responses_raise(raw: str | None) -> None:
+    """Test that invalid model output raises instead of returning 'Erro'."""
+    with pytest.raises(SummaryGenerationError):
+        OpenAIRepository.parse_summary(raw)
+
+
+def test_ai_calls_record_latency_and_tokens() -> None:
+    """Test per-call latency and token counters from the API usage."""
+    metrics = MetricsRegistry()
+    repo = OpenAIRepository("key", metrics=metrics)
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = '{"summary": "ok"}'
+    response.usage.prompt_tokens = 120
+    response.usage.completion_tokens = 30
+    repo._client = Mock()
+    repo._client.chat.completions.create.return_value = response
+
+    assert repo.generate_summary("texto") == "ok"
+    assert metrics.value("ai_tokens_total", kind="prompt") == 120
+    assert metrics.value("ai_tokens_total", kind="completion") == 30
+    (row,) = [row for row in metrics.summaries() if row.kind == "histogram"]
+    assert (row.name, row.count) == ("ai_request_seconds", 1)
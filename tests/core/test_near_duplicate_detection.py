@@ -0,0 +1,101 @@
+"""Unit tests for MinHash/LSH near-duplicate detection."""
+import random
+
+import pytest
+
+from core.application.services.metrics import MetricsRegistry
+from core.application.services.minhash import (
+    MinHasher,
+    optimal_bands,
+    shingles,
+    similarity,
+)
+from core.application.use_cases.deduplicate_articles_usecase import (
+    DeduplicateArticlesUseCase,
+)
+from core.infrastructure.repositories.sqlite_minhash_index import SQLiteMinHashIndex
+from tests.core.conftest import ArticleFactory
+
+_VOCABULARY = [f"palavra{index}" for index in range(2000)]
+
+
+def _text(seed: int, words: int = 300) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(words))
+
+
+def _use_case(
+    db_path: str, metrics: MetricsRegistry | None = None
+) -> DeduplicateArticlesUseCase:
+    hasher = MinHasher(num_perm=128)
+    bands = DeduplicateArticlesUseCase.bands_for(0.8, hasher.num_perm)
+    index = SQLiteMinHashIndex(db_path, num_perm=hasher.num_perm, bands=bands)
+    return DeduplicateArticlesUseCase(
+        index, hasher, threshold=0.8, metrics=metrics or MetricsRegistry()
+    )
+
+
+def test_signature_similarity_tracks_jaccard() -> None:
+    """Test that lightly edited texts have a high estimated similarity."""
+    hasher = MinHasher(num_perm=128)
+    original = _text(1)
+    edited = original.replace(original.split()[150], "editado", 1)
+
+    close = similarity(
+        hasher.signature(shingles(original)), hasher.signature(shingles(edited))
+    )
+    far = similarity(
+        hasher.signature(shingles(original)), hasher.signature(shingles(_text(2)))
+    )
+
+    assert close > 0.8
+    assert far < 0.1
+    assert optimal_bands(0.8, 128) == (16, 8)
+
+
+def test_drops_near_duplicates_across_runs(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that the persistent index finds duplicates seen on a previous day."""
+    db_path = str(tmp_path / "minhash_index.db")
+    original = _text(1)
+    edited = original.replace(original.split()[10], "editado", 1)
+
+    first_day = _use_case(db_path).execute(
+        [make_article("a", original), make_article("b", _text(2))]
+    )
+    second_day = _use_case(db_path)
+
+    assert [article.id for article in first_day] == ["a", "b"]
+    assert second_day.duplicate_of(make_article("c", edited)) == "a"
+    # Reprocessar o mesmo artigo não o marca como duplicata de si mesmo
+    assert second_day.duplicate_of(make_article("a", original)) is None
+    assert second_day.duplicate_of(make_article("d", _text(3))) is None
+
+
+def test_near_duplicates_are_counted_and_logged(
+    tmp_path, make_article: ArticleFactory, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that skipped near-duplicates go to the registry and the log."""
+    metrics = MetricsRegistry()
+    use_case = _use_case(str(tmp_path / "minhash_index.db"), metrics)
+    original = _text(1)
+    edited = original.replace(original.split()[10], "editado", 1)
+
+    with caplog.at_level("INFO"):
+        kept = use_case.execute(
+            [make_article("a", original), make_article("b", edited)]
+        )
+
+    assert [article.id for article in kept] == ["a"]
+    assert metrics.value("near_duplicates_total") == 1
+    assert "Quase-duplicata ignorada" in caplog.text
+
+
+def test_index_rejects_incompatible_settings(tmp_path) -> None:
+    """Test that reopening with other LSH parameters fails loudly."""
+    db_path = str(tmp_path / "minhash_index.db")
+    SQLiteMinHashIndex(db_path, num_perm=128, bands=16).close()
+
+    with pytest.raises(ValueError):
+        SQLiteMinHashIndex(db_path, num_perm=128, bands=32)
@@ -0,0 +1,113 @@
+"""Tests for the slotted NewsArticle and its lazily loaded content."""
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from core.domain.entities.news_article import ArticleStage, LazyContent, NewsArticle
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from tests.core.conftest import ArticleFactory
+
+
+def test_article_is_slotted_and_frozen(make_article: ArticleFactory):
+    article = make_article("a", "Body")
+
+    assert not hasattr(article, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        article.title = "Other"  # type: ignore[misc]
+    with pytest.raises(ValueError):
+        NewsArticle(id="", url="https://edition.cnn.com/x")
+
+
+def test_source_is_interned(make_article: ArticleFactory):
+    first = make_article("a", "Body").with_stage(ArticleStage.SCRAPED)
+    second = NewsArticle(id="b", url="https://x", source="".join(["C", "NN"]))
+
+    assert first.source is second.source
+
+
+def test_lazy_content_is_loaded_on_each_access():
+    calls: list[str] = []
+
+    def load(article_id: str) -> str:
+        calls.append(article_id)
+        return f"Body of {article_id}"
+
+    article = NewsArticle(id="a", url="https://x", content=LazyContent(load, "a"))
+
+    assert article.has_content
+    assert calls == []
+    assert article.content == "Body of a"
+    assert article.content == "Body of a"
+    assert calls == ["a", "a"]
+
+
+def test_with_summary_keeps_content_unloaded():
+    calls: list[str] = []
+    article = NewsArticle(
+        id="a",
+        url="https://x",
+        content=LazyContent(lambda article_id: calls.append(article_id) or "", "a"),
+    )
+
+    summarized = article.with_summary("Summary")
+
+    assert summarized.summary == "Summary"
+    assert summarized.stage == ArticleStage.SUMMARIZED
+    assert summarized.has_content
+    assert calls == []
+
+
+def test_copy_and_pickle_resolve_lazy_content():
+    article = NewsArticle(
+        id="a", url="https://x", content=LazyContent(lambda _: "Body", "a")
+    )
+
+    restored = pickle.loads(pickle.dumps(article))
+
+    assert restored == article == copy.copy(article)
+    assert restored.content == "Body"
+    assert hash(restored) == hash(article)
+
+
+def test_find_all_loads_content_on_demand(
+    news_repo: AbstractNewsRepository, make_article: ArticleFactory
+):
+    news_repo.save_batch([make_article("a", "Body"), make_article("b", None)])
+
+    articles = {article.id: article for article in news_repo.find_all()}
+
+    assert isinstance(articles["a"]._content, LazyContent)
+    assert articles["b"]._content is None
+    assert not articles["b"].has_content
+    assert articles["a"].stage == ArticleStage.EXTRACTED
+
+    # Content reflects the store at the time it is read
+    news_repo.save(
+        NewsArticle(
+            id="a",
+            url=articles["a"].url,
+            content="Updated",
+            stage=ArticleStage.EXTRACTED,
+        )
+    )
+    assert articles["a"].content == "Updated"
+    assert articles["a"] != make_article("a", "Body")
+
+
+def test_summarized_lazy_article_round_trips(
+    news_repo: AbstractNewsRepository, make_article: ArticleFactory
+):
+    news_repo.save(make_article("a", "Body"))
+    article = news_repo.find_all()[0]
+
+    news_repo.save(article.with_summary("Summary"))
+
+    stored = news_repo.find_by_id("a")
+    assert stored is not None
+    assert stored.content == "Body"
+    assert stored.summary == "Summary"
+    assert stored.stage == ArticleStage.SUMMARIZED
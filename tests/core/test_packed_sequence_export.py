@@ -0,0 +1,85 @@
+"""Unit tests for the pre-tokenized, sequence-packed export."""
+import json
+from array import array
+
+from core.domain.entities.news_article import NewsArticle
+from core.domain.entities.training_example import SUMMARY_START, TrainingExample
+from core.infrastructure.ai.byte_tokenizer import ByteTokenizer
+from core.infrastructure.repositories.packed_sequence_training_data_writer import (
+    SEGMENT_PADDING,
+    SEGMENT_PROMPT,
+    SEGMENT_SUMMARY,
+    PackedSequenceTrainingDataWriter,
+)
+
+
+def _example(content: str, summary: str = "resumo") -> TrainingExample:
+    return TrainingExample.from_news_article(
+        NewsArticle(id="a", url="https://a.com", content=content, summary=summary)
+    )
+
+
+def _read(path, typecode: str) -> array:
+    values = array(typecode)
+    values.frombytes(path.read_bytes())
+    return values
+
+
+def test_byte_tokenizer_maps_markers_to_single_tokens() -> None:
+    """Test that markers become one special token each."""
+    tokenizer = ByteTokenizer()
+
+    ids = tokenizer.encode(f"ç{SUMMARY_START}a")
+
+    assert ids == [0xC3, 0xA7, tokenizer.special_tokens[SUMMARY_START], ord("a")]
+
+
+def test_packs_examples_with_segments_and_offsets(tmp_path) -> None:
+    """Test first-fit packing, padding and the per-token segments."""
+    tokenizer = ByteTokenizer()
+    examples = [_example("x" * 30), _example("y" * 60), _example("z" * 20)]
+    lengths = [len(tokenizer.encode(example.input_text)) + 1 for example in examples]
+    seq_len = lengths[0] + lengths[2] + 5
+
+    with PackedSequenceTrainingDataWriter(
+        str(tmp_path), tokenizer, seq_len=seq_len
+    ) as writer:
+        for example in examples:
+            writer.write(example)
+
+    meta = json.loads((tmp_path / "meta.json").read_text())
+    tokens = _read(tmp_path / "tokens.bin", "H")
+    segments = (tmp_path / "segments.bin").read_bytes()
+    offsets = _read(tmp_path / "offsets.bin", "q")
+    assert meta["sequences"] == 2
+    assert len(tokens) == len(segments) == 2 * seq_len
+    # O terceiro exemplo entra na primeira sequência, junto com o primeiro
+    assert sorted(end - start for start, end in zip(offsets[::2], offsets[1::2])) == (
+        sorted(lengths)
+    )
+    first_start, first_end = offsets[0], offsets[1]
+    first = segments[first_start:first_end]
+    summary_at = tokens[first_start:first_end].index(
+        tokenizer.special_tokens[SUMMARY_START]
+    )
+    assert set(first[:summary_at]) == {SEGMENT_PROMPT}
+    assert set(first[summary_at:]) == {SEGMENT_SUMMARY}
+    assert tokens[first_end - 1] == tokenizer.special_tokens["<eos>"]
+    assert segments[-1] == SEGMENT_PADDING
+
+
+def test_long_examples_are_truncated_in_the_news_body(tmp_path) -> None:
+    """Test that overflow is cut from the news, keeping the whole summary."""
+    tokenizer = ByteTokenizer()
+
+    with PackedSequenceTrainingDataWriter(
+        str(tmp_path), tokenizer, seq_len=64
+    ) as writer:
+        writer.write(_example("x" * 500))
+        writer.write(_example("x", summary="s" * 100))
+
+    meta = json.loads((tmp_path / "meta.json").read_text())
+    tokens = _read(tmp_path / "tokens.bin", "H")
+    assert (meta["examples"], meta["truncated"], meta["skipped"]) == (1, 1, 1)
+    assert len(tokens) == 64
+    assert tokens[-1] == tokenizer.special_tokens["<eos>"]
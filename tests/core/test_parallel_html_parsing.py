@@ -0,0 +1,84 @@
+"""Unit tests for splitting page fetching from process-pool HTML parsing."""
+import time
+from collections.abc import Callable
+from datetime import datetime
+from unittest.mock import Mock
+
+from core.application.use_cases.extract_news_content_usecase import (
+    ExtractNewsContentUseCase,
+)
+from core.domain.entities.news_article import ArticleStage
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractPageFetchingRepository,
+    ContentUnavailableError,
+)
+from core.domain.repositories.cnn_scraping_repository import parse_article_bytes
+
+
+def _page(body: str) -> bytes:
+    return (
+        '<html><script type="application/ld+json">'
+        f'{{"articleBody": "{body}"}}</script></html>'
+    ).encode()
+
+
+class FakePagesRepository(AbstractPageFetchingRepository):
+    """Serves raw pages with per-URL delays and no inline parsing."""
+
+    def __init__(self, pages: dict[str, tuple[float, bytes | None]]) -> None:
+        self._pages = pages
+
+    def scrape_news_links(self, base_url: str, target_date: datetime) -> list[str]:
+        return []
+
+    def extract_content(self, url: str) -> str:
+        raise AssertionError("extract_content should not be used with a parser")
+
+    def fetch_page(self, url: str) -> bytes:
+        delay, page = self._pages[url]
+        time.sleep(delay)
+        if page is None:
+            raise ContentUnavailableError(url) from ConnectionError("reset")
+        return page
+
+    def page_parser(self) -> Callable[[bytes], str]:
+        return parse_article_bytes
+
+
+def test_parse_pool_keeps_input_order_and_network_errors(empty_news_repo: Mock) -> None:
+    """Test that pooled parsing returns articles in input order."""
+    pages = {
+        "https://a.com/1": (0.1, _page("Olá, primeiro")),
+        "https://a.com/2": (0.0, None),
+        "https://a.com/3": (0.0, _page("terceiro")),
+    }
+    use_case = ExtractNewsContentUseCase(
+        FakePagesRepository(pages), empty_news_repo, parse_workers=2
+    )
+    try:
+        articles = use_case.execute(list(pages), max_workers=3)
+    finally:
+        use_case.close()
+
+    assert [article.url for article in articles] == list(pages)
+    assert [article.content for article in articles] == [
+        "Olá, primeiro",
+        None,
+        "terceiro",
+    ]
+    assert articles[1].stage == ArticleStage.SCRAPED
+    assert empty_news_repo.save.call_count == 3
+
+
+def test_single_parse_worker_keeps_inline_extraction(empty_news_repo: Mock) -> None:
+    """Test that without a pool the adapter's extract_content is used."""
+    scraping_repo = Mock(spec=AbstractPageFetchingRepository)
+    scraping_repo.extract_content.return_value = "content"
+    use_case = ExtractNewsContentUseCase(
+        scraping_repo, empty_news_repo, parse_workers=1
+    )
+
+    article = use_case.extract_one("https://a.com/1")
+
+    assert article.content == "content"
+    scraping_repo.fetch_page.assert_not_called()
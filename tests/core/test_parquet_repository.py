@@ -0,0 +1,83 @@
+"""Unit tests for the Parquet article snapshot and training-data writer."""
+from collections.abc import Callable
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from core.domain.entities.news_article import NewsArticle  # noqa: E402
+from core.domain.entities.training_example import TrainingExample  # noqa: E402
+from core.infrastructure.repositories.parquet_news_repository import (  # noqa: E402
+    ParquetNewsRepository,
+)
+from core.infrastructure.repositories.parquet_training_data_writer import (  # noqa: E402
+    ParquetTrainingDataWriter,
+    iter_training_examples,
+)
+from tests.core.conftest import ArticleFactory  # noqa: E402
+
+
+@pytest.fixture
+def article(make_article: ArticleFactory) -> Callable[[int], NewsArticle]:
+    """Summarized article number ``index`` of the snapshot."""
+    return lambda index: make_article(
+        f"id-{index}", "conteúdo " * 10, f"resumo {index}", day=1 + index % 28
+    )
+
+
+def test_snapshot_round_trip_and_row_groups(
+    tmp_path, article: Callable[[int], NewsArticle]
+) -> None:
+    """Test writing in row groups and reading articles back."""
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "articles.parquet"
+    repo = ParquetNewsRepository(str(path), row_group_size=4)
+
+    assert repo.write_snapshot(article(index) for index in range(10)) == 10
+
+    assert pq.ParquetFile(path).num_row_groups == 3
+    assert repo.find_all() == [article(index) for index in range(10)]
+    assert repo.find_by_id("id-7") == article(7)
+    assert repo.find_by_id("missing") is None
+
+
+def test_column_projection_skips_content(
+    tmp_path, article: Callable[[int], NewsArticle]
+) -> None:
+    """Test reading summaries without loading the content column."""
+    repo = ParquetNewsRepository(str(tmp_path / "articles.parquet"))
+    repo.write_snapshot(article(index) for index in range(3))
+
+    records = list(repo.iter_records(columns=["id", "summary"]))
+    table = repo.read_table(columns=["summary"])
+
+    assert records[0] == {"id": "id-0", "summary": "resumo 0"}
+    assert table.column_names == ["summary"]
+
+
+def test_save_batch_upserts_into_snapshot(
+    tmp_path, article: Callable[[int], NewsArticle]
+) -> None:
+    """Test that saving through the repository port upserts by ID."""
+    repo = ParquetNewsRepository(str(tmp_path / "articles.parquet"))
+    repo.save_batch([article(0), article(1)])
+
+    repo.save(NewsArticle(id="id-0", url="https://edition.cnn.com/0"))
+
+    assert len(repo.find_all()) == 2
+    updated = repo.find_by_id("id-0")
+    assert updated is not None
+    assert updated.summary is None
+
+
+def test_training_examples_round_trip(tmp_path) -> None:
+    """Test the Parquet training-data writer and reader."""
+    path = str(tmp_path / "training_data.parquet")
+    examples = [TrainingExample(input_text=f"exemplo {index}") for index in range(5)]
+
+    with ParquetTrainingDataWriter(path, row_group_size=2) as writer:
+        for example in examples:
+            writer.write(example)
+
+    assert list(iter_training_examples(path, batch_size=2)) == examples
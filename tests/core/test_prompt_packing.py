@@ -0,0 +1,91 @@
+"""Unit tests for multi-article prompt packing."""
+import json
+from unittest.mock import Mock
+
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+)
+from core.domain.repositories.abstracts.abstract_new_repository import (
+    AbstractNewsRepository,
+)
+from core.domain.repositories.open_ai_repository import (
+    PACKED_SYSTEM_PROMPT,
+    OpenAIRepository,
+)
+from tests.core.conftest import ArticleFactory
+
+
+def _completion(content: str) -> Mock:
+    completion = Mock()
+    completion.choices = [Mock(message=Mock(content=content))]
+    return completion
+
+
+def test_use_case_packs_articles_under_token_budget(
+    make_article: ArticleFactory
+) -> None:
+    """Test that articles are grouped without exceeding the budget."""
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summaries.side_effect = lambda contents: {
+        key: f"resumo {key}" for key in contents
+    }
+    ai_repo.generate_summary.return_value = "resumo 4"
+    use_case = GenerateSummariesUseCase(ai_repo, Mock(spec=AbstractNewsRepository))
+    # Cada artigo de 200 caracteres estima 35 tokens
+    articles = [make_article(str(index), "x" * 200) for index in range(5)]
+
+    result = use_case.execute(articles, pack_token_budget=80)
+
+    sizes = [len(call.args[0]) for call in ai_repo.generate_summaries.call_args_list]
+    assert sizes == [2, 2]
+    ai_repo.generate_summary.assert_called_once()
+    assert [article.summary for article in result] == [
+        f"resumo {index}" for index in range(5)
+    ]
+
+
+def test_openai_packed_request_falls_back_for_missing_keys() -> None:
+    """Test the keyed response validation and per-article fallback."""
+    repo = OpenAIRepository("test-key")
+    repo._client = Mock()
+    repo._client.chat.completions.create.side_effect = [
+        _completion(json.dumps({"0": "resumo a", "1": ""})),
+        _completion(json.dumps({"summary": "resumo b"})),
+    ]
+
+    summaries = repo.generate_summaries({"a": "texto a", "b": "texto b"})
+
+    assert summaries == {"a": "resumo a", "b": "resumo b"}
+    packed_call = repo._client.chat.completions.create.call_args_list[0].kwargs
+    assert packed_call["messages"][0]["content"] == PACKED_SYSTEM_PROMPT
+    assert json.loads(packed_call["messages"][1]["content"]) == {
+        "0": "texto a",
+        "1": "texto b",
+    }
+    assert packed_call["max_tokens"] == 400
+
+
+def test_openai_malformed_packed_reply_falls_back_to_each_article() -> None:
+    """Test that a packed reply with the wrong shape does not abort the run."""
+    repo = OpenAIRepository("test-key")
+    repo._client = Mock()
+    malformed = Mock(choices=[])
+    repo._client.chat.completions.create.side_effect = [
+        _completion(json.dumps(["resumo a", "resumo b"])),
+        _completion(json.dumps({"summary": "resumo a"})),
+        _completion(json.dumps({"summary": "resumo b"})),
+        malformed,
+        _completion(json.dumps({"summary": "resumo c"})),
+        _completion("sem json"),
+    ]
+
+    assert repo.generate_summaries({"a": "texto a", "b": "texto b"}) == {
+        "a": "resumo a",
+        "b": "resumo b",
+    }
+    assert repo.generate_summaries({"c": "texto c", "d": "texto d"}) == {
+        "c": "resumo c"
+    }
@@ -0,0 +1,116 @@
+"""Unit tests for the conditional-GET response cache in CNNScrapingRepository."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import requests
+
+from core.domain.repositories.cnn_scraping_repository import CNNScrapingRepository
+from core.infrastructure.http.response_cache import HTTPResponseCache
+
+ARTICLE_URL = "https://edition.cnn.com/2025/01/31/world/story/index.html"
+SECTION_URL = "https://edition.cnn.com/world"
+
+
+def _response(status: int, body: bytes = b"", headers: dict | None = None) -> Mock:
+    response = Mock(spec=requests.Response)
+    response.status_code = status
+    response.content = body
+    response.text = body.decode()
+    response.encoding = "utf-8"
+    response.headers = headers or {}
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    return response
+
+
+def _repo(cache: HTTPResponseCache) -> CNNScrapingRepository:
+    repo = CNNScrapingRepository(response_cache=cache)
+    repo._session = Mock()
+    return repo
+
+
+def test_fresh_entries_are_served_without_network(tmp_path) -> None:
+    """Test that a response within its TTL is read from disk."""
+    cache = HTTPResponseCache(str(tmp_path))
+    repo = _repo(cache)
+    repo._session.get.return_value = _response(200, b"<html>a</html>")
+
+    assert repo._fetch(ARTICLE_URL) == "<html>a</html>"
+    assert repo._fetch(ARTICLE_URL) == "<html>a</html>"
+
+    repo._session.get.assert_called_once()
+
+
+def test_stale_entries_are_revalidated_with_conditional_get(tmp_path) -> None:
+    """Test that a 304 reuses the stored body and sends the validators."""
+    now = [0.0]
+    cache = HTTPResponseCache(str(tmp_path), section_ttl=60, clock=lambda: now[0])
+    repo = _repo(cache)
+    repo._session.get.side_effect = [
+        _response(200, b"<html>v1</html>", {"ETag": '"abc"'}),
+        _response(304),
+    ]
+    repo._fetch(SECTION_URL)
+    now[0] = 120.0
+
+    assert repo._fetch(SECTION_URL) == "<html>v1</html>"
+    headers = repo._session.get.call_args_list[1].kwargs["headers"]
+    assert headers == {"If-None-Match": '"abc"'}
+
+
+def test_ttl_depends_on_url_class(tmp_path) -> None:
+    """Test that article pages live longer than section pages."""
+    cache = HTTPResponseCache(str(tmp_path), section_ttl=60, article_ttl=3600)
+
+    assert cache.ttl_for(SECTION_URL) == 60
+    assert cache.ttl_for(ARTICLE_URL) == 3600
+
+
+def test_offline_mode_replays_cache_and_never_hits_network(tmp_path) -> None:
+    """Test that offline replay serves stale entries and fails on misses."""
+    now = [0.0]
+    online = _repo(HTTPResponseCache(str(tmp_path), clock=lambda: now[0]))
+    online._session.get.return_value = _response(200, b"<html>a</html>")
+    online._fetch(SECTION_URL)
+    now[0] = 10**9
+
+    offline = _repo(HTTPResponseCache(str(tmp_path), offline=True))
+
+    assert offline._fetch(SECTION_URL) == "<html>a</html>"
+    assert offline.scrape_news_links(ARTICLE_URL, Mock()) == []
+    offline._session.get.assert_not_called()
+
+
+def test_body_and_meta_from_different_writes_are_a_miss(tmp_path) -> None:
+    """Test that a body replaced without its metadata is not served."""
+    cache = HTTPResponseCache(str(tmp_path))
+    cache.put(ARTICLE_URL, _response(200, b"<html>v1</html>", {"ETag": '"v1"'}))
+    body_path, _ = cache._paths(ARTICLE_URL)
+
+    # Crash entre a troca do corpo e a dos metadados
+    cache._replace(body_path, b"<html>v2</html>")
+
+    assert cache.get(ARTICLE_URL) is None
+
+
+def test_concurrent_writes_of_the_same_url_stay_consistent(tmp_path) -> None:
+    """Test that a body is never served with another write's validators."""
+    cache = HTTPResponseCache(str(tmp_path))
+    bodies = {f'"{n}"': f"<html>{n}</html>".encode() * 1000 for n in range(8)}
+
+    def put(etag: str) -> None:
+        cache.put(ARTICLE_URL, _response(200, bodies[etag], {"ETag": etag}))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(5):
+            list(pool.map(put, bodies))
+            cached = cache.get(ARTICLE_URL)
+            assert cached is None or bodies[cached.etag or ""] == cached.body
+
+    assert not [
+        name
+        for _, _, names in os.walk(tmp_path)
+        for name in names
+        if name.endswith(".tmp")
+    ]
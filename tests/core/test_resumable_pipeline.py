@@ -0,0 +1,145 @@
+"""Unit tests for deterministic IDs, stage checkpoints and resumable runs."""
+import sqlite3
+from unittest.mock import Mock
+
+from core.application.use_cases.extract_news_content_usecase import (
+    ExtractNewsContentUseCase,
+)
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.application.use_cases.prepare_training_data_usecase import (
+    PrepareTrainingDataUseCase,
+)
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.repositories.abstracts.abstract_ai_repository import (
+    AbstractAIRepository,
+)
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractScrapingRepository,
+    ContentUnavailableError,
+)
+from core.domain.repositories.json_news_repository import JSONNewsRepository
+from core.infrastructure.repositories.sqlite_news_repository import (
+    SQLiteNewsRepository,
+)
+
+URL = "https://edition.cnn.com/2025/01/01/world/story"
+
+
+def test_article_id_is_derived_from_url() -> None:
+    """Test that the same URL always maps to the same article ID."""
+    assert NewsArticle.id_for_url(URL) == NewsArticle.id_for_url(URL + "#comments")
+    assert NewsArticle.id_for_url(URL) != NewsArticle.id_for_url(URL + "-2")
+
+
+def test_resume_reuses_extracted_and_summarized_articles(tmp_path) -> None:
+    """Test that a resumed run makes no network or API calls for done work."""
+    news_repo = JSONNewsRepository(str(tmp_path / "articles.json"))
+    scraping_repo = Mock(spec=AbstractScrapingRepository)
+    scraping_repo.extract_content.return_value = "x" * 200
+    ai_repo = Mock(spec=AbstractAIRepository)
+    ai_repo.generate_summary.return_value = "resumo"
+    extract_uc = ExtractNewsContentUseCase(scraping_repo, news_repo)
+    summaries_uc = GenerateSummariesUseCase(ai_repo, news_repo)
+
+    summaries_uc.summarize_one(extract_uc.extract_one(URL))
+    resumed = summaries_uc.summarize_one(extract_uc.extract_one(URL, resume=True))
+
+    assert scraping_repo.extract_content.call_count == 1
+    assert ai_repo.generate_summary.call_count == 1
+    assert resumed is not None
+    assert resumed.stage == ArticleStage.SUMMARIZED
+    assert len(news_repo.find_all()) == 1
+
+
+def test_incremental_skips_exported_urls(tmp_path) -> None:
+    """Test that only URLs not yet exported are pending."""
+    news_repo = JSONNewsRepository(str(tmp_path / "articles.json"))
+    other_url = URL + "-2"
+    news_repo.save_batch(
+        [
+            NewsArticle(
+                id=NewsArticle.id_for_url(URL),
+                url=URL,
+                content="x",
+                summary="resumo",
+                stage=ArticleStage.SUMMARIZED,
+            ),
+            NewsArticle(
+                id=NewsArticle.id_for_url(other_url),
+                url=other_url,
+                stage=ArticleStage.EXTRACTED,
+            ),
+        ]
+    )
+    extract_uc = ExtractNewsContentUseCase(
+        Mock(spec=AbstractScrapingRepository), news_repo
+    )
+
+    PrepareTrainingDataUseCase(news_repo).mark_exported([NewsArticle.id_for_url(URL)])
+
+    assert extract_uc.pending_urls([URL, other_url, "https://a.com/new"]) == [
+        other_url,
+        "https://a.com/new",
+    ]
+
+
+def test_sqlite_adds_stage_column_to_existing_database(tmp_path) -> None:
+    """Test that databases created before the stage column are migrated."""
+    db_path = str(tmp_path / "articles.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE articles (id TEXT PRIMARY KEY, url TEXT NOT NULL, title TEXT, "
+        "content TEXT, summary TEXT, published_date TEXT, "
+        "source TEXT NOT NULL DEFAULT 'CNN')"
+    )
+    conn.execute(
+        "INSERT INTO articles (id, url, content, summary) VALUES (?, ?, ?, ?)",
+        ("a", URL, "conteúdo", "resumo"),
+    )
+    conn.commit()
+    conn.close()
+
+    repo = SQLiteNewsRepository(db_path)
+    article = repo.find_by_id("a")
+
+    assert article is not None
+    assert article.stage == ArticleStage.SUMMARIZED
+    repo.save(article.with_stage(ArticleStage.EXPORTED))
+    exported = repo.find_by_id("a")
+    assert exported is not None
+    assert exported.stage == ArticleStage.EXPORTED
+    repo.close()
+
+
+def test_extraction_never_regresses_a_stored_article(tmp_path) -> None:
+    """Test that re-extraction keeps the summary and stage, and failures keep all."""
+    news_repo = JSONNewsRepository(str(tmp_path / "articles.json"))
+    article_id = NewsArticle.id_for_url(URL)
+    news_repo.save(
+        NewsArticle(
+            id=article_id,
+            url=URL,
+            title="Título",
+            content="antigo",
+            summary="resumo",
+            stage=ArticleStage.EXPORTED,
+        )
+    )
+    scraping_repo = Mock(spec=AbstractScrapingRepository)
+    scraping_repo.extract_content.side_effect = [
+        "novo",
+        ContentUnavailableError("timeout"),
+    ]
+    extract_uc = ExtractNewsContentUseCase(scraping_repo, news_repo)
+
+    refreshed = extract_uc.extract_one(URL)
+    failed = extract_uc.extract_one(URL)
+
+    assert refreshed.content == "novo"
+    assert failed == refreshed == news_repo.find_by_id(article_id)
+    assert refreshed.summary == "resumo"
+    assert refreshed.title == "Título"
+    assert refreshed.stage == ArticleStage.EXPORTED
+    assert extract_uc.pending_urls([URL]) == []
@@ -0,0 +1,113 @@
+"""Unit tests for the sharded JSONL training-data export."""
+import gzip
+import hashlib
+import json
+
+import pytest
+
+from core.application.use_cases.export_training_data_usecase import (
+    ExportTrainingDataUseCase,
+)
+from core.application.use_cases.prepare_training_data_usecase import (
+    PrepareTrainingDataUseCase,
+)
+from core.domain.entities.news_article import NewsArticle
+from core.domain.entities.training_example import TrainingExample
+from core.domain.repositories.json_news_repository import JSONNewsRepository
+from core.infrastructure.repositories.sharded_jsonl_training_data_writer import (
+    ShardedJSONLTrainingDataWriter,
+)
+
+
+def _examples(count: int) -> list[TrainingExample]:
+    return [TrainingExample(input_text=f"exemplo {index}") for index in range(count)]
+
+
+def test_shards_split_and_manifest_checksums(tmp_path) -> None:
+    """Test shard rotation, the split and that the manifest matches the files."""
+    with ShardedJSONLTrainingDataWriter(
+        str(tmp_path), shard_size=10, compression="gzip", validation_ratio=0.2
+    ) as writer:
+        for example in _examples(50):
+            writer.write(example)
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest["examples"] == 50
+    assert sum(split["examples"] for split in manifest["splits"].values()) == 50
+    assert manifest["splits"]["validation"]["examples"] > 0
+
+    lines = []
+    for shard in manifest["shards"]:
+        data = (tmp_path / shard["file"]).read_bytes()
+        assert hashlib.sha256(data).hexdigest() == shard["sha256"]
+        assert len(data) == shard["bytes"]
+        shard_lines = gzip.decompress(data).decode("utf-8").splitlines()
+        assert len(shard_lines) == shard["examples"] <= 10
+        lines.extend(shard_lines)
+    assert sorted(json.loads(line)["input"] for line in lines) == sorted(
+        example.input_text for example in _examples(50)
+    )
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_split_is_deterministic_and_stale_shards_are_removed(tmp_path) -> None:
+    """Test that re-exporting yields identical shards and drops old ones."""
+    with ShardedJSONLTrainingDataWriter(str(tmp_path), shard_size=5) as writer:
+        for example in _examples(30):
+            writer.write(example)
+    first = json.loads((tmp_path / "manifest.json").read_text())
+
+    with ShardedJSONLTrainingDataWriter(str(tmp_path), shard_size=50) as writer:
+        for example in _examples(30):
+            writer.write(example)
+    second = json.loads((tmp_path / "manifest.json").read_text())
+
+    assert (
+        first["splits"]["validation"]["examples"]
+        == second["splits"]["validation"]["examples"]
+    )
+    files = {path.name for path in tmp_path.glob("*.jsonl")}
+    assert files == {shard["file"] for shard in second["shards"]}
+
+
+def test_zstd_compression_round_trips(tmp_path) -> None:
+    """Test the optional zstd compression."""
+    zstandard = pytest.importorskip("zstandard")
+    with ShardedJSONLTrainingDataWriter(str(tmp_path), compression="zstd") as writer:
+        writer.write(TrainingExample(input_text="ação"))
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    data = (tmp_path / manifest["shards"][0]["file"]).read_bytes()
+    text = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    assert json.loads(text) == {"input": "ação"}
+
+
+def test_export_use_case_streams_repository(tmp_path) -> None:
+    """Test that only articles with content and summary are exported."""
+    news_repo = JSONNewsRepository(str(tmp_path / "articles.json"))
+    news_repo.save_batch(
+        [
+            NewsArticle(id="a", url="https://a.com/a", content="c", summary="s"),
+            NewsArticle(id="b", url="https://a.com/b", content="c"),
+        ]
+    )
+    use_case = ExportTrainingDataUseCase(news_repo, PrepareTrainingDataUseCase())
+
+    with ShardedJSONLTrainingDataWriter(str(tmp_path / "out")) as writer:
+        assert use_case.execute(writer) == 1
+
+
+def test_error_inside_block_keeps_previous_export(tmp_path) -> None:
+    """Test that a failed export leaves the previous shards and manifest alone."""
+    with ShardedJSONLTrainingDataWriter(str(tmp_path), shard_size=10) as writer:
+        for example in _examples(15):
+            writer.write(example)
+    previous = {path.name: path.read_bytes() for path in tmp_path.iterdir()}
+
+    with pytest.raises(RuntimeError):
+        with ShardedJSONLTrainingDataWriter(str(tmp_path), shard_size=4) as writer:
+            for example in _examples(30):
+                writer.write(example)
+            raise RuntimeError("summarization failed")
+
+    assert {path.name: path.read_bytes() for path in tmp_path.iterdir()} == previous
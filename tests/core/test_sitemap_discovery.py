@@ -0,0 +1,107 @@
+"""Unit tests for sitemap/RSS link discovery."""
+import gzip
+from datetime import date
+from unittest.mock import Mock
+
+from core.domain.repositories.abstracts.abstract_scraping_repository import (
+    AbstractPageFetchingRepository,
+    ContentUnavailableError,
+)
+from core.infrastructure.repositories.sitemap_discovery_repository import (
+    SitemapDiscoveryRepository,
+)
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://cnn.test/sitemap-2025-01.xml.gz</loc>
+    <lastmod>2025-01-31T10:00:00Z</lastmod></sitemap>
+  <sitemap><loc>https://cnn.test/sitemap-2024-12.xml.gz</loc>
+    <lastmod>2024-12-31T10:00:00Z</lastmod></sitemap>
+</sitemapindex>"""
+
+JANUARY = gzip.compress(
+    b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://cnn.test/2025/01/10/world/a</loc>
+    <news:news><news:publication_date>2025-01-10T08:00:00+00:00</news:publication_date>
+    </news:news></url>
+  <url><loc>https://cnn.test/2025/01/11/world/video/b</loc>
+    <lastmod>2025-01-11</lastmod></url>
+  <url><loc>https://cnn.test/2025/01/20/world/c</loc>
+    <lastmod>2025-01-20</lastmod></url>
+</urlset>"""
+)
+
+RSS = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>World</title>
+<item><title>A</title><link>https://cnn.test/2025/01/10/world/a</link>
+  <pubDate>Fri, 10 Jan 2025 08:00:00 GMT</pubDate></item>
+<item><title>D</title><link>https://cnn.test/2025/01/10/world/d</link>
+  <pubDate>Fri, 10 Jan 2025 09:00:00 GMT</pubDate></item>
+<item><title>Old</title><link>https://cnn.test/2024/12/01/world/old</link>
+  <pubDate>Sun, 01 Dec 2024 09:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+def _content_repo(documents: dict[str, bytes]) -> Mock:
+    """Fake content repository serving raw documents through fetch_page."""
+    content_repo = Mock(spec=AbstractPageFetchingRepository)
+
+    def fetch_page(url: str) -> bytes:
+        if url not in documents:
+            raise ContentUnavailableError(url)
+        return documents[url]
+
+    content_repo.fetch_page.side_effect = fetch_page
+    return content_repo
+
+
+def test_sitemap_index_is_followed_and_filtered_by_date() -> None:
+    """Test index recursion, gzip, namespaces, lastmod and video filtering."""
+    content_repo = _content_repo(
+        {
+            "https://cnn.test/sitemap.xml": INDEX,
+            "https://cnn.test/sitemap-2025-01.xml.gz": JANUARY,
+        }
+    )
+
+    links = SitemapDiscoveryRepository(
+        content_repo, chunk_size=16
+    ).scrape_news_links_in_range(
+        "https://cnn.test/sitemap.xml", date(2025, 1, 9), date(2025, 1, 12)
+    )
+
+    assert links == ["https://cnn.test/2025/01/10/world/a"]
+    # O sitemap de dezembro é descartado pelo lastmod, sem ser baixado
+    assert [call.args[0] for call in content_repo.fetch_page.call_args_list] == [
+        "https://cnn.test/sitemap.xml",
+        "https://cnn.test/sitemap-2025-01.xml.gz",
+    ]
+
+
+def test_rss_feed_is_filtered_by_pub_date() -> None:
+    """Test that feed items outside the range are dropped."""
+    repo = SitemapDiscoveryRepository(
+        _content_repo({"https://cnn.test/rss": RSS}), chunk_size=16
+    )
+
+    links = repo.scrape_news_links_in_range(
+        "https://cnn.test/rss", date(2025, 1, 1), date(2025, 1, 31)
+    )
+
+    assert links == [
+        "https://cnn.test/2025/01/10/world/a",
+        "https://cnn.test/2025/01/10/world/d",
+    ]
+
+
+def test_unavailable_feed_yields_no_links() -> None:
+    """Test that a fetch failure is reported as an empty discovery."""
+    repo = SitemapDiscoveryRepository(_content_repo({}))
+
+    assert (
+        repo.scrape_news_links_in_range(
+            "https://cnn.test/rss", date(2025, 1, 1), date(2025, 1, 31)
+        )
+        == []
+    )
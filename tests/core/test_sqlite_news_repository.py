@@ -0,0 +1,73 @@
+"""Unit tests for SQLiteNewsRepository."""
+from datetime import datetime
+
+from core.domain.entities.news_article import NewsArticle
+from core.infrastructure.repositories.sqlite_news_repository import (
+    SQLiteNewsRepository,
+)
+from tests.core.conftest import ArticleFactory
+
+
+def test_save_batch_upserts_and_round_trips(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test bulk upsert and that published_date survives a round trip."""
+    repo = SQLiteNewsRepository(str(tmp_path / "articles.db"))
+    repo.save_batch([make_article("a", day=1), make_article("b", day=2)])
+    repo.save_batch(
+        [
+            NewsArticle(
+                id="a",
+                url="https://edition.cnn.com/2025/01/01/world/a",
+                summary="resumo",
+                published_date=datetime(2025, 1, 1),
+            )
+        ]
+    )
+
+    article = repo.find_by_id("a")
+    assert article is not None
+    assert article.summary == "resumo"
+    assert article.published_date == datetime(2025, 1, 1)
+    assert len(repo.find_all()) == 2
+    assert repo.find_by_id("missing") is None
+
+
+def test_lazy_articles_keep_empty_and_missing_content(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that an empty content is not read back as a missing one."""
+    repo = SQLiteNewsRepository(str(tmp_path / "articles.db"))
+    articles = [make_article("a", ""), make_article("b", None), make_article("c")]
+    repo.save_batch(articles)
+
+    assert repo.find_all() == articles
+    assert [article.content for article in repo.find_all()] == ["", None, "Content"]
+
+
+def test_queries_by_date_range_and_source(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test the indexed date range and source queries."""
+    repo = SQLiteNewsRepository(str(tmp_path / "articles.db"), fetch_size=1)
+    repo.save_batch(
+        [
+            make_article("a", day=1),
+            make_article("b", day=2, source="Reuters"),
+            make_article("c", day=3),
+        ]
+    )
+
+    in_range = repo.find_by_date_range(datetime(2025, 1, 2), datetime(2025, 1, 4))
+
+    assert [article.id for article in in_range] == ["b", "c"]
+    assert [article.id for article in repo.find_by_source("CNN")] == ["a", "c"]
+
+
+def test_uses_wal_journal_mode(tmp_path) -> None:
+    """Test that the database is opened in WAL mode."""
+    repo = SQLiteNewsRepository(str(tmp_path / "articles.db"))
+
+    mode = repo._conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert mode == "wal"
@@ -0,0 +1,165 @@
+"""Unit tests for StreamingPipelineUseCase."""
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from core.application.use_cases.extract_news_content_usecase import (
+    ExtractNewsContentUseCase,
+)
+from core.application.use_cases.generate_summaries_usecase import (
+    GenerateSummariesUseCase,
+)
+from core.application.use_cases.prepare_training_data_usecase import (
+    PrepareTrainingDataUseCase,
+)
+from core.application.use_cases.scrape_news_links_usecase import ScrapeNewsLinksUseCase
+from core.application.use_cases.streaming_pipeline_usecase import (
+    StreamingPipelineUseCase,
+)
+from core.domain.entities.news_article import ArticleStage, NewsArticle
+from core.domain.entities.training_example import TrainingExample
+from core.domain.repositories.abstracts.abstract_training_data_writer import (
+    AbstractTrainingDataWriter,
+)
+
+
+class ListWriter(AbstractTrainingDataWriter):
+    """Collects written examples in memory."""
+
+    def __init__(self) -> None:
+        self.examples: list[TrainingExample] = []
+
+    def write(self, example: TrainingExample) -> None:
+        self.examples.append(example)
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        self.examples.clear()
+
+
+def _pipeline(
+    urls: list[str], extract_one: Mock, summarize_one: Mock, **kwargs: int
+) -> StreamingPipelineUseCase:
+    scrape_uc = Mock(spec=ScrapeNewsLinksUseCase)
+    scrape_uc.date_range.return_value = (None, None)
+    scrape_uc.execute_frontier.return_value = urls
+    extract_uc = Mock(spec=ExtractNewsContentUseCase)
+    extract_uc.extract_one.side_effect = extract_one
+    summaries_uc = Mock(spec=GenerateSummariesUseCase)
+    summaries_uc.summarize_one.side_effect = summarize_one
+    return StreamingPipelineUseCase(
+        scrape_uc, extract_uc, summaries_uc, PrepareTrainingDataUseCase(), **kwargs
+    )
+
+
+def _extract(url: str, resume: bool = False) -> NewsArticle:
+    return NewsArticle(id=url, url=url, content="conteúdo")
+
+
+def _summarize(article: NewsArticle) -> NewsArticle:
+    return NewsArticle(
+        id=article.id, url=article.url, content=article.content, summary="resumo"
+    )
+
+
+def test_streams_every_article_to_the_writer() -> None:
+    """Test that all items flow through all stages."""
+    urls = [f"https://edition.cnn.com/{index}" for index in range(20)]
+    writer = ListWriter()
+    pipeline = _pipeline(urls, Mock(side_effect=_extract), Mock(side_effect=_summarize))
+
+    result = pipeline.execute(["https://edition.cnn.com/world"], writer)
+
+    assert (result.links, result.extracted, result.summarized, result.examples) == (
+        20,
+        20,
+        20,
+        20,
+    )
+    assert len(writer.examples) == 20
+
+
+def test_summarization_starts_before_extraction_finishes() -> None:
+    """Test that stages overlap instead of running back to back."""
+    first_summary = threading.Event()
+    overlapped: list[bool] = []
+
+    def extract(url: str, resume: bool = False) -> NewsArticle:
+        if url.endswith("last"):
+            overlapped.append(first_summary.wait(timeout=2))
+        return _extract(url)
+
+    def summarize(article: NewsArticle) -> NewsArticle:
+        first_summary.set()
+        return _summarize(article)
+
+    pipeline = _pipeline(
+        ["https://a.com/first", "https://a.com/last"],
+        Mock(side_effect=extract),
+        Mock(side_effect=summarize),
+        extract_workers=1,
+    )
+
+    pipeline.execute(["https://a.com"], ListWriter())
+
+    assert overlapped == [True]
+
+
+def test_stage_failure_stops_pipeline_and_is_raised() -> None:
+    """Test that an exception in a worker does not deadlock the pipeline."""
+    urls = [f"https://a.com/{index}" for index in range(100)]
+    summarize = Mock(side_effect=RuntimeError("boom"))
+    pipeline = _pipeline(urls, Mock(side_effect=_extract), summarize, queue_size=1)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.execute(["https://a.com"], ListWriter())
+
+
+def test_until_stops_after_the_requested_stage() -> None:
+    """Test that until=EXTRACTED extracts without summarizing or writing."""
+    summarize = Mock(side_effect=_summarize)
+    writer = ListWriter()
+    progress: list[tuple[str, int]] = []
+    pipeline = _pipeline(
+        ["https://a.com/1", "https://a.com/2"], Mock(side_effect=_extract), summarize
+    )
+
+    result = pipeline.execute(
+        ["https://a.com"],
+        writer,
+        until=ArticleStage.EXTRACTED,
+        on_progress=lambda field, value: progress.append((field, value)),
+    )
+
+    assert result.extracted == 2
+    summarize.assert_not_called()
+    assert writer.examples == []
+    assert ("links", 2) in progress
+    assert ("extracted", 2) in progress
+
+
+def test_cancel_returns_partial_result() -> None:
+    """Test that a cancelled run stops consuming and reports cancellation."""
+    cancel = threading.Event()
+
+    def extract(url: str, resume: bool = False) -> NewsArticle:
+        cancel.set()
+        return _extract(url)
+
+    urls = [f"https://a.com/{index}" for index in range(50)]
+    pipeline = _pipeline(
+        urls,
+        Mock(side_effect=extract),
+        Mock(side_effect=_summarize),
+        extract_workers=1,
+        queue_size=1,
+    )
+
+    result = pipeline.execute(["https://a.com"], ListWriter(), cancel=cancel)
+
+    assert result.cancelled
+    assert result.extracted < len(urls)
+
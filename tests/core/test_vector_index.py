@@ -0,0 +1,192 @@
+"""Tests for the embedding encoders and the memory-mapped vector index."""
+import threading
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from core.domain.entities.news_article import NewsArticle  # noqa: E402
+from core.infrastructure.ai.hashing_encoder import HashingEncoder  # noqa: E402
+from core.infrastructure.ai.openai_embedding_encoder import (  # noqa: E402
+    OpenAIEmbeddingEncoder,
+)
+from core.infrastructure.repositories.memmap_vector_index import (  # noqa: E402
+    MemmapVectorIndex,
+)
+from tests.core.conftest import ArticleFactory  # noqa: E402
+
+TOPICS = [
+    "earthquake shakes coastal towns",
+    "central bank raises interest rates",
+    "football team wins championship final",
+    "new vaccine approved by regulators",
+]
+
+
+class CountingEncoder(HashingEncoder):
+    """Hashing encoder that records every batch it encodes."""
+
+    def __init__(self, dimension: int = 64):
+        super().__init__(dimension)
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        return super().encode(texts)
+
+
+def _corpus(make_article: ArticleFactory, size: int) -> list[NewsArticle]:
+    return [
+        make_article(
+            f"id-{index:05d}", None, f"{TOPICS[index % len(TOPICS)]} report {index}"
+        )
+        for index in range(size)
+    ]
+
+
+def test_hashing_encoder_is_deterministic_and_normalized() -> None:
+    """Test that equal texts give equal unit vectors and related texts are closer."""
+    encoder = HashingEncoder(dimension=128)
+    first, again, related, other = encoder.encode(
+        [TOPICS[0], TOPICS[0], "earthquake hits coastal towns", TOPICS[1]]
+    )
+
+    assert first == again
+    assert sum(value * value for value in first) == pytest.approx(1.0)
+
+    def dot(a: list[float], b: list[float]) -> float:
+        return sum(x * y for x, y in zip(a, b, strict=True))
+
+    assert dot(first, related) > dot(first, other)
+
+
+def test_only_new_or_changed_articles_are_encoded(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test batching and that unchanged summaries are not re-encoded."""
+    encoder = CountingEncoder()
+    index = MemmapVectorIndex(str(tmp_path), encoder, encode_batch_size=2)
+
+    assert index.add_batch(_corpus(make_article, 5)) == 5
+    assert [len(batch) for batch in encoder.batches] == [2, 2, 1]
+
+    encoder.batches.clear()
+    changed = make_article("id-00001", None, "volcano erupts near the airport")
+    added = make_article("new", None, TOPICS[3])
+    assert index.add_batch([*_corpus(make_article, 5), changed, added]) == 2
+    assert index.document_count == 6
+    assert index.search("volcano erupts airport", k=1)[0].article_id == "id-00001"
+
+
+def test_search_survives_reopen_and_growth(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that vectors beyond the initial capacity are persisted."""
+    index = MemmapVectorIndex(str(tmp_path), HashingEncoder(dimension=32))
+    index.add_batch(_corpus(make_article, 1500))
+    index.close()
+
+    reopened = MemmapVectorIndex(str(tmp_path), HashingEncoder(dimension=32))
+    hits = reopened.search(f"{TOPICS[2]} report 1498", k=3)
+
+    assert reopened.document_count == 1500
+    assert hits[0].article_id == "id-01498"
+    assert hits[0].score >= hits[1].score >= hits[2].score
+
+
+def test_ivf_probes_clusters_and_is_reloaded(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that an IVF search with every cluster probed matches brute force."""
+    encoder = HashingEncoder(dimension=64)
+    index = MemmapVectorIndex(str(tmp_path), encoder, nprobe=4)
+    index.add_batch(_corpus(make_article, 400))
+    brute_force = index.search(TOPICS[1], k=5)
+
+    index.train_ivf(nlist=4)
+    index.add_batch([make_article("late", None, TOPICS[1])])
+    index.close()
+    reopened = MemmapVectorIndex(str(tmp_path), encoder, nprobe=4)
+
+    assert reopened.search(TOPICS[1], k=5)[0].article_id == "late"
+    assert {hit.article_id for hit in reopened.search(TOPICS[1], k=6)} == {
+        "late",
+        *(hit.article_id for hit in brute_force),
+    }
+
+
+def test_ivf_reads_only_the_probed_lists(
+    tmp_path, make_article: ArticleFactory
+) -> None:
+    """Test that a probe reads one list and moved rows are returned once."""
+    index = MemmapVectorIndex(str(tmp_path), HashingEncoder(dimension=64), nprobe=1)
+    index.add_batch(_corpus(make_article, 400))
+    index.train_ivf(nlist=4)
+    for summary in (TOPICS[1], TOPICS[2], TOPICS[1]):
+        index.add_batch([make_article("id-00000", None, summary)])
+
+    hits = index.search(TOPICS[1], k=400)
+    ids = [hit.article_id for hit in hits]
+
+    assert ids.count("id-00000") == 1
+    assert len(ids) == len(set(ids)) < 400
+    assert {index._assignments[index._rows[article_id][0]] for article_id in ids} == {
+        index._assignments[index._rows["id-00000"][0]]
+    }
+
+
+def test_search_encodes_the_query_outside_the_lock(tmp_path) -> None:
+    """Test that a slow query encoding does not block other index users."""
+    encoder = CountingEncoder()
+    index = MemmapVectorIndex(str(tmp_path), encoder)
+    index.add_batch([NewsArticle(id="a", url="https://x", summary=TOPICS[0])])
+    lock_free: list[bool] = []
+
+    def try_lock() -> None:
+        acquired = index._lock.acquire(blocking=False)
+        if acquired:
+            index._lock.release()
+        lock_free.append(acquired)
+
+    def encode(texts: list[str]) -> list[list[float]]:
+        probe = threading.Thread(target=try_lock)
+        probe.start()
+        probe.join()
+        return HashingEncoder.encode(encoder, texts)
+
+    encoder.encode = encode  # type: ignore[method-assign]
+
+    assert index.search(TOPICS[0], k=1)[0].article_id == "a"
+    assert lock_free == [True]
+
+
+def test_rejects_an_index_built_with_another_encoder(tmp_path) -> None:
+    """Test that vectors from different encoders are never mixed."""
+    MemmapVectorIndex(str(tmp_path), HashingEncoder(dimension=32)).close()
+
+    with pytest.raises(ValueError, match="encoder"):
+        MemmapVectorIndex(str(tmp_path), HashingEncoder(dimension=64))
+
+
+def test_openai_encoder_batches_requests_and_restores_order() -> None:
+    """Test request batching and ordering of the API response by index."""
+    encoder = OpenAIEmbeddingEncoder("test-key", dimension=2, batch_size=2)
+
+    def create(**kwargs: object) -> SimpleNamespace:
+        inputs = kwargs["input"]
+        assert isinstance(inputs, list)
+        data = [
+            SimpleNamespace(index=index, embedding=[float(len(text)), 0.0])
+            for index, text in enumerate(inputs)
+        ]
+        return SimpleNamespace(data=data[::-1], usage=SimpleNamespace(prompt_tokens=3))
+
+    encoder._client = Mock()
+    encoder._client.embeddings.create.side_effect = create
+
+    vectors = encoder.encode(["a", "bb", "ccc"])
+
+    assert vectors == [[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]]
+    assert encoder._client.embeddings.create.call_count == 2
@@ -0,0 +1,106 @@
+"""Tests for the paginated and NDJSON article/training example endpoints."""
+import json
+from collections.abc import Iterator
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from core.domain.entities.news_article import NewsArticle
+from core.infrastructure.repositories.sqlite_news_repository import (
+    SQLiteNewsRepository,
+)
+from http_app.main import app, get_news_repository
+
+
+@pytest.fixture
+def client(tmp_path) -> Iterator[TestClient]:
+    repo = SQLiteNewsRepository(str(tmp_path / "articles.db"))
+    repo.save_batch(
+        [
+            NewsArticle(
+                id=f"article-{index}",
+                url=f"https://edition.cnn.com/2025/01/0{index}/world/a{index}",
+                content=f"Content {index}",
+                summary=f"Summary {index}" if index % 2 else None,
+                published_date=datetime(2025, 1, index),
+            )
+            for index in range(1, 6)
+        ]
+    )
+    app.dependency_overrides[get_news_repository] = lambda: repo
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_articles_are_paginated_with_cursor(client: TestClient) -> None:
+    """Test that following next_cursor walks all articles once."""
+    ids: list[str] = []
+    params: dict[str, str | int] = {"limit": 2, "fields": "id,url"}
+    while True:
+        body = client.get("/articles", params=params).json()
+        assert all(set(item) == {"id", "url"} for item in body["items"])
+        ids.extend(item["id"] for item in body["items"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert ids == [f"article-{index}" for index in range(1, 6)]
+
+
+def test_articles_filter_by_date(client: TestClient) -> None:
+    """Test the published_from/published_to query parameters."""
+    response = client.get(
+        "/articles",
+        params={"published_from": "2025-01-02", "published_to": "2025-01-04"},
+    )
+
+    assert [item["id"] for item in response.json()["items"]] == [
+        "article-2",
+        "article-3",
+    ]
+
+
+def test_articles_filter_accepts_utc_dates(client: TestClient) -> None:
+    """Test that a tz-aware filter compares with the stored naive UTC dates."""
+    response = client.get(
+        "/articles", params={"published_from": "2025-01-04T00:00:00Z"}
+    )
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == [
+        "article-4",
+        "article-5",
+    ]
+
+
+def test_invalid_cursor_and_fields_are_rejected(client: TestClient) -> None:
+    """Test that malformed cursors and unknown fields return 400."""
+    assert client.get("/articles", params={"cursor": "%%%"}).status_code == 400
+    assert client.get("/articles", params={"fields": "secret"}).status_code == 400
+
+
+def test_articles_export_streams_ndjson(client: TestClient) -> None:
+    """Test that the export returns one JSON object per line."""
+    response = client.get("/articles/export", params={"fields": "id"})
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": f"article-{index}"} for index in range(1, 6)
+    ]
+
+
+def test_training_examples_skip_articles_without_summary(client: TestClient) -> None:
+    """Test pagination and export of training examples."""
+    first = client.get("/training-examples", params={"limit": 2}).json()
+    second = client.get(
+        "/training-examples", params={"cursor": first["next_cursor"]}
+    ).json()
+    exported = client.get("/training-examples/export").text.splitlines()
+
+    assert [item["id"] for item in first["items"]] == ["article-1", "article-3"]
+    assert [item["id"] for item in second["items"]] == ["article-5"]
+    assert second["next_cursor"] is None
+    assert len(exported) == 3
+    assert "Summary 5" in json.loads(exported[-1])["input_text"]
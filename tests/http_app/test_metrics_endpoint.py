@@ -0,0 +1,19 @@
+"""Tests for the Prometheus metrics endpoint."""
+from fastapi.testclient import TestClient
+
+from core.application.services.metrics import REGISTRY
+from http_app.main import app
+
+
+def test_metrics_endpoint_exports_registry() -> None:
+    """Test that /metrics serves the process registry as Prometheus text."""
+    REGISTRY.inc("pipeline_errors_total", stage="extract", error="TimeoutError")
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'pipeline_errors_total{error="TimeoutError",stage="extract"}'
+        in response.text
+    )
@@ -0,0 +1,94 @@
+"""Tests for the pipeline job endpoints."""
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+import http_app.main
+from core.application.services.job_manager import Job, JobManager
+from http_app.main import app
+
+release = threading.Event()
+
+
+def _runner(job: Job, report: Callable[[str, int], None]) -> dict[str, Any]:
+    """Report progress, then wait until released or cancelled."""
+    report("links", 3)
+    while not (release.is_set() or job.cancel_event.is_set()):
+        time.sleep(0.01)
+    report("extracted", 3)
+    return {"examples": 3, "sections": job.params["sections"]}
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
+    release.clear()
+    manager = JobManager(_runner, max_workers=1)
+    monkeypatch.setattr(http_app.main, "job_manager", manager)
+    monkeypatch.setattr(http_app.main, "EVENT_POLL_INTERVAL", 0.01)
+    yield TestClient(app)
+    release.set()
+    manager.shutdown()
+
+
+def _wait_for(client: TestClient, job_id: str, status: str) -> dict[str, Any]:
+    for _ in range(200):
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] == status:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job did not reach {status}: {job}")
+
+
+def test_job_runs_in_background_and_reports_progress(client: TestClient) -> None:
+    """Test submission, per-stage progress and the final result."""
+    response = client.post("/jobs", json={"sections": ["us"], "until": "extracted"})
+
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+    running = _wait_for(client, job_id, "running")
+    assert running["progress"] == {"links": 3}
+    assert running["params"]["until"] == "extracted"
+
+    release.set()
+    done = _wait_for(client, job_id, "succeeded")
+    assert done["progress"] == {"links": 3, "extracted": 3}
+    assert done["result"] == {"examples": 3, "sections": ["us"]}
+
+
+def test_cancel_running_and_queued_jobs(client: TestClient) -> None:
+    """Test that running jobs observe cancellation and queued ones never start."""
+    running_id = client.post("/jobs", json={}).json()["id"]
+    queued_id = client.post("/jobs", json={}).json()["id"]
+    _wait_for(client, running_id, "running")
+
+    assert client.post(f"/jobs/{queued_id}/cancel").status_code == 202
+    assert client.post(f"/jobs/{running_id}/cancel").status_code == 202
+
+    assert _wait_for(client, queued_id, "cancelled")["started_at"] is None
+    _wait_for(client, running_id, "cancelled")
+    assert client.post(f"/jobs/{running_id}/cancel").status_code == 409
+    assert client.get("/jobs/unknown").status_code == 404
+
+
+def test_event_stream_ends_with_done(client: TestClient) -> None:
+    """Test that the SSE stream emits progress and a final done event."""
+    job_id = client.post("/jobs", json={}).json()["id"]
+    _wait_for(client, job_id, "running")
+    threading.Timer(0.05, release.set).start()
+
+    with client.stream("GET", f"/jobs/{job_id}/events") as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.removeprefix("event: ")
+            for line in response.iter_lines()
+            if line.startswith("event: ")
+        ]
+    last = client.get(f"/jobs/{job_id}").json()
+
+    assert events[0] == "progress"
+    assert events[-1] == "done"
+    assert last["result"] == {"examples": 3, "sections": ["world"]}
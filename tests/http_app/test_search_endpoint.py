@@ -0,0 +1,78 @@
+"""Tests for the article search endpoint."""
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+import http_app.main
+from core.application.use_cases.search_articles_usecase import SearchArticlesUseCase
+from core.domain.entities.news_article import NewsArticle
+from core.infrastructure.repositories.indexing_news_repository import (
+    IndexingNewsRepository,
+)
+from core.infrastructure.repositories.sqlite_bm25_index import SQLiteBM25Index
+from core.infrastructure.repositories.sqlite_news_repository import (
+    SQLiteNewsRepository,
+)
+from http_app.main import app, get_search_use_case
+from http_app.pipeline_jobs import PipelineJobRunner
+
+
+@pytest.fixture
+def client(tmp_path) -> Iterator[TestClient]:
+    index = SQLiteBM25Index(str(tmp_path / "index.db"))
+    repo = IndexingNewsRepository(
+        SQLiteNewsRepository(str(tmp_path / "articles.db")), index
+    )
+    repo.save_batch(
+        [
+            NewsArticle(
+                id="a",
+                url="https://edition.cnn.com/2025/01/01/world/a",
+                title="Wildfires spread",
+                content="Wildfires spread across the hills.",
+            ),
+            NewsArticle(
+                id="b",
+                url="https://edition.cnn.com/2025/01/01/world/b",
+                title="Central bank",
+                content="The central bank holds rates.",
+            ),
+        ]
+    )
+    app.dependency_overrides[get_search_use_case] = lambda: SearchArticlesUseCase(
+        index, repo
+    )
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_search_returns_ranked_articles(client: TestClient) -> None:
+    """Test that matching articles are returned with their score."""
+    response = client.get("/search", params={"q": "wildfires", "k": 5})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body] == ["a"]
+    assert body[0]["title"] == "Wildfires spread"
+    assert body[0]["score"] > 0
+
+
+def test_search_requires_a_query(client: TestClient) -> None:
+    """Test that an empty query is rejected."""
+    assert client.get("/search", params={"q": ""}).status_code == 422
+
+
+def test_semantic_search_without_encoder_is_unavailable(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that semantic mode returns 503 when no encoder can be configured."""
+    monkeypatch.setattr(
+        http_app.main,
+        "pipeline_runner",
+        PipelineJobRunner(str(tmp_path), api_key=lambda: None),
+    )
+
+    response = TestClient(app).get("/search", params={"q": "x", "mode": "semantic"})
+
+    assert response.status_code == 503